@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Simulated day of live-scores polling: adaptive scheduler vs fixed intervals.
+
+Builds a synthetic slate (a morning Premier League window, afternoon and
+evening MLB slates with one rain delay, an evening WNBA slate, and leagues
+with nothing on), then replays 06:00-24:00 on a fake clock. Each poll
+costs one /events request per league fetched, one scoreboard request for
+MLB when it has live games, and one summary per game whose details are
+fetched.
+
+Usage:
+    python TheBench/adaptive_polling_simulation.py [--base 60] [--tick 5]
+"""
+
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.poll_scheduler import PollScheduler, classify_game_state
+
+LEAGUES = ["NFL", "NBA", "MLB", "NHL", "WNBA", "NCAAF", "NCAAM", "Soccer"]
+DAY_START = 6 * 3600
+DAY_END = 24 * 3600
+
+
+def _ordinal(n):
+    return f"{n}{'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')}"
+
+
+def mlb_status(minute, delay_at=None, delay_minutes=0):
+    """Nine innings over ~180 minutes: 9 minutes per half inning, 1 minute breaks"""
+    if delay_at is not None and delay_at <= minute < delay_at + delay_minutes:
+        return "Rain Delay"
+    if delay_at is not None and minute >= delay_at + delay_minutes:
+        minute -= delay_minutes
+    if minute >= 180:
+        return None
+    inning = int(minute // 20) + 1
+    within = minute % 20
+    if within < 9:
+        return f"Top {_ordinal(inning)}"
+    if within < 10:
+        return f"Mid {_ordinal(inning)}"
+    if within < 19:
+        return f"Bot {_ordinal(inning)}"
+    return f"End {_ordinal(inning)}"
+
+
+def basketball_status(minute):
+    """Four 10 minute quarters over ~25 wall minutes each, 15 minute halftime"""
+    if 50 <= minute < 65:
+        return "Halftime"
+    if minute >= 65:
+        minute -= 15
+    if minute >= 100:
+        return None
+    quarter = int(minute // 25) + 1
+    clock = 600 - (minute % 25) / 25 * 600
+    return f"{int(clock // 60)}:{int(clock % 60):02d} - {_ordinal(quarter)}"
+
+
+def soccer_status(minute):
+    if 45 <= minute < 60:
+        return "Halftime"
+    if minute >= 60:
+        minute -= 15
+    if minute >= 93:
+        return None
+    return f"{int(minute) + 1}'"
+
+
+def build_slate():
+    slate = []
+    for i in range(3):
+        slate.append(("Soccer", f"epl{i}", 7.5 * 3600, soccer_status, {}))
+    for i in range(5):
+        slate.append(("MLB", f"mlb_day{i}", 13 * 3600 + i * 600, mlb_status, {}))
+    for i in range(10):
+        extra = {"delay_at": 85, "delay_minutes": 45} if i == 0 else {}
+        slate.append(("MLB", f"mlb_night{i}", 19 * 3600 + (i % 4) * 1800, mlb_status, extra))
+    for i in range(4):
+        slate.append(("WNBA", f"wnba{i}", 19.5 * 3600 + i * 1800, basketball_status, {}))
+    return slate
+
+
+def live_games(slate, now):
+    games = {}
+    for league, game_id, start, status_func, extra in slate:
+        if now < start:
+            continue
+        status = status_func((now - start) / 60, **extra)
+        if status:
+            games.setdefault(league, []).append({"id": game_id, "league": league, "status": status})
+    return games
+
+
+def simulate_fixed(slate, interval):
+    requests = 0
+    for now in range(DAY_START, DAY_END, interval):
+        games = live_games(slate, now)
+        requests += len(LEAGUES)
+        requests += sum(len(g) for g in games.values())
+        requests += 1 if games.get("MLB") else 0
+    return requests
+
+
+def simulate_adaptive(slate, base, tick, monitored):
+    clock = [float(DAY_START)]
+    scheduler = PollScheduler(base_interval=base, clock=lambda: clock[0])
+    scheduler.set_monitored(monitored)
+    requests = 0
+    by_state = {}
+    for now in range(DAY_START, DAY_END, tick):
+        clock[0] = float(now)
+        due = scheduler.due_leagues(LEAGUES)
+        if not due:
+            continue
+        games = live_games(slate, now)
+        for league in due:
+            league_games = games.get(league, [])
+            requests += 1
+            if league == "MLB" and league_games:
+                requests += 1  # scoreboard index for the situation
+            for game in league_games:
+                if scheduler.needs_details(game):
+                    requests += 1
+                    state = classify_game_state(game)
+                    by_state[state] = by_state.get(state, 0) + 1
+            scheduler.record_league(league, league_games)
+    return requests, by_state, scheduler.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaptive vs fixed live-score polling over a simulated day")
+    parser.add_argument("--base", type=float, default=60.0, help="Adaptive base interval in seconds")
+    parser.add_argument("--tick", type=int, default=5, help="Adaptive scheduler tick in seconds")
+    args = parser.parse_args()
+
+    slate = build_slate()
+    monitored = {"mlb_night0", "wnba1"}
+    print(f"=== Simulated day 06:00-24:00, {len(slate)} games, {len(LEAGUES)} leagues ===")
+    fixed = {}
+    for interval in (30, 60, 120):
+        fixed[interval] = simulate_fixed(slate, interval)
+        print(f"  fixed {interval:>3}s            {fixed[interval]:>7} requests")
+
+    adaptive, by_state, stats = simulate_adaptive(slate, args.base, args.tick, monitored)
+    print(f"  adaptive (base {args.base:.0f}s)   {adaptive:>7} requests")
+    for interval, count in fixed.items():
+        print(f"    saved vs fixed {interval:>3}s: {count - adaptive:>7} ({(count - adaptive) / count:.0%})")
+    print(f"  summaries by game state: {dict(sorted(by_state.items()))}")
+    print(f"  scheduler counters: league_polls={stats['league_polls']} summary_polls={stats['summary_polls']} "
+          f"summaries_skipped={stats['summaries_skipped']} saved_vs_fixed={stats['saved_vs_fixed']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
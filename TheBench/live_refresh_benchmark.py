@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Requests per live-scores refresh, before and after indexing the MLB scoreboard.
+
+Builds a replay fixture set for a slate of live MLB games from the captures
+in TheBench/api_exploration (events list, today's scoreboard, one summary
+per game) and runs one refresh cycle two ways:
+
+  per-game   - leagues and games walked serially, every MLB game resolving
+               its situation by fetching the scoreboard itself (the previous
+               get_live_scores_all_sports / extract_recent_play behaviour)
+  indexed    - get_live_scores_all_sports: concurrent fan-out, scoreboard
+               fetched once and each game handed its event
+  tiered     - iter_live_scores_all_sports(tiered=True): rows built from the
+               scoreboard situation, summaries only for monitored games
+               (--monitored of them)
+
+For each it reports http_client.get calls, requests that reached the
+transport with and without the in-memory response cache, bytes received
+and wall time.
+
+Usage:
+    python TheBench/live_refresh_benchmark.py [--latency-ms N] [--monitored N]
+"""
+
+import argparse
+import copy
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+CAPTURE_DIR = os.path.join(ROOT_DIR, "TheBench", "api_exploration")
+SLATE = "scoreboard_20250808.json"
+
+
+def seed_fixtures(fixture_dir):
+    """Write events, scoreboard and summary fixtures for a fully live MLB slate"""
+    import espn_api
+    from services.replay import FixtureStore
+
+    store = FixtureStore(fixture_dir)
+    with open(os.path.join(CAPTURE_DIR, SLATE), "r", encoding="utf-8") as f:
+        scoreboard = json.load(f)
+    for event in scoreboard.get("events", []):
+        # The capture is pre-game; give every game a live situation
+        event["competitions"][0]["situation"] = {
+            "balls": 1, "strikes": 2, "outs": 1, "onFirst": True, "onSecond": False, "onThird": False,
+            "batter": {"athlete": {"displayName": "Batter"}},
+            "lastPlay": {"text": "Single to left field."},
+        }
+
+    summaries = []
+    for path in sorted(glob.glob(os.path.join(CAPTURE_DIR, "game_details_*.json"))):
+        with open(path, "r", encoding="utf-8") as f:
+            summaries.append(json.load(f))
+
+    events = []
+    for i, event in enumerate(scoreboard.get("events", [])):
+        competitors = event.get("competitions", [{}])[0].get("competitors", [])
+        events.append({
+            "id": event["id"],
+            "name": event.get("name", ""),
+            "fullStatus": {"type": {"state": "in", "description": "In Progress", "shortDetail": "Top 5th"}},
+            "competitors": [{"displayName": c.get("team", {}).get("displayName", ""), "score": c.get("score", "0")}
+                            for c in competitors],
+        })
+        # Reuse the captured summaries round robin, relabelled as this game
+        summary = copy.deepcopy(summaries[i % len(summaries)])
+        summary.setdefault("header", {})["id"] = event["id"]
+        store.save_json(espn_api._game_details_url("MLB", event["id"]), summary)
+
+    store.save_json(espn_api._live_scoreboard_url("MLB"), scoreboard)
+    for league_key in espn_api.LEAGUES:
+        store.save_json(espn_api._live_events_url(league_key), {"events": events if league_key == "MLB" else []})
+    return len(events)
+
+
+def per_game_refresh():
+    """The live refresh as it was: each MLB game fetches the scoreboard for its own situation"""
+    import espn_api
+    from services import http_client, json_codec
+
+    live_games = []
+    for league_key in espn_api.LEAGUES:
+        resp = http_client.get(espn_api._live_events_url(league_key))
+        if resp.status_code != 200:
+            continue
+        for game in espn_api._parse_live_events(json_codec.response_json(resp), league_key):
+            details = espn_api.get_game_details(league_key, game["id"], sections=json_codec.LIVE_SECTIONS)
+            game["recent_play"] = espn_api.extract_recent_play(details, league_key) or game["recent_play"]
+            live_games.append(game)
+    return live_games
+
+
+def indexed_refresh():
+    import espn_api
+    return espn_api.get_live_scores_all_sports()
+
+
+def tiered_refresh(monitored):
+    import espn_api
+
+    live_games = []
+    seen = []
+
+    def needs_details(game):
+        seen.append(game["id"])
+        return len(seen) <= monitored
+    for _, games in espn_api.iter_live_scores_all_sports(needs_details=needs_details, tiered=True):
+        live_games.extend(games or [])
+    return live_games
+
+
+def measure(label, refresh, use_memory_cache):
+    from services import http_client
+
+    client = http_client.get_client()
+    memory = client.memory
+    if not use_memory_cache:
+        client.memory = None
+    elif memory is not None:
+        memory.clear()
+
+    sent = [0]
+    received = [0]
+    transport = client.send
+
+    def counting_send(url, **kwargs):
+        sent[0] += 1
+        resp = transport(url, **kwargs)
+        received[0] += len(resp.content or b"")
+        return resp
+
+    client.send = counting_send
+    gets_before = client.flights.stats()["calls"]
+    start = time.perf_counter()
+    try:
+        games = refresh()
+    finally:
+        client.send = transport
+        client.memory = memory
+    elapsed = (time.perf_counter() - start) * 1000
+    gets = client.flights.stats()["calls"] - gets_before
+    cache_label = "memory cache" if use_memory_cache else "no cache"
+    print(f"  {label:<10} {cache_label:<13} {len(games):>3} games  {gets:>4} get() calls  "
+          f"{sent[0]:>4} sent  {received[0] / 1024:8.0f} KiB  {elapsed:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requests per live scores refresh")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Injected latency per replayed request")
+    parser.add_argument("--monitored", type=int, default=1, help="Games that get a summary in tiered mode")
+    args = parser.parse_args()
+
+    fixture_dir = tempfile.mkdtemp(prefix="scores_live_fixtures_")
+    os.environ["SCORES_HTTP_MODE"] = "replay"
+    os.environ["SCORES_FIXTURE_DIR"] = fixture_dir
+    os.environ["SCORES_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+
+    live = seed_fixtures(fixture_dir)
+
+    from services import http_client
+    # Back-to-back refreshes would otherwise be throttled by the per-host rate limits
+    http_client.get_client().scheduler = None
+
+    print(f"\n=== One live refresh, {live} live MLB games, {args.latency_ms:.0f} ms per request ===")
+    for use_memory_cache in (False, True):
+        measure("per-game", per_game_refresh, use_memory_cache)
+        measure("indexed", indexed_refresh, use_memory_cache)
+        measure("tiered", lambda: tiered_refresh(args.monitored), use_memory_cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Play-by-play tree build time on the captured MLB games.
+
+For every game_details_*.json in TheBench/api_exploration, builds the plays
+tree the way the game details dialog does and times:
+
+  nodes   - GameDetailsView._build_baseball_tree (innings and half innings only)
+  lazy    - nodes plus a PlaysTreeView with its default rows fetched
+  eager   - every level loaded and turned into QTreeWidgetItems with innings
+            and half innings expanded (the previous QTreeWidget behaviour)
+
+It also reports how many rows each approach creates. Runs with the Qt
+offscreen platform, so no window is shown.
+
+Usage:
+    python TheBench/plays_tree_benchmark.py [--runs N]
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+CAPTURE_DIR = os.path.join(ROOT_DIR, "TheBench", "api_exploration")
+
+
+def load_games():
+    games = []
+    for path in sorted(glob.glob(os.path.join(CAPTURE_DIR, "game_details_*.json"))):
+        with open(path, "r", encoding="utf-8") as f:
+            plays = json.load(f).get("plays") or []
+        if plays:
+            games.append((os.path.basename(path)[len("game_details_"):-len(".json")], plays))
+    return games
+
+
+def eager_tree(root, tree_widget_cls, item_cls):
+    """QTreeWidget holding every node, expanded like the old builder"""
+    tree = tree_widget_cls()
+    rows = 0
+
+    def add(node, parent_item, depth):
+        nonlocal rows
+        for child in node.children():
+            item = item_cls([child.label])
+            rows += 1
+            if parent_item is None:
+                tree.addTopLevelItem(item)
+            else:
+                parent_item.addChild(item)
+            add(child, item, depth + 1)
+            item.setExpanded(depth < 2)
+
+    add(root, None, 1)
+    return tree, rows
+
+
+def visible_rows(model, parent=None):
+    from PyQt6.QtCore import QModelIndex
+
+    parent = parent if parent is not None else QModelIndex()
+    count = model.rowCount(parent)
+    return count + sum(visible_rows(model, model.index(row, 0, parent)) for row in range(count))
+
+
+def time_it(func, runs):
+    samples = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plays tree build benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication, QTreeWidget, QTreeWidgetItem
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    import scores
+    from plays_tree import PlaysTreeView
+
+    class BenchDetailsView(scores.GameDetailsView):
+        # Skip loading game details from the network
+        def setup_ui(self):
+            pass
+
+    view = BenchDetailsView(None, "MLB", None)
+    games = load_games()
+    if not games:
+        print(f"No game_details_*.json captures with plays in {CAPTURE_DIR}")
+        return 1
+
+    print(f"{'game':<12}{'plays':>7}{'nodes ms':>10}{'lazy ms':>10}{'rows':>7}{'eager ms':>10}{'rows':>7}")
+    for game_id, plays in games:
+        nodes_ms, _ = time_it(lambda: view._build_baseball_tree(plays), args.runs)
+
+        def lazy():
+            tree = PlaysTreeView()
+            tree.set_root(view._build_baseball_tree(plays))
+            return tree
+
+        lazy_ms, lazy_view = time_it(lazy, args.runs)
+        eager_ms, (_, eager_rows) = time_it(
+            lambda: eager_tree(view._build_baseball_tree(plays), QTreeWidget, QTreeWidgetItem), args.runs)
+        print(f"{game_id:<12}{len(plays):>7}{nodes_ms:>10.2f}{lazy_ms:>10.2f}{visible_rows(lazy_view.model()):>7}"
+              f"{eager_ms:>10.2f}{eager_rows:>7}")
+
+    app.processEvents()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
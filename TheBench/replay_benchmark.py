@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of the fetch + parse paths using the replay transport.
+
+Seeds a fixture directory from the captures in TheBench/api_exploration
+(or uses an existing directory recorded with SCORES_HTTP_MODE=record) and
+times the espn_api entry points and parsers with no network access.
+
+Usage:
+    python TheBench/replay_benchmark.py [--fixtures DIR] [--latency-ms N] [--runs N]
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+CAPTURE_DIR = os.path.join(ROOT_DIR, "TheBench", "api_exploration")
+
+
+def seed_fixtures(fixture_dir):
+    """Convert the api_exploration captures into replay fixtures"""
+    import espn_api
+    from services.replay import FixtureStore
+
+    store = FixtureStore(fixture_dir)
+    dates = []
+    game_ids = []
+
+    for path in sorted(glob.glob(os.path.join(CAPTURE_DIR, "scoreboard_2*.json"))):
+        date_str = os.path.basename(path)[len("scoreboard_"):-len(".json")]
+        with open(path, "r", encoding="utf-8") as f:
+            store.save_json(espn_api._scoreboard_url("MLB", datetime.strptime(date_str, "%Y%m%d")), json.load(f))
+        dates.append(date_str)
+
+    for path in sorted(glob.glob(os.path.join(CAPTURE_DIR, "game_details_*.json"))):
+        game_id = os.path.basename(path)[len("game_details_"):-len(".json")]
+        with open(path, "r", encoding="utf-8") as f:
+            store.save_json(espn_api._game_details_url("MLB", game_id), json.load(f))
+        game_ids.append(game_id)
+
+    print(f"Seeded {len(dates)} scoreboards and {len(game_ids)} game summaries into {fixture_dir}")
+    return dates, game_ids
+
+
+def time_it(label, func, runs):
+    from services.cache import get_cache
+
+    samples = []
+    result = None
+    for _ in range(runs):
+        # Measure the full path every run, not the in-memory cache
+        get_cache().clear()
+        start = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"  {label:<45} median {statistics.median(samples):8.2f} ms   min {min(samples):8.2f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay benchmark for espn_api fetchers and parsers")
+    parser.add_argument("--fixtures", help="Existing fixture directory (default: seed a temp dir from api_exploration)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Injected latency per replayed request")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    fixture_dir = args.fixtures or tempfile.mkdtemp(prefix="scores_fixtures_")
+    os.environ["SCORES_HTTP_MODE"] = "replay"
+    os.environ["SCORES_FIXTURE_DIR"] = fixture_dir
+    os.environ["SCORES_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+
+    import espn_api
+
+    dates, game_ids = seed_fixtures(fixture_dir) if not args.fixtures else ([], [])
+
+    print(f"\n=== Replay benchmark ({args.runs} runs, {args.latency_ms:.0f} ms injected latency) ===")
+
+    for date_str in dates:
+        day = datetime.strptime(date_str, "%Y%m%d")
+        games = time_it(f"get_scores MLB {date_str}", lambda: espn_api.get_scores("MLB", day), args.runs)
+        print(f"    -> {len(games)} games")
+
+    for game_id in game_ids:
+        details = time_it(f"get_game_details MLB {game_id}", lambda: espn_api.get_game_details("MLB", game_id), args.runs)
+        time_it(f"extract_meaningful_game_info {game_id}", lambda: espn_api.extract_meaningful_game_info(details), args.runs)
+        time_it(f"_parse_boxscore_data {game_id}", lambda: espn_api._parse_boxscore_data(details.get("boxscore")), args.runs)
+
+    for league in espn_api.STANDINGS_URLS:
+        standings = time_it(f"get_standings {league}", lambda: espn_api.get_standings(league), args.runs)
+        print(f"    -> {len(standings)} teams (record fixtures with SCORES_HTTP_MODE=record to include standings)")
+
+
+if __name__ == "__main__":
+    main()
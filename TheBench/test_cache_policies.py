@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Memory cache TTL rules.
+
+Table-driven checks of the endpoint class each API URL maps to and the TTL
+its policy gives: past scoreboards forever, future ones FUTURE_SCOREBOARD_TTL,
+today's 10 s (with today taken in local time, across midnight), past-season
+schedules and stats forever, final summaries forever and others 10 s.
+
+Usage:
+    python TheBench/test_cache_policies.py   (or: python -m pytest TheBench/test_cache_policies.py)
+"""
+
+import json
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import requests
+
+from services import cache
+from services.cache import FOREVER, FUTURE_SCOREBOARD_TTL, POLICIES, classify_url
+
+BASE_URL = "https://site.api.espn.com/apis/site/v2/sports"
+MLB = f"{BASE_URL}/baseball/mlb"
+
+
+@contextmanager
+def local_now(now):
+    """Make the cache policies see now as the current local time"""
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    original = cache.datetime
+    cache.datetime = FixedDatetime
+    try:
+        yield
+    finally:
+        cache.datetime = original
+
+
+def ttl(url, value=None):
+    return POLICIES[classify_url(url)].ttl_for(url, value)
+
+
+def summary_response(state, completed):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = json.dumps({
+        "header": {"id": "1", "competitions": [{"status": {"type": {"state": state, "completed": completed}}}]},
+        "plays": [],
+    }).encode("utf-8")
+    return resp
+
+
+URL_CLASSES = [
+    (f"{MLB}/scoreboard", "scoreboard"),
+    (f"{MLB}/scoreboard?dates=20250401-20250407", "scoreboard"),
+    (f"{MLB}/events", "events"),
+    (f"{MLB}/summary?event=401696636", "summary"),
+    ("https://site.api.espn.com/apis/v2/sports/baseball/mlb/standings", "standings"),
+    (f"{MLB}/news", "news"),
+    (f"{MLB}/teams", "teams"),
+    (f"{MLB}/teams/10", "teams"),
+    (f"{MLB}/teams/10/schedule?season=2024&seasontype=2", "schedule"),
+    (f"{MLB}/teams/10/statistics", "statistics"),
+    (f"{MLB}/statistics", "statistics"),
+    (f"{MLB}/leaders", "statistics"),
+    (f"{MLB}/stats/leaders", "statistics"),
+    (f"{MLB}/athletes", "statistics"),
+    ("https://sports.core.api.espn.com/v2/sports/baseball/leagues/mlb/leaders", "statistics"),
+    (f"{MLB}/groups", "default"),
+]
+
+
+def test_classify_url():
+    for url, endpoint in URL_CLASSES:
+        assert classify_url(url) == endpoint, url
+
+
+SCOREBOARD_TTLS = [
+    # (dates query, ttl on 2025-04-03)
+    ("", 10),
+    ("?dates=20250402", FOREVER),
+    ("?dates=20240403", FOREVER),
+    ("?dates=20250403", 10),
+    ("?dates=20250404", FUTURE_SCOREBOARD_TTL),
+    ("?dates=20260101", FUTURE_SCOREBOARD_TTL),
+    ("?dates=20250327-20250402", FOREVER),                  # week that ended yesterday
+    ("?dates=20250401-20250407", 10),                       # week including today
+    ("?dates=20250403-20250409", 10),
+    ("?dates=20250404-20250410", FUTURE_SCOREBOARD_TTL),    # week starting tomorrow
+    ("?limit=100&dates=20250402", FOREVER),
+]
+
+
+def test_scoreboard_ttl():
+    with local_now(datetime(2025, 4, 3, 15, 30)):
+        for query, expected in SCOREBOARD_TTLS:
+            assert ttl(f"{MLB}/scoreboard{query}") == expected, query
+
+
+def test_scoreboard_day_boundary():
+    april_3, april_4 = f"{MLB}/scoreboard?dates=20250403", f"{MLB}/scoreboard?dates=20250404"
+    with local_now(datetime(2025, 4, 3, 23, 59, 59)):
+        assert (ttl(april_3), ttl(april_4)) == (10, FUTURE_SCOREBOARD_TTL)
+    # Past midnight local time, the 3rd is over for good and the 4th is live
+    with local_now(datetime(2025, 4, 4, 0, 0, 0)):
+        assert (ttl(april_3), ttl(april_4)) == (FOREVER, 10)
+    # New Year's Eve into New Year's Day
+    with local_now(datetime(2026, 1, 1, 0, 0, 1)):
+        assert ttl(f"{MLB}/scoreboard?dates=20251231") == FOREVER
+        assert ttl(f"{MLB}/scoreboard?dates=20251231-20260101") == 10
+
+
+def test_season_ttl():
+    cases = [
+        (f"{MLB}/teams/10/schedule?season=2024", FOREVER),
+        (f"{MLB}/teams/10/schedule?season=2025", 300),
+        (f"{MLB}/teams/10/schedule", 300),
+        (f"{MLB}/statistics?season=2024", FOREVER),
+        (f"{MLB}/statistics?season=2025", 900),
+        (f"{MLB}/leaders", 900),
+    ]
+    with local_now(datetime(2025, 4, 3, 12, 0)):
+        for url, expected in cases:
+            assert ttl(url) == expected, url
+
+
+def test_summary_ttl():
+    url = f"{MLB}/summary?event=401696636"
+    cases = [
+        (summary_response("post", True), FOREVER),
+        (summary_response("in", False), 10),
+        (summary_response("pre", False), 10),
+        (requests.Response(), 10),
+    ]
+    for resp, expected in cases:
+        assert ttl(url, resp) == expected, resp
+
+
+def test_fixed_ttls():
+    for url, expected in [(f"{MLB}/events", 10), (f"{MLB}/news", 300), (f"{MLB}/teams", 3600),
+                          (f"{MLB}/groups", 60)]:
+        assert ttl(url) == expected, url
+
+
+if __name__ == "__main__":
+    test_classify_url()
+    test_scoreboard_ttl()
+    test_scoreboard_day_boundary()
+    test_season_ttl()
+    test_summary_ttl()
+    test_fixed_ttls()
+    print("ok")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+AsyncEspnClient against replayed fixtures.
+
+Seeds the live MLB slate used by live_refresh_benchmark.py, then checks
+that the async live fetch returns the same rows as the synchronous one
+(plain and tiered), never has more requests in flight than its
+concurrency limit, and carries the caller's deadline and priority into
+its worker threads.
+
+Usage:
+    python TheBench/test_espn_api_async.py   (or: python -m pytest TheBench/test_espn_api_async.py)
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "TheBench"))
+
+import espn_api
+from espn_api_async import AsyncEspnClient
+from live_refresh_benchmark import seed_fixtures
+from services import http_client
+from services.deadline import deadline, remaining
+from services.replay import FixtureStore, ReplayTransport
+from services.request_scheduler import Priority, current_priority, request_priority
+
+
+class TrackingTransport:
+    """Replay transport recording peak concurrency and each request's priority and deadline"""
+
+    def __init__(self, fixture_dir, latency):
+        self.replay = ReplayTransport(FixtureStore(fixture_dir), latency)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = []  # (priority, seconds left before the deadline)
+
+    def __call__(self, url, timeout=None, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.requests.append((current_priority(), remaining()))
+        try:
+            return self.replay(url, timeout=timeout, **kwargs)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@contextmanager
+def replay_client(latency=0.0):
+    """Shared client replaying the seeded slate, without caches or rate limits"""
+    with tempfile.TemporaryDirectory() as fixture_dir:
+        seed_fixtures(fixture_dir)
+        client = http_client.HttpClient()
+        transport = client.send = TrackingTransport(fixture_dir, latency)
+        previous = http_client._client
+        http_client._client = client
+        try:
+            yield transport
+        finally:
+            http_client._client = previous
+            client.close()
+
+
+def run_async(coroutine_factory, max_concurrency=4):
+    async def run():
+        async with AsyncEspnClient(max_concurrency=max_concurrency) as client:
+            return await coroutine_factory(client)
+    return asyncio.run(run())
+
+
+def first_game_only(game):
+    # One summary in tiered mode, like a single monitored game
+    return game["id"] == "401696639"
+
+
+def test_matches_sync_fetch():
+    with replay_client():
+        expected = espn_api.get_live_scores_all_sports()
+        games = run_async(lambda client: client.get_live_scores_all_sports())
+    assert expected
+    assert games == expected
+
+
+def test_tiered_matches_sync_fetch():
+    with replay_client() as transport:
+        expected = [game for _, games in espn_api.iter_live_scores_all_sports(needs_details=first_game_only,
+                                                                               tiered=True)
+                    for game in games or []]
+        sync_requests = len(transport.requests)
+        games = run_async(lambda client: client.get_live_scores_all_sports(needs_details=first_game_only,
+                                                                            tiered=True))
+        async_requests = len(transport.requests) - sync_requests
+    assert any(not game.get("details_skipped") for game in games)
+    assert sorted(games, key=lambda game: game["id"]) == sorted(expected, key=lambda game: game["id"])
+    # Events lists, one scoreboard, one summary: the same requests either way
+    assert async_requests == sync_requests
+
+
+def test_fan_out_is_bounded():
+    with replay_client(latency=0.02) as transport:
+        games = run_async(lambda client: client.get_live_scores_all_sports(), max_concurrency=3)
+    assert len(games) > 3
+    assert 1 < transport.peak <= 3
+
+
+def test_deadline_and_priority_reach_workers():
+    async def fetch(client):
+        with deadline(30), request_priority(Priority.PREFETCH):
+            return await client.get_live_scores_all_sports(leagues=["MLB"], tiered=True)
+
+    with replay_client() as transport:
+        run_async(fetch)
+    assert transport.requests
+    assert all(priority == Priority.PREFETCH for priority, _ in transport.requests)
+    assert all(left is not None and 0 < left <= 30 for _, left in transport.requests)
+
+
+if __name__ == "__main__":
+    test_matches_sync_fetch()
+    test_tiered_matches_sync_fetch()
+    test_fan_out_is_bounded()
+    test_deadline_and_priority_reach_workers()
+    print("ok")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+LiveGameTracker and GameEventBus.
+
+Feeds league refreshes through a tracker and checks the delta each update
+returns (a failed league fetch included), the score, lead and period
+events it publishes, and that subscribers only get the kinds and game ids
+they asked for.
+
+Usage:
+    python TheBench/test_event_bus.py   (or: python -m pytest TheBench/test_event_bus.py)
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.event_bus import (
+    LEAD_CHANGE, PERIOD_CHANGE, PLAY, SCORE_CHANGE, GameEventBus, LiveGameTracker,
+)
+
+
+def game(game_id, away=0, home=0, period=2, status="Q2 5:00", recent_play=""):
+    return {
+        "id": game_id, "name": f"Away {game_id} @ Home {game_id}", "league": "NBA",
+        "status": status, "period": period, "recent_play": recent_play,
+        "teams": [{"name": "Away", "score": str(away)}, {"name": "Home", "score": str(home)}],
+    }
+
+
+def tracker_with_log(**subscription):
+    bus = GameEventBus()
+    tracker = LiveGameTracker(bus)
+    events = []
+    bus.subscribe(events.append, **subscription)
+    return tracker, events
+
+
+def test_update_delta():
+    tracker, events = tracker_with_log()
+    # The first refresh is only the baseline
+    delta = tracker.update("NBA", [game("1"), game("2")])
+    assert [g["id"] for g in delta.added] == ["1", "2"] and not delta.changed
+    assert events == []
+
+    delta = tracker.update("NBA", [game("1", 2, 0), game("3")])
+    assert [g["id"] for g in delta.added] == ["3"]
+    assert [g["id"] for g in delta.removed] == ["2"]
+    assert [(change.game_id, change.fields) for change in delta.changed] == [("1", ("score",))]
+    assert set(tracker.snapshot("NBA")) == {"1", "3"}
+    # Other leagues keep their own snapshot
+    assert tracker.snapshot("NHL") == {}
+
+
+def test_failed_league_keeps_baseline():
+    tracker, events = tracker_with_log()
+    tracker.update("NBA", [game("1", 10, 8)])
+    delta = tracker.update("NBA", None)
+    assert not delta and not delta.removed
+    assert set(tracker.snapshot("NBA")) == {"1"}
+    # A basket scored while the fetch was failing is still announced
+    tracker.update("NBA", [game("1", 10, 10)])
+    assert [(event.kind, event.game_id) for event in events] == [(SCORE_CHANGE, "1"), (LEAD_CHANGE, "1")]
+
+
+def test_score_and_lead_events():
+    tracker, events = tracker_with_log()
+    tracker.update("NBA", [game("1", 10, 8)])
+    tracker.update("NBA", [game("1", 10, 9)])
+    tracker.update("NBA", [game("1", 10, 10)])
+    tracker.update("NBA", [game("1", 10, 12, period=3, status="Q3 12:00")])
+    assert [event.kind for event in events] == [
+        SCORE_CHANGE,                               # still ahead: no lead change
+        SCORE_CHANGE, LEAD_CHANGE,                  # tied
+        SCORE_CHANGE, LEAD_CHANGE, PERIOD_CHANGE,   # home ahead, new quarter
+    ]
+    tie, home_ahead = events[2], events[4]
+    assert (tie.extra["previous_leader"], tie.extra["leader"]) == ("Away", "tie")
+    assert (home_ahead.extra["previous_leader"], home_ahead.extra["leader"]) == ("tie", "Home")
+    assert events[3].extra["previous_scores"] == ["10", "10"]
+    assert events[5].extra["previous_period"] == 2
+
+    exported = events[4].to_dict()
+    assert exported["type"] == LEAD_CHANGE and exported["game_id"] == "1" and exported["leader"] == "Home"
+    assert exported["scores"] == [{"team": "Away", "score": "10"}, {"team": "Home", "score": "12"}]
+
+
+def test_play_event_skips_status_echo():
+    tracker, events = tracker_with_log()
+    tracker.update("NBA", [game("1")])
+    tracker.update("NBA", [game("1", recent_play="Tatum makes 3-pt jump shot")])
+    tracker.update("NBA", [game("1", recent_play="Q2 5:00")])
+    assert [(event.kind, event.extra.get("play")) for event in events] == [(PLAY, "Tatum makes 3-pt jump shot")]
+
+
+def test_kinds_and_game_ids_filtering():
+    bus = GameEventBus()
+    tracker = LiveGameTracker(bus)
+    everything, leads, followed = [], [], []
+    game_ids = {"1"}
+    bus.subscribe(everything.append)
+    bus.subscribe(leads.append, kinds=[LEAD_CHANGE])
+    bus.subscribe(followed.append, kinds=[SCORE_CHANGE, LEAD_CHANGE], game_ids=game_ids)
+
+    tracker.update("NBA", [game("1", 2, 2), game("2", 2, 2)])
+    tracker.update("NBA", [game("1", 4, 2), game("2", 2, 3)])
+    assert [(e.kind, e.game_id) for e in everything] == [
+        (SCORE_CHANGE, "1"), (LEAD_CHANGE, "1"), (SCORE_CHANGE, "2"), (LEAD_CHANGE, "2")]
+    assert [e.game_id for e in leads] == ["1", "2"]
+    assert [(e.kind, e.game_id) for e in followed] == [(SCORE_CHANGE, "1"), (LEAD_CHANGE, "1")]
+
+    # The game id set is read at publish time
+    game_ids.add("2")
+    tracker.update("NBA", [game("1", 4, 2), game("2", 2, 5)])
+    assert [(e.kind, e.game_id) for e in followed][2:] == [(SCORE_CHANGE, "2")]
+
+    stats = bus.stats()
+    assert (stats["published"], stats["delivered"], stats["subscribers"]) == (5, 10, 3)
+
+
+def test_failing_subscriber_does_not_starve_others():
+    bus = GameEventBus()
+    tracker = LiveGameTracker(bus)
+    received = []
+
+    def broken(event):
+        raise RuntimeError("boom")
+
+    token = bus.subscribe(broken)
+    bus.subscribe(received.append)
+    tracker.update("NBA", [game("1")])
+    tracker.update("NBA", [game("1", 0, 2)])
+    assert [e.kind for e in received] == [SCORE_CHANGE, LEAD_CHANGE]
+    assert bus.stats()["errors"] == 2
+
+    bus.unsubscribe(token)
+    tracker.update("NBA", [game("1", 0, 4)])
+    assert bus.stats()["errors"] == 2 and len(received) == 3
+
+
+if __name__ == "__main__":
+    test_update_delta()
+    test_failed_league_keeps_baseline()
+    test_score_and_lead_events()
+    test_play_event_skips_status_echo()
+    test_kinds_and_game_ids_filtering()
+    test_failing_subscriber_does_not_starve_others()
+    print("ok")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+FinalSummaryStore and is_final_summary.
+
+Covers the URL -> compressed blob round trip, one blob shared by identical
+bodies, the gzip and lzma codecs, oldest-first eviction under a small cap,
+and the completed / in-progress / malformed decisions of the header peek.
+
+Usage:
+    python TheBench/test_final_store.py   (or: python -m pytest TheBench/test_final_store.py)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import requests
+
+from services.final_store import CODECS, FinalSummaryStore, is_final_summary
+
+CAPTURE_DIR = os.path.join(ROOT_DIR, "TheBench", "api_exploration")
+
+
+def summary_url(game_id):
+    return f"https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/summary?event={game_id}"
+
+
+def summary_body(state="post", completed=True, game_id="1"):
+    return json.dumps({
+        "boxscore": {"teams": []},
+        "header": {"id": game_id, "competitions": [{"status": {"type": {"state": state, "completed": completed}}}]},
+        "plays": [{"id": str(n), "text": f"Play {n}"} for n in range(200)],
+    }).encode("utf-8")
+
+
+def response(body, status_code=200):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = body
+    return resp
+
+
+def blob_files(directory):
+    return sorted(os.listdir(os.path.join(directory, "objects")))
+
+
+def test_round_trip_and_dedup():
+    with tempfile.TemporaryDirectory() as directory:
+        store = FinalSummaryStore(directory)
+        body = summary_body()
+        assert store.lookup(summary_url(1)) is None
+        assert store.store(summary_url(1), body)
+        assert store.store(summary_url(2), body)
+        assert store.lookup(summary_url(1)) == body
+        assert store.lookup(summary_url(2)) == body
+        # Both URLs point at one content-addressed blob
+        assert len(blob_files(directory)) == 1
+        stats = store.stats()
+        assert (stats["blobs"], stats["stores"], stats["hits"], stats["misses"]) == (1, 2, 2, 1)
+        # A fresh instance reads the same files
+        assert FinalSummaryStore(directory).lookup(summary_url(2)) == body
+
+
+def test_codecs():
+    for codec, (suffix, _, _) in CODECS.items():
+        with tempfile.TemporaryDirectory() as directory:
+            store = FinalSummaryStore(directory, codec=codec)
+            body = summary_body()
+            store.store(summary_url(1), body)
+            blob, = blob_files(directory)
+            assert blob.endswith(suffix), codec
+            assert os.path.getsize(os.path.join(directory, "objects", blob)) < len(body) / 4, codec
+            assert store.lookup(summary_url(1)) == body, codec
+    try:
+        FinalSummaryStore(tempfile.gettempdir(), codec="zip")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown codec accepted")
+
+
+def test_oldest_blobs_evicted_first():
+    with tempfile.TemporaryDirectory() as directory:
+        bodies = [summary_body(game_id=str(n)) for n in range(4)]
+        blob_size = len(CODECS["gzip"][1](bodies[0]))
+        store = FinalSummaryStore(directory, max_bytes=blob_size * 3 + blob_size // 2)
+        for n, body in enumerate(bodies):
+            assert store.store(summary_url(n), body)
+            time.sleep(0.01)
+        assert store.lookup(summary_url(0)) is None
+        assert all(store.lookup(summary_url(n)) == bodies[n] for n in (1, 2, 3))
+        stats = store.stats()
+        assert stats["evictions"] == 1
+        assert stats["blobs"] == 3 and stats["bytes"] <= store.max_bytes
+
+
+def test_store_if_final_only_keeps_finished_games():
+    with tempfile.TemporaryDirectory() as directory:
+        store = FinalSummaryStore(directory)
+        assert store.store_if_final(summary_url(1), response(summary_body()))
+        assert not store.store_if_final(summary_url(2), response(summary_body("in", False)))
+        assert not store.store_if_final(summary_url(3), response(summary_body(), status_code=404))
+        assert store.lookup(summary_url(1)) is not None
+        assert store.lookup(summary_url(2)) is None and store.lookup(summary_url(3)) is None
+
+
+def test_finality_from_header_peek():
+    assert is_final_summary(response(summary_body("post", True)))
+    assert is_final_summary(response(summary_body("post", False)))
+    assert not is_final_summary(response(summary_body("in", False)))
+    assert not is_final_summary(response(summary_body("pre", False)))
+    malformed = [b"", b"not json", b'{"header": {"competitions": []}}', b'{"header": {"id": "1"}}',
+                 summary_body()[:200]]
+    for body in malformed:
+        assert not is_final_summary(response(body)), body
+    # Decoded summaries are judged the same way
+    assert is_final_summary(json.loads(summary_body()))
+    assert not is_final_summary({"header": None})
+    for game_id, final in (("401696636", True), ("401696639", False)):
+        with open(os.path.join(CAPTURE_DIR, f"game_details_{game_id}.json"), "rb") as f:
+            assert is_final_summary(response(f.read())) == final, game_id
+
+
+def test_finality_remembered_on_response():
+    resp = response(summary_body())
+    assert is_final_summary(resp) and resp.final_summary is True
+    # The cache TTL policy asks again; the stored answer is reused without decoding
+    resp._content = b"not json"
+    assert is_final_summary(resp)
+    assert FinalSummaryStore.response(summary_url(1), summary_body()).final_summary is True
+
+
+if __name__ == "__main__":
+    test_round_trip_and_dedup()
+    test_codecs()
+    test_oldest_blobs_evicted_first()
+    test_store_if_final_only_keeps_finished_games()
+    test_finality_from_header_peek()
+    test_finality_remembered_on_response()
+    print("ok")
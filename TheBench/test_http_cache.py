@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+On-disk HttpCache byte cap.
+
+Stores more responses than the cap allows and checks that the least
+recently used entries are dropped, that a lookup keeps an entry alive, and
+that a fresh instance picks up the existing files' sizes.
+
+Usage:
+    python TheBench/test_http_cache.py   (or: python -m pytest TheBench/test_http_cache.py)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from services.http_cache import HttpCache
+
+BODY = b'{"events": [' + b'{"id": "1"}, ' * 300 + b'{"id": "2"}]}'
+
+
+def response():
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.headers = CaseInsensitiveDict({"Content-Type": "application/json", "Cache-Control": "max-age=60"})
+    resp._content = BODY
+    return resp
+
+
+def url(n):
+    return f"https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard?dates=202501{n:02d}"
+
+
+def disk_bytes(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def entry_size(directory):
+    """Bytes of one stored entry, with slack for the varying stored_at digits"""
+    cache = HttpCache(directory)
+    cache.store(url(0), response())
+    size = cache.stats()["bytes"]
+    cache.clear()
+    return size + 16
+
+
+def test_store_evicts_least_recently_used():
+    with tempfile.TemporaryDirectory() as directory:
+        size = entry_size(directory)
+        cache = HttpCache(directory, max_bytes=size * 3)
+        for n in (1, 2, 3):
+            assert cache.store(url(n), response())
+            time.sleep(0.01)
+        # Using 1 makes 2 the least recently used
+        assert cache.lookup(url(1)) is not None
+        time.sleep(0.01)
+        assert cache.store(url(4), response())
+
+        assert cache.lookup(url(2)) is None
+        assert all(cache.lookup(url(n)) is not None for n in (1, 3, 4))
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 3
+        assert disk_bytes(directory) == stats["bytes"] <= cache.max_bytes
+
+
+def test_existing_entries_count_against_cap():
+    with tempfile.TemporaryDirectory() as directory:
+        size = entry_size(directory)
+        cache = HttpCache(directory)
+        for n in range(1, 6):
+            cache.store(url(n), response())
+
+        reopened = HttpCache(directory, max_bytes=size * 2)
+        assert reopened.stats()["entries"] == 5
+        reopened.store(url(6), response())
+        assert reopened.stats()["entries"] == 2
+        assert disk_bytes(directory) <= reopened.max_bytes
+        assert reopened.lookup(url(6)) is not None
+
+
+def test_oversized_response_not_stored():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = HttpCache(directory, max_bytes=len(BODY) // 2)
+        assert not cache.store(url(1), response())
+        assert cache.stats()["entries"] == 0
+
+
+if __name__ == "__main__":
+    test_store_evicts_least_recently_used()
+    test_existing_entries_count_against_cap()
+    test_oversized_response_not_stored()
+    print("ok")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+json_codec.peek_object and select_sections.
+
+peek_object decides summary finality for the final store and the cache TTL
+policy, so it must skip same-named objects nested ahead of the one asked
+for, and give up cleanly on missing or cut-off sections.
+
+Usage:
+    python TheBench/test_json_codec.py   (or: python -m pytest TheBench/test_json_codec.py)
+"""
+
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import requests
+
+from services import json_codec
+
+CAPTURE_DIR = os.path.join(ROOT_DIR, "TheBench", "api_exploration")
+
+HEADER = {"id": "1", "competitions": [{"status": {"type": {"state": "post", "completed": True}}}]}
+
+
+def test_peek_finds_header():
+    body = json.dumps({"boxscore": {}, "header": HEADER, "plays": []}).encode("utf-8")
+    assert json_codec.peek_object(body, "header", "competitions") == HEADER
+    # str bodies and pretty-printed separators work too
+    assert json_codec.peek_object(json.dumps({"header": HEADER}, indent=2), "header", "competitions") == HEADER
+
+
+def test_peek_missing_header():
+    assert json_codec.peek_object(b'{"boxscore": {}, "plays": []}', "header", "competitions") is None
+    assert json_codec.peek_object(b"", "header", "competitions") is None
+    # A header without the marker doesn't count
+    assert json_codec.peek_object(b'{"header": {"id": "1"}}', "header", "competitions") is None
+
+
+def test_peek_skips_nested_header_first():
+    body = json.dumps({
+        "pickcenter": [{"provider": {"header": {"logo": "bet.svg"}}}],
+        "news": {"header": "MLB News"},
+        "header": HEADER,
+    }).encode("utf-8")
+    assert json_codec.peek_object(body, "header", "competitions") == HEADER
+
+
+def test_peek_real_summary():
+    with open(os.path.join(CAPTURE_DIR, "game_details_401696637.json"), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    # Compact, as ESPN sends it; a betting provider's "header" object comes before the top-level one
+    body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    assert 0 <= body.find(b'"header":{"logo"') < body.find(b'"header":{"id"')
+    assert json_codec.peek_object(body, "header", "competitions") == data["header"]
+
+
+def test_peek_truncated_body():
+    body = json.dumps({"boxscore": {}, "header": HEADER, "plays": [{"id": "1"}] * 10}).encode("utf-8")
+    header_at = body.find(b'"header"')
+    # Cut inside the header: nothing to decode
+    assert json_codec.peek_object(body[:header_at + 40], "header", "competitions") is None
+    # Cut after it: the header alone still decodes (callers check completeness themselves)
+    assert json_codec.peek_object(body[:-20], "header", "competitions") == HEADER
+
+
+def test_select_sections():
+    data = {"header": HEADER, "plays": [1, 2], "boxscore": {}, "news": {}}
+    assert json_codec.select_sections(data, ("header", "plays")) == {"header": HEADER, "plays": [1, 2]}
+    # Requested keys the payload lacks are skipped
+    assert json_codec.select_sections(data, ("plays", "drives")) == {"plays": [1, 2]}
+    assert json_codec.select_sections(data, None) is data
+    assert json_codec.select_sections([1, 2], ("plays",)) == [1, 2]
+
+
+def test_response_json():
+    resp = requests.Response()
+    resp._content = b'{"a": [1, 2]}'
+    assert json_codec.response_json(resp) == {"a": [1, 2]}
+    resp._content = b"{not json"
+    try:
+        json_codec.response_json(resp)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("bad JSON decoded")
+
+
+if __name__ == "__main__":
+    test_peek_finds_header()
+    test_peek_missing_header()
+    test_peek_skips_nested_header_first()
+    test_peek_real_summary()
+    test_peek_truncated_body()
+    test_select_sections()
+    test_response_json()
+    print("ok")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+diff_games on live score snapshots.
+
+Checks that games are reported as added, removed or changed by id, that a
+change names exactly the displayed fields that moved (score included), and
+that untouched games are only counted.
+
+Usage:
+    python TheBench/test_live_delta.py   (or: python -m pytest TheBench/test_live_delta.py)
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.live_delta import diff_games, score_tuple
+
+
+def game(game_id, away=0, home=0, status="Top 3rd", period=3, recent_play="Strikeout"):
+    return {
+        "id": game_id, "name": f"Away {game_id} @ Home {game_id}", "league": "MLB",
+        "status": status, "period": period, "recent_play": recent_play,
+        "teams": [{"name": f"Away {game_id}", "score": str(away)}, {"name": f"Home {game_id}", "score": str(home)}],
+    }
+
+
+def snapshot(games):
+    return {g["id"]: g for g in games}
+
+
+def test_added_removed_changed():
+    previous = snapshot([game("1"), game("2"), game("3", 1, 0)])
+    current = [game("1"), game("3", 1, 2, status="Bot 3rd"), game("4")]
+    delta = diff_games(previous, current)
+    assert [g["id"] for g in delta.added] == ["4"]
+    assert [g["id"] for g in delta.removed] == ["2"]
+    assert [change.game_id for change in delta.changed] == ["3"]
+    change, = delta.changed
+    assert change.fields == ("status", "score")
+    assert change.score_changed
+    assert change.old is previous["3"] and change.new is current[1]
+    assert delta.unchanged == 1
+    assert delta
+
+
+def test_changed_fields_only_what_moved():
+    base = game("1")
+    cases = [
+        (game("1", status="Mid 3rd"), ("status",)),
+        (game("1", period=4), ("period",)),
+        (game("1", recent_play="Single to left"), ("recent_play",)),
+        (game("1", away=1), ("score",)),
+        (game("1", away=1, status="Top 4th", period=4), ("status", "period", "score")),
+    ]
+    for current, fields in cases:
+        delta = diff_games(snapshot([base]), [current])
+        assert [change.fields for change in delta.changed] == [fields], fields
+        assert delta.changed[0].score_changed == ("score" in fields)
+
+    # Fields nobody displays don't count as changes
+    moved = dict(base, venue="Somewhere else")
+    delta = diff_games(snapshot([base]), [moved])
+    assert not delta and delta.unchanged == 1
+
+
+def test_first_and_empty_snapshots():
+    games = [game("1"), game("2")]
+    delta = diff_games({}, games)
+    assert delta.added == games and not delta.removed and not delta.changed
+    # Every game over: all removed
+    delta = diff_games(snapshot(games), [])
+    assert delta.removed == games and not delta.added
+    assert not diff_games({}, [])
+
+
+def test_score_tuple():
+    assert score_tuple(game("1", 3, 10)) == ("3", "10")
+    assert score_tuple({"id": "1"}) is None
+    assert score_tuple({"teams": [{"name": "A"}, {"name": "B", "score": 2}]}) == ("", "2")
+
+
+if __name__ == "__main__":
+    test_added_removed_changed()
+    test_changed_fields_only_what_moved()
+    test_first_and_empty_snapshots()
+    test_score_tuple()
+    print("ok")
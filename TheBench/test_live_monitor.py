@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Headless live monitor across a failed poll.
+
+A league whose events request fails (here a 503) must not reset the poll
+scheduler or the tracker's baseline, so a score change made while the
+request was failing is still written on the next good poll. In replay
+mode, the monitor's stdout must carry nothing but JSON event lines.
+
+Usage:
+    python TheBench/test_live_monitor.py   (or: python -m pytest TheBench/test_live_monitor.py)
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import requests
+
+import espn_api
+from services.live_monitor import LiveMonitor
+from services.replay import FixtureStore
+
+
+def events_payload(away_score, home_score):
+    return {"events": [{
+        "id": "401000001",
+        "fullStatus": {"period": 2, "type": {"state": "in", "shortDetail": "Q2 5:00"}},
+        "competitors": [
+            {"displayName": "Boston Celtics", "score": str(away_score)},
+            {"displayName": "New York Knicks", "score": str(home_score)},
+        ],
+    }]}
+
+
+def response(status_code, data=None):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = json.dumps(data or {}).encode("utf-8")
+    return resp
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run_polls(responses):
+    """Poll NBA once per canned events response; returns (monitor, next due time after each poll, output)"""
+    queue = list(responses)
+    original_get = espn_api.http_client.get
+    espn_api.http_client.get = lambda url, *args, **kwargs: queue.pop(0)
+    output = io.StringIO()
+    clock = FakeClock()
+    try:
+        monitor = LiveMonitor(output, leagues=["NBA"], clock=clock)
+        next_due = []
+        while queue:
+            monitor.poll(force=True)
+            next_due.append(monitor.scheduler.next_due())
+            clock.now += 60
+    finally:
+        espn_api.http_client.get = original_get
+    return monitor, next_due, output
+
+
+def test_score_change_across_failed_poll_is_written():
+    monitor, _, output = run_polls([
+        response(200, events_payload(1, 0)),
+        response(503),
+        response(200, events_payload(3, 0)),
+    ])
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [event["type"] for event in events if event["type"] == "score_change"] == ["score_change"]
+    assert monitor.events_written == len(events)
+
+
+def test_failed_poll_keeps_schedule():
+    _, next_due, _ = run_polls([
+        response(200, events_payload(1, 0)),
+        response(503),
+    ])
+    # No backoff: the league stays due when the live game said it would be
+    assert next_due[1] == next_due[0]
+
+
+def test_replay_stdout_is_only_events():
+    with tempfile.TemporaryDirectory() as directory:
+        fixtures = os.path.join(directory, "fixtures")
+        # NBA has a live game; MLB has no fixture, so its fetch fails with a 404
+        FixtureStore(fixtures).save_json(espn_api._live_events_url("NBA"), events_payload(1, 0))
+        env = dict(os.environ, SCORES_HTTP_MODE="replay", SCORES_FIXTURE_DIR=fixtures,
+                   SCORES_CACHE_DIR=os.path.join(directory, "cache"))
+        result = subprocess.run([sys.executable, os.path.join(ROOT_DIR, "main.py"), "--monitor", "--once",
+                                 "--leagues", "NBA", "MLB"],
+                                env=env, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    for line in result.stdout.splitlines():
+        json.loads(line)
+    assert "No replay fixture" in result.stderr
+    assert "Error fetching live scores for MLB" in result.stderr
+
+
+if __name__ == "__main__":
+    test_score_change_across_failed_poll_is_written()
+    test_failed_poll_keeps_schedule()
+    test_replay_stdout_is_only_events()
+    print("ok")
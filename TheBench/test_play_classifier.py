@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+At-bat grouping on the captured MLB play-by-play.
+
+Every at-bat group_at_bats builds must have a batter (one per "pitches to"
+play), and substitutions announced before an at-bat starts must stay with
+it, so no pitching change goes missing from the plays tree or game log.
+
+Usage:
+    python TheBench/test_play_classifier.py   (or: python -m pytest TheBench/test_play_classifier.py)
+"""
+
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.play_classifier import group_at_bats
+from services.score_timeline import segment_key
+
+CAPTURE_DIR = os.path.join(ROOT_DIR, "TheBench", "api_exploration")
+
+# Game id -> "pitches to" plays in the capture
+EXPECTED_AT_BATS = {"401696636": 69, "401696637": 90}
+
+
+def half_innings(game_id):
+    with open(os.path.join(CAPTURE_DIR, f"game_details_{game_id}.json"), "r", encoding="utf-8") as f:
+        plays = json.load(f)["plays"]
+    halves = {}
+    for play in plays:
+        halves.setdefault(segment_key(play), []).append(play)
+    return plays, list(halves.values())
+
+
+def test_one_at_bat_per_batter():
+    for game_id, expected in EXPECTED_AT_BATS.items():
+        _, halves = half_innings(game_id)
+        at_bats = [at_bat for plays in halves for at_bat in group_at_bats(plays)]
+        assert len(at_bats) == expected, game_id
+        assert all(at_bat.batter for at_bat in at_bats), game_id
+
+
+def test_relief_changes_kept():
+    for game_id in EXPECTED_AT_BATS:
+        plays, halves = half_innings(game_id)
+        changes = [play["text"] for play in plays if " relieved " in play.get("text", "")]
+        # The plays tree and game log skip at-bats without a batter
+        grouped = [play["text"] for half in halves for at_bat in group_at_bats(half) if at_bat.batter
+                   for play in at_bat.plays if " relieved " in play.get("text", "")]
+        assert grouped == changes, game_id
+
+
+def test_substitutions_join_next_at_bat():
+    _, halves = half_innings("401696637")
+    top_ninth = next(half for half in halves if segment_key(half[0]) == "9th Inning_top")
+    first = group_at_bats(top_ninth)[0]
+    assert first.batter == "Michael Taylor"
+    assert [play["text"] for play in first.plays[:3]] == [
+        "Mastrobuoni as designated hitter.", "Moore at first base.", "Muñoz relieved Brash"]
+
+
+if __name__ == "__main__":
+    test_one_at_bat_per_batter()
+    test_relief_changes_kept()
+    test_substitutions_join_next_at_bat()
+    print("ok")
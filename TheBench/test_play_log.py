@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Incremental PlayLog ingest on the captured MLB play-by-play.
+
+MLB restarts sequenceNumber with every at-bat, so the log must key on play
+ids: ingesting a game's plays as they grow (a prefix, then the full list)
+must append only the new plays and never fall back to a reset.
+
+Usage:
+    python TheBench/test_play_log.py   (or: python -m pytest TheBench/test_play_log.py)
+"""
+
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.play_log import PlayLog
+
+CAPTURE_DIR = os.path.join(ROOT_DIR, "TheBench", "api_exploration")
+
+
+def load_plays(game_id):
+    with open(os.path.join(CAPTURE_DIR, f"game_details_{game_id}.json"), "r", encoding="utf-8") as f:
+        return json.load(f)["plays"]
+
+
+def test_mlb_ingest_is_incremental():
+    plays = load_plays("401696637")
+    # The capture really does repeat sequence numbers
+    assert len({play.get("sequenceNumber") for play in plays}) < len(plays)
+
+    log = PlayLog("401696637")
+    half = len(plays) // 2
+    assert len(log.ingest(plays[:half])) == half
+    assert log.ingest(plays) == plays[half:]
+    assert log.ingest(plays) == []
+    assert log.stats["resets"] == 0
+    assert len(log) == len(plays)
+    assert len(log.timeline) == len(plays)
+
+
+def test_replaced_plays_reset():
+    plays = load_plays("401696636")
+    log = PlayLog("401696636")
+    log.ingest(plays)
+    # A corrected feed with a different play at the old end starts over
+    changed = plays[:-1] + [dict(plays[-1], id="corrected")]
+    assert len(log.ingest(changed)) == len(changed)
+    assert log.stats["resets"] == 1
+
+
+if __name__ == "__main__":
+    test_mlb_ingest_is_incremental()
+    test_replaced_plays_reset()
+    print("ok")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+PollScheduler intervals and league backoff on a fake clock.
+
+Checks the state each live status line is classified as, the interval each
+state (and monitoring) gives a game within the clamp, the doubling backoff
+of leagues without live games and its reset once games start, and that a
+game's summary is only due again after its interval.
+
+Usage:
+    python TheBench/test_poll_scheduler.py   (or: python -m pytest TheBench/test_poll_scheduler.py)
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.poll_scheduler import MAX_BACKOFF, MAX_INTERVAL, MIN_INTERVAL, PollScheduler, classify_game_state
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def game(status, league="MLB", game_id="1"):
+    return {"id": game_id, "league": league, "status": status, "teams": []}
+
+
+STATES = [
+    # (league, status, state)
+    ("MLB", "Top 3rd", "normal"),
+    ("MLB", "Top 8th", "late"),
+    ("MLB", "Top 9th", "late"),
+    ("MLB", "Bot 9th", "critical"),
+    ("MLB", "Bot 11th", "critical"),
+    ("MLB", "Mid 5th", "break"),
+    ("MLB", "End 7th", "break"),
+    ("MLB", "Rain Delay", "delay"),
+    ("NBA", "8:12 - 2nd", "normal"),
+    ("NBA", "Halftime", "break"),
+    ("NBA", "6:40 - 4th", "late"),
+    ("NBA", "1:30 - 4th", "critical"),
+    ("NBA", "0:45 - OT", "critical"),
+    ("NFL", "1:45 - 2nd", "critical"),
+    ("NFL", "1:45 - 1st", "normal"),
+    ("NHL", "End of 2nd", "break"),
+    ("NHL", "5:00 - 3rd", "late"),
+    ("Soccer", "34'", "normal"),
+    ("Soccer", "81'", "late"),
+    ("Soccer", "Halftime", "break"),
+    ("NFL", "Postponed", "delay"),
+]
+
+
+def test_classify_game_state():
+    for league, status, state in STATES:
+        assert classify_game_state(game(status, league)) == state, (league, status)
+
+
+def test_game_interval_per_state():
+    scheduler = PollScheduler(base_interval=60.0)
+    intervals = [
+        ("Top 3rd", 60.0),       # normal
+        ("Top 8th", 30.0),       # late
+        ("Bot 9th", 15.0),       # critical
+        ("Mid 5th", 180.0),      # break
+        ("Rain Delay", 480.0),   # delay
+    ]
+    for status, interval in intervals:
+        assert scheduler.game_interval(game(status)) == interval, status
+
+    # Monitored games poll four times as often, but never below the floor
+    scheduler.set_monitored({"1"})
+    assert scheduler.game_interval(game("Top 3rd")) == 15.0
+    assert scheduler.game_interval(game("Bot 9th")) == MIN_INTERVAL
+    assert scheduler.game_interval(game("Top 3rd", game_id="2")) == 60.0
+
+    # Nor above the ceiling
+    slow = PollScheduler(base_interval=200.0)
+    assert slow.game_interval(game("Rain Delay")) == MAX_INTERVAL
+
+
+def test_empty_league_backoff_doubles_then_resets():
+    clock = FakeClock()
+    scheduler = PollScheduler(base_interval=60.0, clock=clock)
+    assert scheduler.next_due() is None
+    assert scheduler.due_leagues(["MLB", "NBA"]) == ["MLB", "NBA"]
+
+    waits = []
+    for _ in range(5):
+        scheduler.record_league("NBA", [])
+        waits.append(scheduler.next_due() - clock.now)
+        assert scheduler.due_leagues(["NBA"]) == []
+        clock.now = scheduler.next_due()
+        assert scheduler.due_leagues(["NBA"]) == ["NBA"]
+    assert waits == [120.0, 240.0, 480.0, MAX_BACKOFF, MAX_BACKOFF]
+
+    # Games starting drop the backoff; the league polls as often as its fastest game
+    scheduler.record_league("NBA", [game("8:12 - 2nd", "NBA", "a"), game("1:30 - 4th", "NBA", "b")])
+    assert scheduler.next_due() - clock.now == 15.0
+    # ...and once they end it starts over from base * 2
+    clock.now += 15.0
+    scheduler.record_league("NBA", [])
+    assert scheduler.next_due() - clock.now == 120.0
+
+
+def test_leagues_due_independently():
+    clock = FakeClock()
+    scheduler = PollScheduler(base_interval=60.0, clock=clock)
+    scheduler.record_league("MLB", [game("Top 8th")])
+    scheduler.record_league("NBA", [])
+    assert scheduler.next_due() == clock.now + 30.0
+    clock.now += 30.0
+    assert scheduler.due_leagues(["MLB", "NBA", "NHL"]) == ["MLB", "NHL"]
+    clock.now += 90.0
+    assert scheduler.due_leagues(["MLB", "NBA"]) == ["MLB", "NBA"]
+
+
+def test_summary_due_after_interval():
+    clock = FakeClock()
+    scheduler = PollScheduler(base_interval=60.0, clock=clock)
+    live = game("Top 3rd")
+    assert scheduler.needs_details(live)
+    clock.now += 59.0
+    assert not scheduler.needs_details(live)
+    clock.now += 1.0
+    assert scheduler.needs_details(live)
+
+    # Forced polls skip the wait once
+    scheduler.mark_due("1", "MLB")
+    assert scheduler.needs_details(live)
+    assert not scheduler.needs_details(live)
+    assert scheduler.needs_details(live, force=True)
+
+    stats = scheduler.stats()
+    assert (stats["summary_polls"], stats["summaries_skipped"]) == (4, 2)
+
+
+if __name__ == "__main__":
+    test_classify_game_state()
+    test_game_interval_per_state()
+    test_empty_league_backoff_doubles_then_resets()
+    test_leagues_due_independently()
+    test_summary_due_after_interval()
+    print("ok")
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+RequestScheduler and hedged sends under deadlines.
+
+A request queued behind a full in-flight budget, or throttled by its host's
+token bucket, must give up with DeadlineExceeded when the calling thread's
+deadline runs out instead of blocking until a slot frees up, and a token it
+won't use goes back to the bucket. Token buckets run on a fake clock.
+HttpClient hedges a slow request only after the hedge delay, returns the
+first answer and drops the loser.
+
+Usage:
+    python TheBench/test_request_scheduler.py   (or: python -m pytest TheBench/test_request_scheduler.py)
+"""
+
+import os
+import sys
+import threading
+import time
+
+import requests
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.deadline import DeadlineExceeded, deadline
+from services.http_client import HttpClient
+from services.request_scheduler import RequestScheduler, TokenBucket
+
+URL = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
+
+
+def test_queue_wait_bounded_by_deadline():
+    scheduler = RequestScheduler(max_in_flight=1)
+    holding, release = threading.Event(), threading.Event()
+
+    def hold_slot():
+        with scheduler.slot(URL):
+            holding.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_slot)
+    holder.start()
+    holding.wait(5)
+    start = time.monotonic()
+    try:
+        with deadline(0.2):
+            with scheduler.slot(URL):
+                raise AssertionError("slot granted while the only one was held")
+    except DeadlineExceeded:
+        pass
+    finally:
+        release.set()
+        holder.join()
+    assert time.monotonic() - start < 1.0
+    # The expired request left the queue, so the next one gets straight in
+    assert scheduler.stats()["waiting"] == 0
+    with deadline(0.5):
+        with scheduler.slot(URL):
+            pass
+
+
+def test_rate_limit_wait_bounded_by_deadline():
+    scheduler = RequestScheduler(host_rates={"site.api.espn.com": (0.1, 1)})
+    with scheduler.slot(URL):
+        pass
+    start = time.monotonic()
+    try:
+        with deadline(0.5):
+            with scheduler.slot(URL):
+                raise AssertionError("slot granted 10 s before the bucket refills")
+    except DeadlineExceeded:
+        pass
+    assert time.monotonic() - start < 0.5
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_waits_and_refund():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    bucket.refund()
+    assert bucket.reserve() == 1.0
+    clock.now += 10
+    # Refilled, but never beyond the burst size
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+
+def test_rate_limited_slot_refunds_token_at_deadline():
+    clock = FakeClock()
+    scheduler = RequestScheduler(host_rates={"site.api.espn.com": (1.0, 1)}, clock=clock)
+    with scheduler.slot(URL):
+        pass
+    for _ in range(3):
+        try:
+            with deadline(0.5):
+                with scheduler.slot(URL):
+                    raise AssertionError("slot granted a second before the bucket refills")
+        except DeadlineExceeded:
+            pass
+    # The failed attempts gave their tokens back: the wait is still one token's worth
+    bucket = scheduler._bucket("site.api.espn.com")
+    assert bucket.reserve() == 1.0
+    assert scheduler.stats()["rate_limited"] == 0
+    # With time to spare the request just waits for its token
+    clock.now += 1.0
+    with deadline(5):
+        with scheduler.slot(URL):
+            pass
+
+
+def response(text):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = text.encode("utf-8")
+    return resp
+
+
+class ScriptedTransport:
+    """Answers call n after delays[n] seconds, recording when each call started"""
+
+    def __init__(self, *delays):
+        self.delays = list(delays)
+        self.started = []
+        self.finished = []
+        self.lock = threading.Lock()
+
+    def __call__(self, url, timeout=None, **kwargs):
+        with self.lock:
+            n = len(self.started)
+            self.started.append(time.monotonic())
+        time.sleep(self.delays[n])
+        with self.lock:
+            self.finished.append(n)
+        return response(f"call {n}")
+
+
+def hedging_client(transport, p95=0.15):
+    client = HttpClient()
+    client.send = transport
+    # Enough samples for the hedge delay to be the endpoint's p95
+    for _ in range(20):
+        client.latency.record("scoreboard", p95)
+    return client
+
+
+def test_hedge_fires_after_delay_and_drops_loser():
+    transport = ScriptedTransport(1.0, 0.01)
+    client = hedging_client(transport)
+    start = time.monotonic()
+    resp = client.get(URL)
+    elapsed = time.monotonic() - start
+    client.close()
+    assert resp.text == "call 1"
+    assert len(transport.started) == 2
+    # The duplicate went out only once the delay had passed
+    assert transport.started[1] - transport.started[0] >= 0.14
+    assert elapsed < 0.9
+    assert client.hedge_stats() == {"hedged": 1, "hedge_wins": 1}
+
+
+def test_fast_request_not_hedged():
+    transport = ScriptedTransport(0.01)
+    client = hedging_client(transport)
+    assert client.get(URL).text == "call 0"
+    time.sleep(0.3)
+    client.close()
+    assert len(transport.started) == 1
+    assert client.hedge_stats() == {"hedged": 0, "hedge_wins": 0}
+
+
+def test_hedged_send_gives_up_at_deadline_while_queued():
+    transport = ScriptedTransport(0.01)
+    client = hedging_client(transport)
+    client.scheduler = RequestScheduler(max_in_flight=1)
+    holding, release = threading.Event(), threading.Event()
+
+    def hold_slot():
+        with client.scheduler.slot(URL):
+            holding.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_slot)
+    holder.start()
+    holding.wait(5)
+    start = time.monotonic()
+    try:
+        with deadline(0.2):
+            client.get(URL)
+        raise AssertionError("request sent while the only slot was held")
+    except DeadlineExceeded:
+        pass
+    finally:
+        release.set()
+        holder.join()
+        client.close()
+    assert time.monotonic() - start < 1.0
+    assert transport.started == []
+
+
+if __name__ == "__main__":
+    test_queue_wait_bounded_by_deadline()
+    test_rate_limit_wait_bounded_by_deadline()
+    test_token_bucket_waits_and_refund()
+    test_rate_limited_slot_refunds_token_at_deadline()
+    test_hedge_fires_after_delay_and_drops_loser()
+    test_fast_request_not_hedged()
+    test_hedged_send_gives_up_at_deadline_while_queued()
+    print("ok")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Per half-inning scores from ScoreTimeline on the captured MLB summaries.
+
+The runs each half inning adds must match the linescores in the summary
+header (including a two-run homer and two scoring plays in one half), and
+a timeline grown through incremental PlayLog ingests must match one built
+from the full play list.
+
+Usage:
+    python TheBench/test_score_timeline.py   (or: python -m pytest TheBench/test_score_timeline.py)
+"""
+
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.play_log import PlayLog
+from services.score_timeline import ScoreTimeline
+
+CAPTURE_DIR = os.path.join(ROOT_DIR, "TheBench", "api_exploration")
+GAMES = ("401696636", "401696637")
+
+
+def load_summary(game_id):
+    with open(os.path.join(CAPTURE_DIR, f"game_details_{game_id}.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def linescores(summary):
+    """{"away"/"home": [runs per inning]} from the header"""
+    competitors = summary["header"]["competitions"][0]["competitors"]
+    return {team["homeAway"]: [int(line["displayValue"]) for line in team["linescores"]] for team in competitors}
+
+
+def half_runs(timeline, half):
+    """Runs scored in each inning's top (away) or bottom (home) half"""
+    runs = {}
+    for segment in timeline.segments.values():
+        inning, _, kind = segment.key.partition("_")
+        if kind == half:
+            runs[inning] = segment.away_runs if half == "top" else segment.home_runs
+    return list(runs.values())
+
+
+def test_half_inning_runs_match_linescores():
+    for game_id in GAMES:
+        summary = load_summary(game_id)
+        timeline = ScoreTimeline.from_plays(summary["plays"])
+        lines = linescores(summary)
+        assert half_runs(timeline, "top") == lines["away"], game_id
+        # A walk-off or a home team ahead after the top of the 9th leaves the last bottom half short
+        assert half_runs(timeline, "bottom")[:len(lines["home"])] == lines["home"], game_id
+        assert timeline.final() == (sum(lines["away"]), sum(lines["home"])), game_id
+
+
+def test_half_inning_closing_scores():
+    timeline = ScoreTimeline.from_plays(load_summary("401696637")["plays"])
+    closing = {key: (segment.away, segment.home) for key, segment in timeline.segments.items()}
+    assert closing["3rd Inning_bottom"] == (0, 2)
+    assert closing["7th Inning_top"] == (2, 2)
+    assert closing["10th Inning_bottom"] == (3, 3)
+    assert closing["11th Inning_bottom"] == (3, 4)
+
+
+def test_multi_run_plays():
+    timeline = ScoreTimeline.from_plays(load_summary("401696636")["plays"])
+    second_top = timeline.segment("2nd Inning_top")
+    changes = [change for change in timeline.changes if second_top.start <= change.index < second_top.end]
+    # Two-run homer, then a sacrifice fly in the same half
+    assert [(change.away_runs, change.home_runs) for change in changes] == [(2, 0), (1, 0)]
+    assert changes[0].text.startswith("Thomas homered")
+    assert timeline.score_at(changes[0].index) == (2, 0)
+    assert (second_top.away_runs, second_top.away) == (3, 3)
+
+
+def test_incremental_ingest_matches_full_build():
+    for game_id in GAMES:
+        plays = load_summary(game_id)["plays"]
+        full = ScoreTimeline.from_plays(plays)
+        log = PlayLog(game_id)
+        # Refreshes cutting through half innings and at-bats
+        for end in range(37, len(plays), 53):
+            log.ingest(plays[:end])
+        log.ingest(plays)
+        grown = log.timeline
+        assert log.stats["resets"] == 0
+        assert list(grown.away) == list(full.away) and list(grown.home) == list(full.home), game_id
+        assert ([(s.key, s.start, s.end, s.away, s.home, s.away_runs, s.home_runs) for s in grown.segments.values()]
+                == [(s.key, s.start, s.end, s.away, s.home, s.away_runs, s.home_runs) for s in full.segments.values()])
+        assert ([(c.index, c.away_runs, c.home_runs, c.text) for c in grown.changes]
+                == [(c.index, c.away_runs, c.home_runs, c.text) for c in full.changes]), game_id
+
+
+if __name__ == "__main__":
+    test_half_inning_runs_match_linescores()
+    test_half_inning_closing_scores()
+    test_multi_run_plays()
+    test_incremental_ingest_matches_full_build()
+    print("ok")
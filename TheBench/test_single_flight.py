@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Single-flight coalescing under concurrent identical calls.
+
+N threads calling a coalesced function with the same arguments while the
+first call is still running must run it once, count N-1 deduplicated calls,
+and each get a result of their own: a caller updating the returned game
+dicts in place (as the live view does) must not change anyone else's.
+
+Usage:
+    python TheBench/test_single_flight.py   (or: python -m pytest TheBench/test_single_flight.py)
+"""
+
+import os
+import sys
+import threading
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services import single_flight
+from services.single_flight import SingleFlight, coalesce, normalize_url
+
+CALLERS = 8
+
+
+def wait_for(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end, "timed out"
+        time.sleep(0.001)
+
+
+def run_concurrently(call, flights):
+    """Start CALLERS threads on call, releasing the leader once all the others have joined it"""
+    release = threading.Event()
+    results = [None] * CALLERS
+    errors = [None] * CALLERS
+    before = flights.stats()["deduplicated"]
+
+    def worker(n):
+        try:
+            results[n] = call(release)
+        except Exception as e:
+            errors[n] = e
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: flights.stats()["deduplicated"] - before == CALLERS - 1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+
+def test_concurrent_calls_run_once():
+    executions = []
+
+    @coalesce
+    def live_games(league, release=None):
+        executions.append(league)
+        release.wait(5)
+        return [{"id": "1", "league": league, "recent_play": "Single", "details_skipped": True}]
+
+    before = single_flight.stats()
+    # Every caller passes the same release event, which is part of the key
+    results, errors = run_concurrently(lambda release: live_games("MLB", release=release),
+                                       single_flight._function_flights)
+    after = single_flight.stats()
+
+    assert errors == [None] * CALLERS
+    assert executions == ["MLB"]
+    assert after["calls"] - before["calls"] == CALLERS
+    assert after["executed"] - before["executed"] == 1
+    assert after["deduplicated"] - before["deduplicated"] == CALLERS - 1
+
+    # Equal results, but no two callers share a list or a game dict
+    assert all(result == results[0] for result in results)
+    assert len({id(result) for result in results}) == CALLERS
+    assert len({id(result[0]) for result in results}) == CALLERS
+    results[0][0].pop("details_skipped")
+    results[1][0]["recent_play"] = "Home run"
+    assert all(result[0]["details_skipped"] and result[0]["recent_play"] == "Single" for result in results[2:])
+
+
+def test_errors_reach_every_caller():
+    flights = SingleFlight()
+
+    def failing(release):
+        release.wait(5)
+        raise ValueError("bad payload")
+
+    results, errors = run_concurrently(lambda release: flights.do("key", failing, release), flights)
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert flights.stats() == {"calls": CALLERS, "executed": 1, "deduplicated": CALLERS - 1}
+
+
+def test_unshared_result_not_copied():
+    flights = SingleFlight(copy_result=lambda result: AssertionError("copied"))
+    result = {"id": "1"}
+    assert flights.do("key", lambda: result) is result
+    # Finished flights aren't reused
+    assert flights.do("key", lambda: {"id": "2"}) == {"id": "2"}
+    assert flights.stats() == {"calls": 2, "executed": 2, "deduplicated": 0}
+
+
+def test_normalize_url():
+    url = "https://Site.API.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
+    assert normalize_url(url, {"limit": 50, "dates": "20250101"}) == normalize_url(url + "?dates=20250101&limit=50")
+    assert normalize_url(url + "#frag").startswith("https://site.api.espn.com/")
+
+
+if __name__ == "__main__":
+    test_concurrent_calls_run_once()
+    test_errors_reach_every_caller()
+    test_unshared_result_not_copied()
+    test_normalize_url()
+    print("ok")
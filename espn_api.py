@@ -1,5 +1,10 @@
 import requests
 
+from services import http_client, json_codec, play_log
+from services.deadline import propagate
+from services.request_scheduler import Priority, at_priority, current_priority
+from services.single_flight import coalesce
+
 BASE_URL = "https://site.api.espn.com/apis/site/v2/sports"
 
 LEAGUES = {
@@ -14,9 +19,10 @@ LEAGUES = {
     # Add more as needed
 }
 
+@coalesce
 def get_team_schedule(league_key, team_id, days_ahead=30, days_behind=30, season=None):
     """Get a team's complete schedule using the dedicated team schedule endpoint"""
-    from datetime import datetime, timedelta
+    from datetime import datetime
     
     league_path = LEAGUES.get(league_key)
     if not league_path:
@@ -26,6 +32,45 @@ def get_team_schedule(league_key, team_id, days_ahead=30, days_behind=30, season
     current_year = datetime.now().year
     is_historical_season = season is not None and season != current_year
     
+    url, uses_team_endpoint = _team_schedule_url(league_key, team_id, days_ahead, days_behind, season)
+    if not uses_team_endpoint:
+        return parse_schedule_from_api(url, team_id, datetime.now(), season)
+    
+    try:
+        resp = http_client.get(url)
+        if resp.status_code != 200:
+            return []
+            
+        data = json_codec.response_json(resp)
+        events = data.get('events', [])
+        
+        # NCAAF fallback: if current year has no games, try previous year with seasontype=2
+        if league_key == "NCAAF" and len(events) == 0:
+            fallback_url = _ncaaf_fallback_schedule_url(team_id)
+            try:
+                fallback_resp = http_client.get(fallback_url)
+                if fallback_resp.status_code == 200:
+                    fallback_data = json_codec.response_json(fallback_resp)
+                    events = fallback_data.get('events', [])
+            except:
+                pass  # If fallback fails, continue with empty events
+        
+        return _parse_team_schedule_events(events, team_id, is_historical_season)
+        
+    except Exception as e:
+        print(f"Error fetching team schedule: {e}")
+        return []
+
+def _team_schedule_url(league_key, team_id, days_ahead=30, days_behind=30, season=None):
+    """Return (url, uses_team_endpoint) for a team's schedule
+    
+    Major sports use the dedicated team schedule endpoint; other leagues fall
+    back to a scoreboard date range that must be filtered by team.
+    """
+    from datetime import datetime, timedelta
+    
+    league_path = LEAGUES.get(league_key)
+    
     # Use dedicated team schedule endpoints for major sports
     if league_key in ["MLB", "NFL", "NBA", "NCAAF"]:
         base_url = f"{BASE_URL}/{league_path}/teams/{team_id}/schedule"
@@ -49,139 +94,124 @@ def get_team_schedule(league_key, team_id, days_ahead=30, days_behind=30, season
                 url = f"{base_url}?season={season}"
             else:
                 url = base_url
-    else:
-        # For other leagues, fall back to the date range approach
-        today = datetime.now()
-        start_date = today - timedelta(days=days_behind)
-        end_date = today + timedelta(days=days_ahead)
-        start_str = start_date.strftime("%Y%m%d")
-        end_str = end_date.strftime("%Y%m%d")
-        url = f"{BASE_URL}/{league_path}/scoreboard?dates={start_str}-{end_str}"
-        return parse_schedule_from_api(url, team_id, datetime.now(), season)
+        return url, True
+    
+    # For other leagues, fall back to the date range approach
+    today = datetime.now()
+    start_date = today - timedelta(days=days_behind)
+    end_date = today + timedelta(days=days_ahead)
+    start_str = start_date.strftime("%Y%m%d")
+    end_str = end_date.strftime("%Y%m%d")
+    return f"{BASE_URL}/{league_path}/scoreboard?dates={start_str}-{end_str}", False
+
+def _ncaaf_fallback_schedule_url(team_id):
+    """Previous regular season schedule for NCAAF teams with no games this year"""
+    from datetime import datetime
+    previous_year = datetime.now().year - 1
+    return f"{BASE_URL}/{LEAGUES['NCAAF']}/teams/{team_id}/schedule?season={previous_year}&seasontype=2"
+
+def _parse_team_schedule_events(events, team_id, is_historical_season=False):
+    """Parse team schedule endpoint events into schedule rows"""
+    from datetime import datetime
     
-    try:
-        resp = requests.get(url)
-        if resp.status_code != 200:
-            return []
-            
-        data = resp.json()
-        events = data.get('events', [])
-        
-        # NCAAF fallback: if current year has no games, try previous year with seasontype=2
-        if league_key == "NCAAF" and len(events) == 0:
-            from datetime import datetime
-            previous_year = datetime.now().year - 1
-            fallback_url = f"{BASE_URL}/{league_path}/teams/{team_id}/schedule?season={previous_year}&seasontype=2"
+    schedule = []
+    today = datetime.now()
+    
+    for event in events:
+        # Parse event date
+        event_date_str = event.get('date', '')
+        if event_date_str:
             try:
-                fallback_resp = requests.get(fallback_url)
-                if fallback_resp.status_code == 200:
-                    fallback_data = fallback_resp.json()
-                    events = fallback_data.get('events', [])
+                event_date = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
+                event_date = event_date.replace(tzinfo=None)
             except:
-                pass  # If fallback fails, continue with empty events
-        
-        schedule = []
-        today = datetime.now()
-        
-        for event in events:
-            # Parse event date
-            event_date_str = event.get('date', '')
-            if event_date_str:
-                try:
-                    event_date = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
-                    event_date = event_date.replace(tzinfo=None)
-                except:
-                    continue
-            else:
-                continue
-                
-            # Get competition data
-            competitions = event.get('competitions', [])
-            if not competitions:
                 continue
-                
-            comp = competitions[0]
-            competitors = comp.get('competitors', [])
+        else:
+            continue
             
-            # Find home and away teams
-            home_team = away_team = None
-            home_score = away_score = ''
+        # Get competition data
+        competitions = event.get('competitions', [])
+        if not competitions:
+            continue
             
-            for competitor in competitors:
-                team_info = competitor.get('team', {})
-                if competitor.get('homeAway') == 'home':
-                    home_team = team_info.get('displayName', 'Unknown')
-                    score_data = competitor.get('score', '')
-                    if isinstance(score_data, dict):
-                        home_score = score_data.get('displayValue', '')
-                    else:
-                        home_score = str(score_data) if score_data else ''
+        comp = competitions[0]
+        competitors = comp.get('competitors', [])
+        
+        # Find home and away teams
+        home_team = away_team = None
+        home_score = away_score = ''
+        
+        for competitor in competitors:
+            team_info = competitor.get('team', {})
+            if competitor.get('homeAway') == 'home':
+                home_team = team_info.get('displayName', 'Unknown')
+                score_data = competitor.get('score', '')
+                if isinstance(score_data, dict):
+                    home_score = score_data.get('displayValue', '')
                 else:
-                    away_team = team_info.get('displayName', 'Unknown')
-                    score_data = competitor.get('score', '')
-                    if isinstance(score_data, dict):
-                        away_score = score_data.get('displayValue', '')
-                    else:
-                        away_score = str(score_data) if score_data else ''
-            
-            # Determine if this is home or away for our team
-            team_name = None
-            is_home = False
-            for competitor in competitors:
-                if competitor.get('team', {}).get('id') == team_id:
-                    team_name = competitor.get('team', {}).get('displayName', 'Unknown')
-                    is_home = competitor.get('homeAway') == 'home'
-                    break
-                    
-            if not team_name:
-                continue
-                
-            opponent = away_team if is_home else home_team
-            home_away = 'vs' if is_home else '@'
-            
-            # Get game status
-            status = comp.get('status', {})
-            status_type = status.get('type', {})
-            game_status = status_type.get('description', 'Unknown')
-            
-            # Get start time
-            start_time = 'TBD'
-            if 'shortDetail' in status_type:
-                start_time = status_type['shortDetail']
-            elif 'detail' in status_type:
-                start_time = status_type['detail']
-            
-            # Get venue
-            venue = comp.get('venue', {})
-            venue_name = venue.get('fullName', 'TBD')
-            
-            # Determine date display format - include year for historical seasons
-            if is_historical_season:
-                date_display = event_date.strftime('%a, %b %d, %Y')
+                    home_score = str(score_data) if score_data else ''
             else:
-                date_display = event_date.strftime('%a, %b %d')
-            
-            schedule.append({
-                'date': event_date.strftime('%Y-%m-%d'),
-                'date_display': date_display,
-                'opponent': opponent,
-                'home_away': home_away,
-                'time': start_time,
-                'status': game_status,
-                'venue': venue_name,
-                'home_score': home_score,
-                'away_score': away_score,
-                'game_id': event.get('id', ''),
-                'is_today': event_date.date() == today.date()
-            })
+                away_team = team_info.get('displayName', 'Unknown')
+                score_data = competitor.get('score', '')
+                if isinstance(score_data, dict):
+                    away_score = score_data.get('displayValue', '')
+                else:
+                    away_score = str(score_data) if score_data else ''
+        
+        # Determine if this is home or away for our team
+        team_name = None
+        is_home = False
+        for competitor in competitors:
+            if competitor.get('team', {}).get('id') == team_id:
+                team_name = competitor.get('team', {}).get('displayName', 'Unknown')
+                is_home = competitor.get('homeAway') == 'home'
+                break
+                
+        if not team_name:
+            continue
             
-        # Sort by date
-        schedule.sort(key=lambda x: x['date'])
-        return schedule
+        opponent = away_team if is_home else home_team
+        home_away = 'vs' if is_home else '@'
         
-    except Exception as e:
-        print(f"Error fetching team schedule: {e}")
-        return []
+        # Get game status
+        status = comp.get('status', {})
+        status_type = status.get('type', {})
+        game_status = status_type.get('description', 'Unknown')
+        
+        # Get start time
+        start_time = 'TBD'
+        if 'shortDetail' in status_type:
+            start_time = status_type['shortDetail']
+        elif 'detail' in status_type:
+            start_time = status_type['detail']
+        
+        # Get venue
+        venue = comp.get('venue', {})
+        venue_name = venue.get('fullName', 'TBD')
+        
+        # Determine date display format - include year for historical seasons
+        if is_historical_season:
+            date_display = event_date.strftime('%a, %b %d, %Y')
+        else:
+            date_display = event_date.strftime('%a, %b %d')
+        
+        schedule.append({
+            'date': event_date.strftime('%Y-%m-%d'),
+            'date_display': date_display,
+            'opponent': opponent,
+            'home_away': home_away,
+            'time': start_time,
+            'status': game_status,
+            'venue': venue_name,
+            'home_score': home_score,
+            'away_score': away_score,
+            'game_id': event.get('id', ''),
+            'is_today': event_date.date() == today.date()
+        })
+        
+    # Sort by date
+    schedule.sort(key=lambda x: x['date'])
+    return schedule
 
 def get_mlb_full_season_schedule(league_path, team_id, today):
     """Get full MLB season using monthly API calls to avoid 100-event limit"""
@@ -220,192 +250,331 @@ def parse_schedule_from_api(url, team_id, today, season=None):
     current_year = datetime.now().year
     is_historical_season = season is not None and season != current_year
     
-    schedule = []
-    
     try:
-        resp = requests.get(url)
+        resp = http_client.get(url)
         if resp.status_code == 200:
-            data = resp.json()
-            events = data.get("events", [])
-            
-            for event in events:
-                competitions = event.get("competitions", [])
-                if not competitions:
-                    continue
-                
-                comp = competitions[0]
-                competitors = comp.get("competitors", [])
-                
-                # Check if this team is playing
-                team_playing = False
-                home_team = away_team = None
-                home_score = away_score = ""
-                
-                for competitor in competitors:
-                    team_info = competitor.get("team", {})
-                    if team_info.get("id") == team_id:
-                        team_playing = True
-                    
-                    if competitor.get("homeAway") == "home":
-                        home_team = team_info.get("displayName", "Unknown")
-                        score_data = competitor.get("score", "")
-                        if isinstance(score_data, dict):
-                            home_score = score_data.get("displayValue", "")
-                        else:
-                            home_score = str(score_data) if score_data else ""
-                    else:
-                        away_team = team_info.get("displayName", "Unknown")
-                        score_data = competitor.get("score", "")
-                        if isinstance(score_data, dict):
-                            away_score = score_data.get("displayValue", "")
-                        else:
-                            away_score = str(score_data) if score_data else ""
-                
-                if team_playing:
-                    # Parse event date
-                    event_date_str = event.get("date", "")
-                    if event_date_str:
-                        try:
-                            event_date = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
-                            event_date = event_date.replace(tzinfo=None)
-                        except:
-                            event_date = today
-                    else:
-                        event_date = today
-                    
-                    # Get game details
-                    status = comp.get("status", {})
-                    status_type = status.get("type", {})
-                    game_status = status_type.get("description", "Unknown")
-                    
-                    # Get start time
-                    start_time = "TBD"
-                    if "shortDetail" in status_type:
-                        start_time = status_type["shortDetail"]
-                    elif "detail" in status_type:
-                        start_time = status_type["detail"]
-                    
-                    # Get venue
-                    venue = comp.get("venue", {})
-                    venue_name = venue.get("fullName", "TBD")
-                    
-                    # Determine date display format - include year for historical seasons
-                    if is_historical_season:
-                        date_display = event_date.strftime("%a, %b %d, %Y")
-                    else:
-                        date_display = event_date.strftime("%a, %b %d")
-                    
-                    schedule.append({
-                        "date": event_date.strftime("%Y-%m-%d"),
-                        "date_display": date_display,
-                        "opponent": away_team if home_team and team_id in [c.get("team", {}).get("id") for c in competitors if c.get("homeAway") == "home"] else home_team,
-                        "home_away": "vs" if any(c.get("homeAway") == "home" and c.get("team", {}).get("id") == team_id for c in competitors) else "@",
-                        "time": start_time,
-                        "status": game_status,
-                        "venue": venue_name,
-                        "home_score": home_score,
-                        "away_score": away_score,
-                        "game_id": event.get("id", ""),
-                        "is_today": event_date.date() == today.date()
-                    })
+            return _parse_scoreboard_schedule(json_codec.response_json(resp), team_id, today, is_historical_season)
         
     except Exception as e:
         print(f"Error fetching schedule from {url}: {e}")
     
+    return []
+
+def _parse_scoreboard_schedule(data, team_id, today, is_historical_season=False):
+    """Filter scoreboard events down to one team's schedule rows"""
+    from datetime import datetime
+    
+    schedule = []
+    events = data.get("events", [])
+    
+    for event in events:
+        competitions = event.get("competitions", [])
+        if not competitions:
+            continue
+        
+        comp = competitions[0]
+        competitors = comp.get("competitors", [])
+        
+        # Check if this team is playing
+        team_playing = False
+        home_team = away_team = None
+        home_score = away_score = ""
+        
+        for competitor in competitors:
+            team_info = competitor.get("team", {})
+            if team_info.get("id") == team_id:
+                team_playing = True
+            
+            if competitor.get("homeAway") == "home":
+                home_team = team_info.get("displayName", "Unknown")
+                score_data = competitor.get("score", "")
+                if isinstance(score_data, dict):
+                    home_score = score_data.get("displayValue", "")
+                else:
+                    home_score = str(score_data) if score_data else ""
+            else:
+                away_team = team_info.get("displayName", "Unknown")
+                score_data = competitor.get("score", "")
+                if isinstance(score_data, dict):
+                    away_score = score_data.get("displayValue", "")
+                else:
+                    away_score = str(score_data) if score_data else ""
+        
+        if team_playing:
+            # Parse event date
+            event_date_str = event.get("date", "")
+            if event_date_str:
+                try:
+                    event_date = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
+                    event_date = event_date.replace(tzinfo=None)
+                except:
+                    event_date = today
+            else:
+                event_date = today
+            
+            # Get game details
+            status = comp.get("status", {})
+            status_type = status.get("type", {})
+            game_status = status_type.get("description", "Unknown")
+            
+            # Get start time
+            start_time = "TBD"
+            if "shortDetail" in status_type:
+                start_time = status_type["shortDetail"]
+            elif "detail" in status_type:
+                start_time = status_type["detail"]
+            
+            # Get venue
+            venue = comp.get("venue", {})
+            venue_name = venue.get("fullName", "TBD")
+            
+            # Determine date display format - include year for historical seasons
+            if is_historical_season:
+                date_display = event_date.strftime("%a, %b %d, %Y")
+            else:
+                date_display = event_date.strftime("%a, %b %d")
+            
+            schedule.append({
+                "date": event_date.strftime("%Y-%m-%d"),
+                "date_display": date_display,
+                "opponent": away_team if home_team and team_id in [c.get("team", {}).get("id") for c in competitors if c.get("homeAway") == "home"] else home_team,
+                "home_away": "vs" if any(c.get("homeAway") == "home" and c.get("team", {}).get("id") == team_id for c in competitors) else "@",
+                "time": start_time,
+                "status": game_status,
+                "venue": venue_name,
+                "home_score": home_score,
+                "away_score": away_score,
+                "game_id": event.get("id", ""),
+                "is_today": event_date.date() == today.date()
+            })
+    
     return schedule
+
+# Upper bound on concurrent events/summary fetches during a live refresh
+LIVE_FANOUT_WORKERS = 16
+# How often a streaming live refresh checks whether it was cancelled
+LIVE_CANCEL_CHECK_SECONDS = 0.2
+
+@coalesce
 def get_live_scores_all_sports():
     """Get all live games from all supported sports using hybrid approach for speed and detail"""
+    by_league = dict(iter_live_scores_all_sports())
+    # Keep the LEAGUES order callers are used to
     live_games = []
-    
-    for league_key in LEAGUES.keys():
-        try:
-            # Use the fast events endpoint to identify live games first
-            league_path = LEAGUES.get(league_key)
-            if not league_path:
-                continue
-                
-            # Fast events endpoint - get live games list quickly
-            url = f"{BASE_URL}/{league_path}/events"
-            resp = requests.get(url)
-            if resp.status_code != 200:
-                continue
-                
-            data = resp.json()
-            events = data.get("events", [])
-            
-            for event in events:
-                # Check if the event is currently live
-                status = event.get("fullStatus", {})
-                if not status:
-                    continue
-                    
-                type_info = status.get("type", {})
-                
-                # Check for live status
-                state = type_info.get("state", "").lower()
-                description = type_info.get("description", "").lower()
-                
-                is_live = state == "in" or "progress" in description
-                
-                if is_live:
-                    # Extract basic game information
-                    game_id = event.get("id", "")
-                    
-                    # Extract team information from competitors
-                    competitors = event.get("competitors", [])
-                    teams = []
-                    team_names = []
-                    
-                    for competitor in competitors:
-                        score = competitor.get("score", "0")
-                        team_name = competitor.get("displayName", competitor.get("abbreviation", "Unknown"))
-                        team_names.append(team_name)
-                        
-                        teams.append({
-                            "name": team_name,
-                            "score": str(score)
-                        })
-                    
-                    # Create game name from team names
-                    if len(team_names) >= 2:
-                        game_name = f"{team_names[0]} at {team_names[1]}"
-                    else:
-                        game_name = event.get("name", "Unknown Game")
-                    
-                    # Extract basic status information
-                    status_text = type_info.get("shortDetail", type_info.get("detail", "In Progress"))
-                    
-                    # Now get detailed play information for live games only
-                    recent_play = status_text  # Default fallback
+    for league_key in LEAGUES:
+        live_games.extend(by_league.get(league_key) or [])
+    return live_games
+
+def iter_live_scores_all_sports(max_workers=LIVE_FANOUT_WORKERS, leagues=None, needs_details=None, cancelled=None,
+                                tiered=False):
+    """Yield (league_key, live games) for every league as soon as that league is complete.
+
+    All leagues' events are fetched concurrently, then each live game's
+    summary, so a slow league never holds back the others. Leagues without
+    live games yield an empty list; a league whose fetch failed yields None,
+    so callers can keep what they last showed instead of clearing it.
+
+    leagues limits the poll to a subset of LEAGUES. needs_details(game) -> bool
+    lets an adaptive poller skip summaries that aren't due; those games keep
+    their basic status (plus scoreboard situation where available) and are
+    flagged with details_skipped.
+
+    tiered builds every row from the league's scoreboard situation (one
+    request per live league) and fetches a summary only for games that
+    needs_details accepts, e.g. monitored or focused ones.
+
+    Setting the cancelled event stops the iteration and drops queued requests.
+    """
+    import concurrent.futures
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    # Worker threads inherit the caller's deadline and priority
+    def wrap(func):
+        return propagate(at_priority(current_priority(), func))
+
+    try:
+        pending = {executor.submit(wrap(_fetch_live_league), league_key, tiered): ("league", league_key)
+                   for league_key in (LEAGUES if leagues is None else leagues)}
+        games_by_league = {}
+        outstanding = {}
+
+        while pending:
+            done, _ = concurrent.futures.wait(pending, timeout=LIVE_CANCEL_CHECK_SECONDS,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            if cancelled is not None and cancelled.is_set():
+                return
+            for future in done:
+                kind, league_key = pending.pop(future)
+                if kind == "league":
                     try:
-                        # This is the key: only call detailed API for confirmed live games
-                        game_details = get_game_details(league_key, game_id)
-                        detailed_play = extract_recent_play(game_details, league_key)
-                        if detailed_play and len(detailed_play.strip()) > len(status_text.strip()):
-                            # Use detailed play if it's more informative than basic status
-                            recent_play = detailed_play
+                        games, scoreboard_events = future.result()
                     except Exception as e:
-                        # If detailed call fails, continue with basic status
-                        print(f"Failed to get details for {game_name}: {e}")
-                        pass
-                    
-                    game = {
-                        "id": game_id,
-                        "name": game_name,
-                        "league": league_key,
-                        "status": status_text,
-                        "teams": teams,
-                        "recent_play": recent_play
-                    }
-                    
-                    live_games.append(game)
-                    
-        except Exception as e:
-            # Continue with other leagues if one fails
-            print(f"Error fetching live scores for {league_key}: {e}")
+                        # Continue with other leagues if one fails
+                        print(f"Error fetching live scores for {league_key}: {e}")
+                        games, scoreboard_events = None, None
+                    games_by_league[league_key] = games
+                    outstanding[league_key] = len(games or [])
+                    # Only call detailed API for confirmed live games
+                    for game in games or []:
+                        future = executor.submit(wrap(_add_live_game_details), game, scoreboard_events,
+                                                 needs_details, tiered)
+                        pending[future] = ("game", league_key)
+                else:
+                    outstanding[league_key] -= 1
+
+                if outstanding[league_key] == 0:
+                    del outstanding[league_key]
+                    yield league_key, games_by_league.pop(league_key)
+    finally:
+        # A consumer that stops early shouldn't wait for the remaining requests
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _fetch_live_league(league_key, tiered=False):
+    """Live games of one league from the fast events endpoint, plus its scoreboard index if needed"""
+    url = _live_events_url(league_key)
+    if not url:
+        return [], None
+    resp = http_client.get(url)
+    if resp.status_code != 200:
+        # Failed, not empty: the caller reports it as None
+        print(f"Error fetching live scores for {league_key}: HTTP {resp.status_code}")
+        return None, None
+    games = _parse_live_events(json_codec.response_json(resp), league_key)
+
+    # One scoreboard fetch per refresh supplies the situation for every live game
+    scoreboard_events = None
+    if games and (tiered or league_key in SITUATION_FROM_SCOREBOARD):
+        scoreboard_events = get_scoreboard_index(league_key)
+    return games, scoreboard_events
+
+def _add_live_game_details(game, scoreboard_events=None, needs_details=None, tiered=False):
+    """Fill in a live game's recent play from its summary (basic status is kept on failure)"""
+    if tiered:
+        # List rows come from the compact scoreboard situation alone
+        if not _apply_scoreboard_situation(game, scoreboard_events):
+            game["details_skipped"] = True
+        if needs_details is None or not needs_details(game):
+            return
+    elif needs_details is not None and not needs_details(game):
+        # No summary this time; the scoreboard alone still gives MLB its situation
+        if not _apply_scoreboard_situation(game, scoreboard_events):
+            game["details_skipped"] = True
+        return
+    try:
+        game_details = get_game_details(game["league"], game["id"], sections=json_codec.LIVE_SECTIONS)
+        _apply_recent_play(game, game_details, scoreboard_events)
+    except Exception as e:
+        print(f"Failed to get details for {game['name']}: {e}")
+
+# Leagues whose live situation (count, outs, runners) is only on the scoreboard
+SITUATION_FROM_SCOREBOARD = ("MLB",)
+
+def _live_scoreboard_url(league_key):
+    league_path = LEAGUES.get(league_key)
+    if not league_path:
+        return None
+    return f"{BASE_URL}/{league_path}/scoreboard"
+
+def _index_scoreboard_events(data):
+    """Map event id -> scoreboard event"""
+    return {str(event.get('id')): event for event in data.get('events', []) if event.get('id')}
+
+def get_scoreboard_index(league_key):
+    """Today's scoreboard events keyed by id ({} if unavailable)"""
+    url = _live_scoreboard_url(league_key)
+    if not url:
+        return {}
+    resp = http_client.get(url)
+    if resp.status_code != 200:
+        return {}
+    return _index_scoreboard_events(json_codec.response_json(resp))
+
+def _live_events_url(league_key):
+    league_path = LEAGUES.get(league_key)
+    if not league_path:
+        return None
+    return f"{BASE_URL}/{league_path}/events"
+
+def _parse_live_events(data, league_key):
+    """Build live game rows from the events endpoint, skipping games not in progress"""
+    games = []
+    events = data.get("events", [])
+    
+    for event in events:
+        # Check if the event is currently live
+        status = event.get("fullStatus", {})
+        if not status:
             continue
+            
+        type_info = status.get("type", {})
+        
+        # Check for live status
+        state = type_info.get("state", "").lower()
+        description = type_info.get("description", "").lower()
+        
+        is_live = state == "in" or "progress" in description
+        if not is_live:
+            continue
+        
+        # Extract basic game information
+        game_id = event.get("id", "")
+        
+        # Extract team information from competitors
+        competitors = event.get("competitors", [])
+        teams = []
+        team_names = []
+        
+        for competitor in competitors:
+            score = competitor.get("score", "0")
+            team_name = competitor.get("displayName", competitor.get("abbreviation", "Unknown"))
+            team_names.append(team_name)
+            
+            teams.append({
+                "name": team_name,
+                "score": str(score)
+            })
+        
+        # Create game name from team names
+        if len(team_names) >= 2:
+            game_name = f"{team_names[0]} at {team_names[1]}"
+        else:
+            game_name = event.get("name", "Unknown Game")
+        
+        # Extract basic status information
+        status_text = type_info.get("shortDetail", type_info.get("detail", "In Progress"))
+        
+        games.append({
+            "id": game_id,
+            "name": game_name,
+            "league": league_key,
+            "status": status_text,
+            "period": status.get("period"),
+            "teams": teams,
+            "recent_play": status_text  # Default fallback until details are applied
+        })
     
-    return live_games
+    return games
+
+def _apply_scoreboard_situation(game, scoreboard_events):
+    """Set a live game's recent play from its scoreboard event; False if the scoreboard has nothing for it"""
+    event = (scoreboard_events or {}).get(str(game.get("id", "")))
+    if not event:
+        return False
+    situation = extract_scoreboard_situation(event, game.get("league"))
+    if not situation:
+        return False
+    if len(situation.strip()) > len(game.get("status", "").strip()):
+        game["recent_play"] = situation
+    game.pop("details_skipped", None)
+    return True
+
+def _apply_recent_play(game, game_details, scoreboard_events=None):
+    """Replace a live game's recent play with the detailed summary text when it is more informative"""
+    status_text = game.get("status", "")
+    detailed_play = extract_recent_play(game_details, game.get("league"), scoreboard_events)
+    if detailed_play and len(detailed_play.strip()) > len(status_text.strip()):
+        # Use detailed play if it's more informative than basic status
+        game["recent_play"] = detailed_play
 
 def extract_football_enhanced_display(game_details):
     """Extract enhanced football display with hybrid format (down/distance + drive stats + redzone)"""
@@ -631,8 +800,73 @@ def extract_baseball_enhanced_display(game_details):
         
     return None
 
-def extract_recent_play(game_details, league=None):
-    """Extract the most recent play from game details with enhanced player information"""
+def extract_football_scoreboard_display(event):
+    """Football row in the extract_football_enhanced_display format, from a scoreboard event's situation"""
+    try:
+        competition = event.get('competitions', [{}])[0]
+        competitors = competition.get('competitors', [])
+        situation = competition.get('situation', {})
+        if len(competitors) < 2 or not situation:
+            return None
+
+        home_team = competitors[0] if competitors[0].get('homeAway') == 'home' else competitors[1]
+        away_team = competitors[1] if competitors[1].get('homeAway') == 'away' else competitors[0]
+        home_name = home_team.get('team', {}).get('displayName', 'HOME')
+        away_name = away_team.get('team', {}).get('displayName', 'AWAY')
+        home_score = home_team.get('score', '0')
+        away_score = away_team.get('score', '0')
+
+        # Line 1: teams and scores, red zone flag on the team with the ball
+        possession = str(situation.get('possession', ''))
+        home_rz = " (RZ)" if situation.get('isRedZone') and possession == str(home_team.get('id', '')) else ""
+        away_rz = " (RZ)" if situation.get('isRedZone') and possession == str(away_team.get('id', '')) else ""
+        team_display = f"{away_name} {away_score}{away_rz} at {home_name} {home_score}{home_rz}"
+
+        last_play_text = situation.get('lastPlay', {}).get('text', '')
+        if last_play_text:
+            truncated_play = last_play_text[:60] + "..." if len(last_play_text) > 60 else last_play_text
+            team_display += f" | {truncated_play}"
+
+        # Line 2: clock | down & distance | ball on
+        line2_parts = []
+        status = competition.get('status', event.get('status', {}))
+        clock = status.get('displayClock', '')
+        period = status.get('period')
+        if clock and period:
+            line2_parts.append(f"{clock} {f'Q{period}' if period <= 4 else 'OT'}")
+        if situation.get('shortDownDistanceText'):
+            line2_parts.append(situation['shortDownDistanceText'])
+        if situation.get('possessionText'):
+            line2_parts.append(f"Ball on {situation['possessionText']}")
+
+        if line2_parts:
+            return f"{team_display}\n{' | '.join(line2_parts)}"
+        return team_display
+
+    except Exception as e:
+        print(f"Error extracting football scoreboard situation: {e}")
+
+    return None
+
+def extract_scoreboard_situation(event, league=None):
+    """Compact live situation for a list row from a scoreboard event (no summary needed)"""
+    if not event:
+        return None
+    if league == 'MLB':
+        return extract_baseball_enhanced_display(event)
+    if league in ['NFL', 'NCAAF']:
+        return extract_football_scoreboard_display(event)
+    # Other sports only carry the last play
+    situation = event.get('competitions', [{}])[0].get('situation', {})
+    last_play = situation.get('lastPlay', {}) if situation else {}
+    return last_play.get('text') or None
+
+def extract_recent_play(game_details, league=None, scoreboard_events=None):
+    """Extract the most recent play from game details with enhanced player information.
+
+    scoreboard_events is an optional {event id: scoreboard event} index from
+    get_scoreboard_index(); without it MLB games fetch the scoreboard themselves.
+    """
     if not game_details:
         return None
     
@@ -640,10 +874,11 @@ def extract_recent_play(game_details, league=None):
     if league in ['NFL', 'NCAAF']:
         return extract_football_enhanced_display(game_details)
     
-    # Enhanced baseball display for MLB - get fresh situation data
+    # Enhanced baseball display for MLB - situation data comes from the scoreboard
     if league == 'MLB':
-        # For baseball, we need to get situation data from the scoreboard endpoint
-        # since the summary endpoint doesn't include live situation data
+        # The summary endpoint doesn't include live situation data, so use the
+        # scoreboard event for this game (callers handling several games pass a
+        # pre-built index so the scoreboard is fetched once per refresh)
         game_id = None
         if 'header' in game_details and 'id' in game_details['header']:
             game_id = game_details['header']['id']
@@ -652,39 +887,24 @@ def extract_recent_play(game_details, league=None):
             
         if game_id:
             try:
-                # Get fresh situation data from scoreboard
-                scoreboard_url = f"https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
-                response = requests.get(scoreboard_url)
-                if response.status_code == 200:
-                    scoreboard_data = response.json()
-                    
-                    # Find our specific game in the scoreboard
-                    for event in scoreboard_data.get('events', []):
-                        if event.get('id') == str(game_id):
-                            # Found our game with potential situation data
-                            enhanced_display = extract_baseball_enhanced_display(event)
-                            if enhanced_display:
-                                return enhanced_display
-                            break
+                if scoreboard_events is None:
+                    scoreboard_events = get_scoreboard_index('MLB')
+                event = scoreboard_events.get(str(game_id))
+                if event:
+                    enhanced_display = extract_baseball_enhanced_display(event)
+                    if enhanced_display:
+                        return enhanced_display
             except Exception as e:
                 print(f"Failed to get baseball situation data: {e}")
         
         # Fallback to regular processing if situation data unavailable
         pass
     
-    # Build player ID to name mapping from rosters (if available)
-    player_names = {}
-    rosters = game_details.get("rosters", [])
-    for team_roster in rosters:
-        roster = team_roster.get("roster", [])
-        if roster:  # Only process if roster actually has players
-            for player in roster:
-                athlete = player.get("athlete", {})
-                player_id = athlete.get("id")
-                player_name = athlete.get("displayName", "")
-                if player_id and player_name:
-                    # Convert to string for consistent lookup
-                    player_names[str(player_id)] = player_name
+    # The game's play log keeps its roster id -> name mapping and only takes in new plays
+    header_id = game_details.get("header", {}).get("id") or game_details.get("id")
+    log = play_log.get_play_log(header_id) if header_id else play_log.PlayLog("")
+    player_names = log.player_names(game_details.get("rosters", []))
+    log.ingest(game_details.get("plays", []))
     
     # Check for situation data (for count and outs)
     situation = game_details.get("situation", {})
@@ -693,14 +913,14 @@ def extract_recent_play(game_details, league=None):
     outs = situation.get("outs", 0) if situation else 0
     
     # Look for pitcher and batter info in recent plays
-    plays_data = game_details.get("plays", [])
+    plays_data = log.recent(10)
     pitcher_name = None
     batter_name = None
     recent_play_text = None
     
-    if plays_data and isinstance(plays_data, list):
+    if plays_data:
         # Look through recent plays for pitcher/batter info and meaningful text
-        for play in reversed(plays_data[-10:]):  # Check last 10 plays
+        for play in reversed(plays_data):  # Check last 10 plays
             play_text = play.get("text", "")
             
             # Store the most recent meaningful play text as fallback
@@ -813,10 +1033,11 @@ def get_available_seasons(league_key):
         # For other leagues, return last 10 years as a reasonable default
         return [(year, f"{year} Season") for year in range(current_year, current_year - 10, -1)]
 
-def get_scores(league_key, date=None):
+def _scoreboard_url(league_key, date=None):
+    """Build the scoreboard URL for a league, optionally for a specific date"""
     league_path = LEAGUES.get(league_key)
     if not league_path:
-        return []
+        return None
     
     url = f"{BASE_URL}/{league_path}/scoreboard"
     
@@ -824,11 +1045,21 @@ def get_scores(league_key, date=None):
     if date:
         date_str = date.strftime("%Y%m%d")
         url += f"?dates={date_str}"
+    return url
+
+@coalesce
+def get_scores(league_key, date=None):
+    url = _scoreboard_url(league_key, date)
+    if not url:
+        return []
     
-    resp = requests.get(url)
+    resp = http_client.get(url)
     if resp.status_code != 200:
         return []
-    data = resp.json()
+    return _parse_scores(json_codec.response_json(resp))
+
+def _parse_scores(data):
+    """Parse scoreboard events into the score rows used by LeagueView"""
     events = data.get("events", [])
     scores = []
     
@@ -879,16 +1110,17 @@ def get_scores(league_key, date=None):
         })
     return scores
 
+@coalesce
 def get_news(league_key):
     """Get news headlines and links for a specific league"""
     league_path = LEAGUES.get(league_key)
     if not league_path:
         return []
     url = f"{BASE_URL}/{league_path}/news"
-    resp = requests.get(url)
+    resp = http_client.get(url)
     if resp.status_code != 200:
         return []
-    data = resp.json()
+    data = json_codec.response_json(resp)
     articles = data.get("articles", [])
     news_items = []
     for article in articles:
@@ -903,18 +1135,81 @@ def get_news(league_key):
         news_items.append(news_item)
     return news_items
 
-def get_game_details(league_key, game_id):
+def _game_details_url(league_key, game_id):
     league_path = LEAGUES.get(league_key)
     if not league_path:
+        return None
+    return f"{BASE_URL}/{league_path}/summary?event={game_id}"
+
+@coalesce
+def get_game_details(league_key, game_id, sections=None):
+    """Fetch a game summary; pass a tuple of top-level sections to keep only those"""
+    url = _game_details_url(league_key, game_id)
+    if not url:
         return {}
-    url = f"{BASE_URL}/{league_path}/summary?event={game_id}"
-    resp = requests.get(url)
+    resp = http_client.get(url)
     if resp.status_code != 200:
         return {}
-    return resp.json()
+    return json_codec.select_sections(json_codec.response_json(resp), sections)
+
+# Concurrent summary downloads when warming the final summary store
+WARM_WORKERS = 8
+
+def _completed_event_ids(league_key, date):
+    url = _scoreboard_url(league_key, date)
+    if not url:
+        return []
+    resp = http_client.get(url)
+    if resp.status_code != 200:
+        return []
+    return [event.get("id") for event in json_codec.response_json(resp).get("events", [])
+            if event.get("id") and event.get("status", {}).get("type", {}).get("completed")]
+
+def warm_final_summaries(date=None, leagues=None, max_workers=WARM_WORKERS):
+    """Download every completed game's summary for a date (default yesterday) into the final summary store.
+
+    Returns {league: number of summaries fetched}. Games already stored are
+    served from disk, so warming the same slate twice costs only scoreboards.
+    """
+    import concurrent.futures
+    from datetime import datetime, timedelta
+
+    date = date or datetime.now() - timedelta(days=1)
+    warmed = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for league_key in (LEAGUES if leagues is None else leagues):
+            try:
+                event_ids = _completed_event_ids(league_key, date)
+            except Exception as e:
+                print(f"Error fetching {league_key} scoreboard for {date:%Y-%m-%d}: {e}")
+                continue
+            warmed[league_key] = 0
+            for event_id in event_ids:
+                future = executor.submit(propagate(at_priority(Priority.BACKGROUND, get_game_details)),
+                                         league_key, event_id)
+                futures[future] = league_key
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                if future.result():
+                    warmed[futures[future]] += 1
+            except Exception as e:
+                print(f"Error warming {futures[future]} summary: {e}")
+    return warmed
 
 def extract_meaningful_game_info(details):
     """Extract meaningful information from game details for display"""
+    info = extract_game_header_info(details)
+    
+    # Process boxscore data properly
+    if info is not None and isinstance(details, dict) and 'boxscore' in details:
+        info['boxscore'] = _parse_boxscore_data(details['boxscore'])
+    
+    return info
+
+
+def extract_game_header_info(details):
+    """Teams, scores, status, venue, odds and broadcast info - everything but the heavy sections"""
     if not details or not isinstance(details, dict):
         return {}
     
@@ -968,10 +1263,6 @@ def extract_meaningful_game_info(details):
         if weather.get('temperature'):
             info['temperature'] = f"{weather['temperature']}°F"
     
-    # Process boxscore data properly
-    if 'boxscore' in details:
-        info['boxscore'] = _parse_boxscore_data(details['boxscore'])
-    
     # Odds (if available)
     if 'odds' in details and details['odds']:
         odds = details['odds'][0] if details['odds'] else {}
@@ -1347,6 +1638,16 @@ def format_complex_data(key, value):
     
     return str(value)[:100] + ("..." if len(str(value)) > 100 else "")
 
+# Dedicated standings endpoints (0.15s vs 7s for the per-team fallback)
+STANDINGS_URLS = {
+    "MLB": "https://site.api.espn.com/apis/v2/sports/baseball/mlb/standings",
+    "NFL": "https://site.api.espn.com/apis/v2/sports/football/nfl/standings",
+    # Use 2025-26 season (season=2026) for fresh standings with all teams at 0-0
+    "NBA": "https://site.api.espn.com/apis/v2/sports/basketball/nba/standings?season=2026",
+    "NCAAF": "https://site.api.espn.com/apis/v2/sports/football/college-football/standings",
+}
+
+@coalesce
 def get_standings(league_key):
     """Get current standings for a specific league using optimized API endpoint"""
     if league_key == "MLB":
@@ -1364,105 +1665,106 @@ def get_standings(league_key):
 def _get_mlb_standings_fast():
     """Fast MLB standings using dedicated endpoint (0.15s vs 7s)"""
     try:
-        # Use the fast dedicated standings endpoint
-        url = "https://site.api.espn.com/apis/v2/sports/baseball/mlb/standings"
-        resp = requests.get(url)
+        resp = http_client.get(STANDINGS_URLS["MLB"])
         
         if resp.status_code != 200:
             return []
         
-        data = resp.json()
-        standings = []
-        
-        # Division mapping for games back calculation
-        division_teams = {}
-        
-        # Process each league (AL/NL)
-        for league in data.get('children', []):
-            league_name = league.get('name', '')
-            
-            # Each league contains the standings entries
-            league_standings = league.get('standings', {})
-            entries = league_standings.get('entries', [])
-            
-            for entry in entries:
-                team_info = entry.get('team', {})
-                stats = entry.get('stats', [])
-                
-                # Create stats lookup
-                stats_dict = {}
-                for stat in stats:
-                    stats_dict[stat.get('name', '')] = stat.get('value', 0)
-                
-                # Extract team data
-                team_name = team_info.get('displayName', 'Unknown')
-                team_id = str(team_info.get('id', ''))
-                abbreviation = team_info.get('abbreviation', '')
-                
-                # Get wins/losses from stats
-                wins = int(stats_dict.get('wins', 0))
-                losses = int(stats_dict.get('losses', 0))
-                win_pct = stats_dict.get('winPercent', 0.0)
-                
-                # Get division from team info or determine from abbreviation
-                division = _get_team_division(abbreviation, league_name)
-                
-                # Get streak (look for streak stats)
-                streak = ""
-                streak_val = stats_dict.get('streak', 0)
-                if streak_val != 0:
-                    streak_type = "W" if streak_val > 0 else "L"
-                    streak = f"{streak_type}{abs(int(streak_val))}"
-                
-                team_data = {
-                    "team_name": team_name,
-                    "team_id": team_id,
-                    "abbreviation": abbreviation,
-                    "wins": wins,
-                    "losses": losses,
-                    "win_percentage": f"{win_pct:.3f}",
-                    "games_back": "0.0",  # Will calculate after grouping
-                    "division": division,
-                    "streak": streak,
-                    "logo": team_info.get("logos", [{}])[0].get("href", "") if team_info.get("logos") else ""
-                }
-                
-                standings.append(team_data)
-                
-                # Group by division for games back calculation
-                if division not in division_teams:
-                    division_teams[division] = []
-                division_teams[division].append(team_data)
-        
-        # Calculate games back for each division
-        for division, teams in division_teams.items():
-            # Sort by wins descending, then by win percentage
-            teams.sort(key=lambda x: (-x["wins"], -float(x["win_percentage"])))
-            
-            if teams:
-                leader = teams[0]
-                leader_wins = leader["wins"]
-                leader_losses = leader["losses"]
-                
-                for i, team in enumerate(teams):
-                    if i == 0:
-                        team["games_back"] = "—"  # Leader
-                    else:
-                        team_wins = team["wins"]
-                        team_losses = team["losses"]
-                        games_back = ((leader_wins - team_wins) + (team_losses - leader_losses)) / 2
-                        team["games_back"] = f"{games_back:.1f}" if games_back > 0 else "0.0"
-        
-        # Sort final standings by division, then by wins
-        standings.sort(key=lambda x: (x["division"], -x["wins"], -float(x["win_percentage"])))
-        
-        return standings
+        return _parse_mlb_standings(json_codec.response_json(resp))
         
     except Exception as e:
         print(f"Error in fast MLB standings: {e}")
         # Fallback to original method
         return _get_standings_original("MLB")
 
+def _parse_mlb_standings(data):
+    """Parse MLB standings from the dedicated standings endpoint"""
+    standings = []
+    
+    # Division mapping for games back calculation
+    division_teams = {}
+    
+    # Process each league (AL/NL)
+    for league in data.get('children', []):
+        league_name = league.get('name', '')
+        
+        # Each league contains the standings entries
+        league_standings = league.get('standings', {})
+        entries = league_standings.get('entries', [])
+        
+        for entry in entries:
+            team_info = entry.get('team', {})
+            stats = entry.get('stats', [])
+            
+            # Create stats lookup
+            stats_dict = {}
+            for stat in stats:
+                stats_dict[stat.get('name', '')] = stat.get('value', 0)
+            
+            # Extract team data
+            team_name = team_info.get('displayName', 'Unknown')
+            team_id = str(team_info.get('id', ''))
+            abbreviation = team_info.get('abbreviation', '')
+            
+            # Get wins/losses from stats
+            wins = int(stats_dict.get('wins', 0))
+            losses = int(stats_dict.get('losses', 0))
+            win_pct = stats_dict.get('winPercent', 0.0)
+            
+            # Get division from team info or determine from abbreviation
+            division = _get_team_division(abbreviation, league_name)
+            
+            # Get streak (look for streak stats)
+            streak = ""
+            streak_val = stats_dict.get('streak', 0)
+            if streak_val != 0:
+                streak_type = "W" if streak_val > 0 else "L"
+                streak = f"{streak_type}{abs(int(streak_val))}"
+            
+            team_data = {
+                "team_name": team_name,
+                "team_id": team_id,
+                "abbreviation": abbreviation,
+                "wins": wins,
+                "losses": losses,
+                "win_percentage": f"{win_pct:.3f}",
+                "games_back": "0.0",  # Will calculate after grouping
+                "division": division,
+                "streak": streak,
+                "logo": team_info.get("logos", [{}])[0].get("href", "") if team_info.get("logos") else ""
+            }
+            
+            standings.append(team_data)
+            
+            # Group by division for games back calculation
+            if division not in division_teams:
+                division_teams[division] = []
+            division_teams[division].append(team_data)
+    
+    # Calculate games back for each division
+    for division, teams in division_teams.items():
+        # Sort by wins descending, then by win percentage
+        teams.sort(key=lambda x: (-x["wins"], -float(x["win_percentage"])))
+        
+        if teams:
+            leader = teams[0]
+            leader_wins = leader["wins"]
+            leader_losses = leader["losses"]
+            
+            for i, team in enumerate(teams):
+                if i == 0:
+                    team["games_back"] = "—"  # Leader
+                else:
+                    team_wins = team["wins"]
+                    team_losses = team["losses"]
+                    games_back = ((leader_wins - team_wins) + (team_losses - leader_losses)) / 2
+                    team["games_back"] = f"{games_back:.1f}" if games_back > 0 else "0.0"
+    
+    # Sort final standings by division, then by wins
+    standings.sort(key=lambda x: (x["division"], -x["wins"], -float(x["win_percentage"])))
+    
+    return standings
+
 def _get_team_division(abbreviation, league_name):
     """Get team division from abbreviation and league"""
     # MLB Division mapping
@@ -1490,245 +1792,248 @@ def _get_team_division(abbreviation, league_name):
 def _get_nfl_standings_fast():
     """Fast NFL standings using dedicated endpoint"""
     try:
-        url = "https://site.api.espn.com/apis/v2/sports/football/nfl/standings"
-        resp = requests.get(url)
+        resp = http_client.get(STANDINGS_URLS["NFL"])
         
         if resp.status_code != 200:
             return []
         
-        data = resp.json()
-        standings = []
-        
-        # NFL divisions mapping
-        nfl_divisions = {
-            # AFC East
-            "BUF": "AFC East", "MIA": "AFC East", "NE": "AFC East", "NYJ": "AFC East",
-            # AFC North  
-            "BAL": "AFC North", "CIN": "AFC North", "CLE": "AFC North", "PIT": "AFC North",
-            # AFC South
-            "HOU": "AFC South", "IND": "AFC South", "JAX": "AFC South", "TEN": "AFC South",
-            # AFC West
-            "DEN": "AFC West", "KC": "AFC West", "LV": "AFC West", "LAC": "AFC West",
-            # NFC East
-            "DAL": "NFC East", "NYG": "NFC East", "PHI": "NFC East", "WSH": "NFC East",
-            # NFC North
-            "CHI": "NFC North", "DET": "NFC North", "GB": "NFC North", "MIN": "NFC North",
-            # NFC South
-            "ATL": "NFC South", "CAR": "NFC South", "NO": "NFC South", "TB": "NFC South",
-            # NFC West
-            "ARI": "NFC West", "LAR": "NFC West", "SF": "NFC West", "SEA": "NFC West"
-        }
-        
-        # Process each conference
-        division_teams = {}
-        for conference in data.get('children', []):
-            conf_standings = conference.get('standings', {})
-            entries = conf_standings.get('entries', [])
-            
-            for entry in entries:
-                team_info = entry.get('team', {})
-                stats = entry.get('stats', [])
-                
-                # Create stats lookup
-                stats_dict = {}
-                for stat in stats:
-                    stats_dict[stat.get('name', '')] = stat.get('value', 0)
-                
-                # Extract team data
-                team_name = team_info.get('displayName', 'Unknown')
-                team_id = str(team_info.get('id', ''))
-                abbreviation = team_info.get('abbreviation', '')
-                
-                # Get wins/losses from stats
-                wins = int(stats_dict.get('wins', 0))
-                losses = int(stats_dict.get('losses', 0))
-                ties = int(stats_dict.get('ties', 0))
-                win_pct = stats_dict.get('winPercent', 0.0)
-                
-                # Get division
-                division = nfl_divisions.get(abbreviation, "Unknown Division")
-                
-                # NFL record format includes ties
-                record_display = f"{wins}-{losses}"
-                if ties > 0:
-                    record_display += f"-{ties}"
-                
-                team_data = {
-                    "team_name": team_name,
-                    "team_id": team_id,
-                    "abbreviation": abbreviation,
-                    "wins": wins,
-                    "losses": losses,
-                    "ties": ties,
-                    "win_percentage": f"{win_pct:.3f}",
-                    "games_back": "0.0",
-                    "division": division,
-                    "streak": "",  # Can be enhanced later
-                    "logo": team_info.get("logos", [{}])[0].get("href", "") if team_info.get("logos") else "",
-                    "record_display": record_display
-                }
-                
-                standings.append(team_data)
-                
-                if division not in division_teams:
-                    division_teams[division] = []
-                division_teams[division].append(team_data)
-        
-        # Calculate games back for each division
-        for division, teams in division_teams.items():
-            teams.sort(key=lambda x: (-x["wins"], x["losses"]))
-            
-            if teams:
-                leader = teams[0]
-                leader_wins = leader["wins"]
-                leader_losses = leader["losses"]
-                
-                for i, team in enumerate(teams):
-                    if i == 0:
-                        team["games_back"] = "—"
-                    else:
-                        team_wins = team["wins"]
-                        team_losses = team["losses"]
-                        games_back = ((leader_wins - team_wins) + (team_losses - leader_losses)) / 2
-                        team["games_back"] = f"{games_back:.1f}" if games_back > 0 else "0.0"
-        
-        # Sort by division, then by wins
-        standings.sort(key=lambda x: (x["division"], -x["wins"], x["losses"]))
-        
-        return standings
+        return _parse_nfl_standings(json_codec.response_json(resp))
         
     except Exception as e:
         print(f"Error in fast NFL standings: {e}")
         return _get_standings_original("NFL")
 
+def _parse_nfl_standings(data):
+    """Parse NFL standings from the dedicated standings endpoint"""
+    standings = []
+    
+    # NFL divisions mapping
+    nfl_divisions = {
+        # AFC East
+        "BUF": "AFC East", "MIA": "AFC East", "NE": "AFC East", "NYJ": "AFC East",
+        # AFC North  
+        "BAL": "AFC North", "CIN": "AFC North", "CLE": "AFC North", "PIT": "AFC North",
+        # AFC South
+        "HOU": "AFC South", "IND": "AFC South", "JAX": "AFC South", "TEN": "AFC South",
+        # AFC West
+        "DEN": "AFC West", "KC": "AFC West", "LV": "AFC West", "LAC": "AFC West",
+        # NFC East
+        "DAL": "NFC East", "NYG": "NFC East", "PHI": "NFC East", "WSH": "NFC East",
+        # NFC North
+        "CHI": "NFC North", "DET": "NFC North", "GB": "NFC North", "MIN": "NFC North",
+        # NFC South
+        "ATL": "NFC South", "CAR": "NFC South", "NO": "NFC South", "TB": "NFC South",
+        # NFC West
+        "ARI": "NFC West", "LAR": "NFC West", "SF": "NFC West", "SEA": "NFC West"
+    }
+    
+    # Process each conference
+    division_teams = {}
+    for conference in data.get('children', []):
+        conf_standings = conference.get('standings', {})
+        entries = conf_standings.get('entries', [])
+        
+        for entry in entries:
+            team_info = entry.get('team', {})
+            stats = entry.get('stats', [])
+            
+            # Create stats lookup
+            stats_dict = {}
+            for stat in stats:
+                stats_dict[stat.get('name', '')] = stat.get('value', 0)
+            
+            # Extract team data
+            team_name = team_info.get('displayName', 'Unknown')
+            team_id = str(team_info.get('id', ''))
+            abbreviation = team_info.get('abbreviation', '')
+            
+            # Get wins/losses from stats
+            wins = int(stats_dict.get('wins', 0))
+            losses = int(stats_dict.get('losses', 0))
+            ties = int(stats_dict.get('ties', 0))
+            win_pct = stats_dict.get('winPercent', 0.0)
+            
+            # Get division
+            division = nfl_divisions.get(abbreviation, "Unknown Division")
+            
+            # NFL record format includes ties
+            record_display = f"{wins}-{losses}"
+            if ties > 0:
+                record_display += f"-{ties}"
+            
+            team_data = {
+                "team_name": team_name,
+                "team_id": team_id,
+                "abbreviation": abbreviation,
+                "wins": wins,
+                "losses": losses,
+                "ties": ties,
+                "win_percentage": f"{win_pct:.3f}",
+                "games_back": "0.0",
+                "division": division,
+                "streak": "",  # Can be enhanced later
+                "logo": team_info.get("logos", [{}])[0].get("href", "") if team_info.get("logos") else "",
+                "record_display": record_display
+            }
+            
+            standings.append(team_data)
+            
+            if division not in division_teams:
+                division_teams[division] = []
+            division_teams[division].append(team_data)
+    
+    # Calculate games back for each division
+    for division, teams in division_teams.items():
+        teams.sort(key=lambda x: (-x["wins"], x["losses"]))
+        
+        if teams:
+            leader = teams[0]
+            leader_wins = leader["wins"]
+            leader_losses = leader["losses"]
+            
+            for i, team in enumerate(teams):
+                if i == 0:
+                    team["games_back"] = "—"
+                else:
+                    team_wins = team["wins"]
+                    team_losses = team["losses"]
+                    games_back = ((leader_wins - team_wins) + (team_losses - leader_losses)) / 2
+                    team["games_back"] = f"{games_back:.1f}" if games_back > 0 else "0.0"
+    
+    # Sort by division, then by wins
+    standings.sort(key=lambda x: (x["division"], -x["wins"], x["losses"]))
+    
+    return standings
+
 def _get_nba_standings_fast():
     """Fast NBA standings using dedicated endpoint"""
     try:
-        # Use 2025-26 season (season=2026) for fresh standings with all teams at 0-0
-        url = "https://site.api.espn.com/apis/v2/sports/basketball/nba/standings?season=2026"
-        resp = requests.get(url)
+        resp = http_client.get(STANDINGS_URLS["NBA"])
         
         if resp.status_code != 200:
             return []
         
-        data = resp.json()
-        standings = []
-        
-        # NBA divisions mapping
-        nba_divisions = {
-            # Eastern Conference - Atlantic
-            "BOS": "Atlantic", "BKN": "Atlantic", "NYK": "Atlantic", "NY": "Atlantic", "PHI": "Atlantic", "TOR": "Atlantic",
-            # Eastern Conference - Central
-            "CHI": "Central", "CLE": "Central", "DET": "Central", "IND": "Central", "MIL": "Central",
-            # Eastern Conference - Southeast
-            "ATL": "Southeast", "CHA": "Southeast", "MIA": "Southeast", "ORL": "Southeast", "WSH": "Southeast",
-            # Western Conference - Northwest
-            "DEN": "Northwest", "MIN": "Northwest", "OKC": "Northwest", "POR": "Northwest", "UTA": "Northwest", "UTAH": "Northwest",
-            # Western Conference - Pacific
-            "GSW": "Pacific", "GS": "Pacific", "LAC": "Pacific", "LAL": "Pacific", "PHX": "Pacific", "SAC": "Pacific",
-            # Western Conference - Southwest
-            "DAL": "Southwest", "HOU": "Southwest", "MEM": "Southwest", "NO": "Southwest", "SA": "Southwest"
-        }
-        
-        # Process each conference
-        division_teams = {}
-        has_entries = False
-        
-        # Check if any conference has entries
-        for conference in data.get('children', []):
-            conf_standings = conference.get('standings', {})
-            if conf_standings.get('entries', []):
-                has_entries = True
-                break
-        
-        # If no entries (early season), create fresh 0-0 standings from teams endpoint
-        if not has_entries:
-            return _get_nba_fresh_standings()
-        
-        for conference in data.get('children', []):
-            conf_name = conference.get('name', '')
-            conf_standings = conference.get('standings', {})
-            entries = conf_standings.get('entries', [])
-            
-            for entry in entries:
-                team_info = entry.get('team', {})
-                stats = entry.get('stats', [])
-                
-                # Create stats lookup
-                stats_dict = {}
-                for stat in stats:
-                    stats_dict[stat.get('name', '')] = stat.get('value', 0)
-                
-                # Extract team data
-                team_name = team_info.get('displayName', 'Unknown')
-                team_id = str(team_info.get('id', ''))
-                abbreviation = team_info.get('abbreviation', '')
-                
-                # Get wins/losses from stats
-                wins = int(stats_dict.get('wins', 0))
-                losses = int(stats_dict.get('losses', 0))
-                win_pct = stats_dict.get('winPercent', 0.0)
-                
-                # Get division with conference prefix
-                base_division = nba_divisions.get(abbreviation, "Unknown")
-                division = f"{conf_name} {base_division}" if base_division != "Unknown" else conf_name
-                
-                team_data = {
-                    "team_name": team_name,
-                    "team_id": team_id,
-                    "abbreviation": abbreviation,
-                    "wins": wins,
-                    "losses": losses,
-                    "win_percentage": f"{win_pct:.3f}",
-                    "games_back": "0.0",
-                    "division": division,
-                    "streak": "",
-                    "logo": team_info.get("logos", [{}])[0].get("href", "") if team_info.get("logos") else ""
-                }
-                
-                standings.append(team_data)
-                
-                if division not in division_teams:
-                    division_teams[division] = []
-                division_teams[division].append(team_data)
-        
-        # Calculate games back for each division
-        for division, teams in division_teams.items():
-            teams.sort(key=lambda x: (-x["wins"], x["losses"]))
-            
-            if teams:
-                leader = teams[0]
-                leader_wins = leader["wins"]
-                leader_losses = leader["losses"]
-                
-                for i, team in enumerate(teams):
-                    if i == 0:
-                        team["games_back"] = "—"
-                    else:
-                        team_wins = team["wins"]
-                        team_losses = team["losses"]
-                        games_back = ((leader_wins - team_wins) + (team_losses - leader_losses)) / 2
-                        team["games_back"] = f"{games_back:.1f}" if games_back > 0 else "0.0"
-        
-        # Sort by division, then by wins
-        standings.sort(key=lambda x: (x["division"], -x["wins"], x["losses"]))
-        
-        return standings
+        return _parse_nba_standings(json_codec.response_json(resp))
         
     except Exception as e:
         print(f"Error in fast NBA standings: {e}")
         return _get_standings_original("NBA")
 
+def _parse_nba_standings(data):
+    """Parse NBA standings from the dedicated standings endpoint"""
+    standings = []
+    
+    # NBA divisions mapping
+    nba_divisions = {
+        # Eastern Conference - Atlantic
+        "BOS": "Atlantic", "BKN": "Atlantic", "NYK": "Atlantic", "NY": "Atlantic", "PHI": "Atlantic", "TOR": "Atlantic",
+        # Eastern Conference - Central
+        "CHI": "Central", "CLE": "Central", "DET": "Central", "IND": "Central", "MIL": "Central",
+        # Eastern Conference - Southeast
+        "ATL": "Southeast", "CHA": "Southeast", "MIA": "Southeast", "ORL": "Southeast", "WSH": "Southeast",
+        # Western Conference - Northwest
+        "DEN": "Northwest", "MIN": "Northwest", "OKC": "Northwest", "POR": "Northwest", "UTA": "Northwest", "UTAH": "Northwest",
+        # Western Conference - Pacific
+        "GSW": "Pacific", "GS": "Pacific", "LAC": "Pacific", "LAL": "Pacific", "PHX": "Pacific", "SAC": "Pacific",
+        # Western Conference - Southwest
+        "DAL": "Southwest", "HOU": "Southwest", "MEM": "Southwest", "NO": "Southwest", "SA": "Southwest"
+    }
+    
+    # Process each conference
+    division_teams = {}
+    has_entries = False
+    
+    # Check if any conference has entries
+    for conference in data.get('children', []):
+        conf_standings = conference.get('standings', {})
+        if conf_standings.get('entries', []):
+            has_entries = True
+            break
+    
+    # If no entries (early season), create fresh 0-0 standings from teams endpoint
+    if not has_entries:
+        return _get_nba_fresh_standings()
+    
+    for conference in data.get('children', []):
+        conf_name = conference.get('name', '')
+        conf_standings = conference.get('standings', {})
+        entries = conf_standings.get('entries', [])
+        
+        for entry in entries:
+            team_info = entry.get('team', {})
+            stats = entry.get('stats', [])
+            
+            # Create stats lookup
+            stats_dict = {}
+            for stat in stats:
+                stats_dict[stat.get('name', '')] = stat.get('value', 0)
+            
+            # Extract team data
+            team_name = team_info.get('displayName', 'Unknown')
+            team_id = str(team_info.get('id', ''))
+            abbreviation = team_info.get('abbreviation', '')
+            
+            # Get wins/losses from stats
+            wins = int(stats_dict.get('wins', 0))
+            losses = int(stats_dict.get('losses', 0))
+            win_pct = stats_dict.get('winPercent', 0.0)
+            
+            # Get division with conference prefix
+            base_division = nba_divisions.get(abbreviation, "Unknown")
+            division = f"{conf_name} {base_division}" if base_division != "Unknown" else conf_name
+            
+            team_data = {
+                "team_name": team_name,
+                "team_id": team_id,
+                "abbreviation": abbreviation,
+                "wins": wins,
+                "losses": losses,
+                "win_percentage": f"{win_pct:.3f}",
+                "games_back": "0.0",
+                "division": division,
+                "streak": "",
+                "logo": team_info.get("logos", [{}])[0].get("href", "") if team_info.get("logos") else ""
+            }
+            
+            standings.append(team_data)
+            
+            if division not in division_teams:
+                division_teams[division] = []
+            division_teams[division].append(team_data)
+    
+    # Calculate games back for each division
+    for division, teams in division_teams.items():
+        teams.sort(key=lambda x: (-x["wins"], x["losses"]))
+        
+        if teams:
+            leader = teams[0]
+            leader_wins = leader["wins"]
+            leader_losses = leader["losses"]
+            
+            for i, team in enumerate(teams):
+                if i == 0:
+                    team["games_back"] = "—"
+                else:
+                    team_wins = team["wins"]
+                    team_losses = team["losses"]
+                    games_back = ((leader_wins - team_wins) + (team_losses - leader_losses)) / 2
+                    team["games_back"] = f"{games_back:.1f}" if games_back > 0 else "0.0"
+    
+    # Sort by division, then by wins
+    standings.sort(key=lambda x: (x["division"], -x["wins"], x["losses"]))
+    
+    return standings
+
 def _get_nba_fresh_standings():
     """Create fresh NBA standings with all teams at 0-0 for new season"""
     try:
         url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams"
-        resp = requests.get(url)
+        resp = http_client.get(url)
         
         if resp.status_code != 200:
             return []
         
-        data = resp.json()
+        data = json_codec.response_json(resp)
         standings = []
         
         # NBA divisions mapping (same as main function)
@@ -1805,64 +2110,66 @@ def _get_nba_fresh_standings():
 def _get_ncaaf_standings_fast():
     """Fast NCAAF standings using dedicated endpoint"""
     try:
-        url = "https://site.api.espn.com/apis/v2/sports/football/college-football/standings"
-        resp = requests.get(url)
+        resp = http_client.get(STANDINGS_URLS["NCAAF"])
         
         if resp.status_code != 200:
             return []
         
-        data = resp.json()
-        standings = []
-        
-        # Process each conference/group
-        for conference in data.get('children', []):
-            conf_name = conference.get('name', 'Independent')
-            conf_standings = conference.get('standings', {})
-            entries = conf_standings.get('entries', [])
-            
-            for entry in entries:
-                team_info = entry.get('team', {})
-                stats = entry.get('stats', [])
-                
-                # Create stats lookup
-                stats_dict = {}
-                for stat in stats:
-                    stats_dict[stat.get('name', '')] = stat.get('value', 0)
-                
-                # Extract team data
-                team_name = team_info.get('displayName', 'Unknown')
-                team_id = str(team_info.get('id', ''))
-                abbreviation = team_info.get('abbreviation', '')
-                
-                # Get wins/losses from stats
-                wins = int(stats_dict.get('wins', 0))
-                losses = int(stats_dict.get('losses', 0))
-                win_pct = stats_dict.get('winPercent', 0.0)
-                
-                team_data = {
-                    "team_name": team_name,
-                    "team_id": team_id,
-                    "abbreviation": abbreviation,
-                    "wins": wins,
-                    "losses": losses,
-                    "win_percentage": f"{win_pct:.3f}",
-                    "games_back": "—",  # College football doesn't use games back
-                    "division": conf_name,  # Conference name as division
-                    "streak": "",
-                    "logo": team_info.get("logos", [{}])[0].get("href", "") if team_info.get("logos") else ""
-                }
-                
-                standings.append(team_data)
-        
-        # Sort by conference, then by wins
-        standings.sort(key=lambda x: (x["division"], -x["wins"], x["losses"]))
-        
-        return standings
+        return _parse_ncaaf_standings(json_codec.response_json(resp))
         
     except Exception as e:
         print(f"Error in fast NCAAF standings: {e}")
         return _get_standings_original("NCAAF")
 
+def _parse_ncaaf_standings(data):
+    """Parse NCAAF standings from the dedicated standings endpoint"""
+    standings = []
+    
+    # Process each conference/group
+    for conference in data.get('children', []):
+        conf_name = conference.get('name', 'Independent')
+        conf_standings = conference.get('standings', {})
+        entries = conf_standings.get('entries', [])
+        
+        for entry in entries:
+            team_info = entry.get('team', {})
+            stats = entry.get('stats', [])
+            
+            # Create stats lookup
+            stats_dict = {}
+            for stat in stats:
+                stats_dict[stat.get('name', '')] = stat.get('value', 0)
+            
+            # Extract team data
+            team_name = team_info.get('displayName', 'Unknown')
+            team_id = str(team_info.get('id', ''))
+            abbreviation = team_info.get('abbreviation', '')
+            
+            # Get wins/losses from stats
+            wins = int(stats_dict.get('wins', 0))
+            losses = int(stats_dict.get('losses', 0))
+            win_pct = stats_dict.get('winPercent', 0.0)
+            
+            team_data = {
+                "team_name": team_name,
+                "team_id": team_id,
+                "abbreviation": abbreviation,
+                "wins": wins,
+                "losses": losses,
+                "win_percentage": f"{win_pct:.3f}",
+                "games_back": "—",  # College football doesn't use games back
+                "division": conf_name,  # Conference name as division
+                "streak": "",
+                "logo": team_info.get("logos", [{}])[0].get("href", "") if team_info.get("logos") else ""
+            }
+            
+            standings.append(team_data)
+    
+    # Sort by conference, then by wins
+    standings.sort(key=lambda x: (x["division"], -x["wins"], x["losses"]))
+    
+    return standings
+
 def _get_standings_original(league_key):
     """Original standings method (slower but works for all leagues)"""
     league_path = LEAGUES.get(league_key)
@@ -1871,12 +2178,12 @@ def _get_standings_original(league_key):
     
     # Use teams API to get all teams and their records
     teams_url = f"{BASE_URL}/{league_path}/teams"
-    resp = requests.get(teams_url)
+    resp = http_client.get(teams_url)
     
     if resp.status_code != 200:
         return []
     
-    data = resp.json()
+    data = json_codec.response_json(resp)
     return _parse_standings_from_teams_api(data, league_key)
 
 def _parse_standings_from_teams_api(data, league_key):
@@ -1986,12 +2293,12 @@ def _get_team_record(team_id, league_key):
     try:
         # Get detailed team information
         team_url = f"{BASE_URL}/{league_path}/teams/{team_id}"
-        resp = requests.get(team_url)
+        resp = http_client.get(team_url)
         
         if resp.status_code != 200:
             return 0, 0, "0.000", ""
         
-        data = resp.json()
+        data = json_codec.response_json(resp)
         team = data.get("team", {})
         record = team.get("record", {})
         items = record.get("items", [])
@@ -2287,13 +2594,13 @@ def _get_team_statistics(league_key):
         
         # Get list of teams first
         teams_url = f"{BASE_URL}/{league_path}/teams"
-        resp = requests.get(teams_url)
+        resp = http_client.get(teams_url)
         
         if resp.status_code != 200:
             print(f"Failed to get teams list: {resp.status_code}")
             return []
         
-        data = resp.json()
+        data = json_codec.response_json(resp)
         
         # Navigate to teams data
         if 'sports' not in data or not data['sports']:
@@ -2324,10 +2631,10 @@ def _get_team_statistics(league_key):
             try:
                 # Get team statistics
                 team_stats_url = f"{BASE_URL}/{league_path}/teams/{team_id}/statistics"
-                team_resp = requests.get(team_stats_url)
+                team_resp = http_client.get(team_stats_url)
                 
                 if team_resp.status_code == 200:
-                    team_data = team_resp.json()
+                    team_data = json_codec.response_json(team_resp)
                     
                     # Parse team statistics
                     if 'results' in team_data and 'stats' in team_data['results']:
@@ -2379,8 +2686,9 @@ def _get_team_statistics(league_key):
         teams_processed = 0
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            # Submit all team stat requests in parallel
-            futures = [executor.submit(fetch_team_stats, team_entry) for team_entry in teams]
+            # Submit all team stat requests in parallel; bulk work yields to interactive requests
+            fetch = propagate(at_priority(Priority.BACKGROUND, fetch_team_stats))
+            futures = [executor.submit(fetch, team_entry) for team_entry in teams]
             
             # Collect results as they complete
             for future in concurrent.futures.as_completed(futures):
@@ -2487,10 +2795,10 @@ def _get_mlb_statistics():
         try:
             # Add limit parameter to get top 50 players instead of default 5
             url = f"https://statsapi.mlb.com/api/v1/stats/leaders?leaderCategories={stat_key}&statGroup={stat_group}&season={season}&limit=50"
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_codec.response_json(response)
                 
                 if 'leagueLeaders' in data and len(data['leagueLeaders']) > 0:
                     leaders_data = data['leagueLeaders'][0]
@@ -2526,9 +2834,10 @@ def _get_mlb_statistics():
     # Use parallel execution for much faster loading
     player_stats = []
     with concurrent.futures.ThreadPoolExecutor(max_workers=15) as executor:
-        # Submit all requests in parallel
+        # Submit all requests in parallel; bulk work yields to interactive requests
+        fetch = propagate(at_priority(Priority.BACKGROUND, fetch_stat_category))
         future_to_stat = {
-            executor.submit(fetch_stat_category, stat_info): stat_info[2] 
+            executor.submit(fetch, stat_info): stat_info[2] 
             for stat_info in stat_categories
         }
         
@@ -2587,10 +2896,10 @@ def get_statistics(league_key):
         for endpoint in endpoints_to_try:
             try:
                 print(f"Attempting to fetch statistics from: {endpoint}")
-                resp = requests.get(endpoint, timeout=10)
+                resp = http_client.get(endpoint, timeout=10)
                 
                 if resp.status_code == 200:
-                    data = resp.json()
+                    data = json_codec.response_json(resp)
                     print(f"SUCCESS: {endpoint} returned data")
                     print(f"Response keys: {list(data.keys())}")
                     print(f"Response sample: {str(data)[:300]}...")
@@ -2681,10 +2990,10 @@ def get_player_statistics(league_key):
         for endpoint in endpoints_to_try:
             try:
                 print(f"Attempting to fetch player statistics from: {endpoint}")
-                resp = requests.get(endpoint, timeout=10)
+                resp = http_client.get(endpoint, timeout=10)
                 
                 if resp.status_code == 200:
-                    data = resp.json()
+                    data = json_codec.response_json(resp)
                     parsed_data = _parse_statistics_data(data, league_key)
                     if parsed_data and parsed_data.get("player_stats"):
                         # Only return player stats, not team stats
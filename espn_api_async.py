@@ -0,0 +1,192 @@
+"""
+Asyncio variant of the ESPN client.
+
+A single event loop multiplexes every request under one concurrency limit, so
+a headless process can poll all LEAGUES and every live game without the
+nested thread pools used by the synchronous fetchers. URL building and
+parsing are shared with espn_api; blocking I/O goes through the pooled
+http_client on a worker pool no larger than the concurrency limit.
+
+Deadlines and request priorities are per thread: each offloaded call runs
+under the ones active on the loop thread when it was made (plus a copy of
+the caller's contextvars), so wrap awaits in deadline() / request_priority()
+exactly as around the synchronous fetchers.
+
+Usage:
+    async with AsyncEspnClient(max_concurrency=32) as client:
+        live_games = await client.get_live_scores_all_sports(tiered=True, needs_details=is_monitored)
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import sys
+from typing import Callable, Dict, List, Optional
+
+import espn_api
+from services import http_client, json_codec
+from services.deadline import propagate
+from services.request_scheduler import at_priority, current_priority
+
+__all__ = ["AsyncEspnClient", "DEFAULT_CONCURRENCY"]
+
+# Upper bound on requests in flight (and on worker threads) per client
+DEFAULT_CONCURRENCY = 20
+
+_STANDINGS_PARSERS = {
+    "MLB": espn_api._parse_mlb_standings,
+    "NFL": espn_api._parse_nfl_standings,
+    "NBA": espn_api._parse_nba_standings,
+    "NCAAF": espn_api._parse_ncaaf_standings,
+}
+
+
+def _fetch_json_blocking(url: str) -> Optional[Dict]:
+    resp = http_client.get(url)
+    if resp.status_code != 200:
+        return None
+    return json_codec.response_json(resp)
+
+
+class AsyncEspnClient:
+    """Coroutine versions of the espn_api fetchers with bounded fan-out"""
+
+    def __init__(self, max_concurrency: int = DEFAULT_CONCURRENCY):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the loop that actually runs the client
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="espn-async")
+        return self._executor
+
+    async def _offload(self, func, *args):
+        loop = asyncio.get_running_loop()
+        # Worker threads inherit the caller's deadline, priority and contextvars
+        call = propagate(at_priority(current_priority(), func))
+        return await loop.run_in_executor(self._get_executor(), contextvars.copy_context().run, call, *args)
+
+    async def fetch_json(self, url: str) -> Optional[Dict]:
+        """GET a URL and decode its JSON body; None for non-200 responses"""
+        async with self._get_semaphore():
+            return await self._offload(_fetch_json_blocking, url)
+
+    async def get_scores(self, league_key: str, date=None) -> List[Dict]:
+        url = espn_api._scoreboard_url(league_key, date)
+        if not url:
+            return []
+        data = await self.fetch_json(url)
+        if data is None:
+            return []
+        return espn_api._parse_scores(data)
+
+    async def get_game_details(self, league_key: str, game_id: str, sections=None) -> Dict:
+        url = espn_api._game_details_url(league_key, game_id)
+        if not url:
+            return {}
+        data = await self.fetch_json(url)
+        return json_codec.select_sections(data, sections) if data is not None else {}
+
+    async def get_standings(self, league_key: str) -> List[Dict]:
+        url = espn_api.STANDINGS_URLS.get(league_key)
+        if url:
+            try:
+                data = await self.fetch_json(url)
+                if data is None:
+                    return []
+                return await self._offload(_STANDINGS_PARSERS[league_key], data)
+            except Exception as e:
+                print(f"Error in fast {league_key} standings: {e}", file=sys.stderr)
+
+        # Fallback to the per-team method for other leagues
+        async with self._get_semaphore():
+            return await self._offload(espn_api._get_standings_original, league_key)
+
+    async def get_team_schedule(self, league_key: str, team_id: str, days_ahead: int = 30,
+                                days_behind: int = 30, season=None) -> List[Dict]:
+        from datetime import datetime
+
+        if not espn_api.LEAGUES.get(league_key):
+            return []
+
+        is_historical_season = season is not None and season != datetime.now().year
+        url, uses_team_endpoint = espn_api._team_schedule_url(league_key, team_id, days_ahead, days_behind, season)
+
+        try:
+            data = await self.fetch_json(url)
+            if data is None:
+                return []
+
+            if not uses_team_endpoint:
+                return espn_api._parse_scoreboard_schedule(data, team_id, datetime.now(), is_historical_season)
+
+            events = data.get('events', [])
+
+            # NCAAF fallback: if current year has no games, try previous year
+            if league_key == "NCAAF" and len(events) == 0:
+                fallback_data = await self.fetch_json(espn_api._ncaaf_fallback_schedule_url(team_id))
+                if fallback_data:
+                    events = fallback_data.get('events', [])
+
+            return espn_api._parse_team_schedule_events(events, team_id, is_historical_season)
+
+        except Exception as e:
+            print(f"Error fetching team schedule: {e}", file=sys.stderr)
+            return []
+
+    async def get_scoreboard_index(self, league_key: str) -> Dict[str, Dict]:
+        data = await self.fetch_json(espn_api._live_scoreboard_url(league_key))
+        return espn_api._index_scoreboard_events(data) if data is not None else {}
+
+    async def _run_bounded(self, func, *args):
+        async with self._get_semaphore():
+            return await self._offload(func, *args)
+
+    async def get_live_scores_all_sports(self, leagues=None, needs_details: Optional[Callable[[Dict], bool]] = None,
+                                         tiered: bool = False) -> List[Dict]:
+        """Live games across LEAGUES (or leagues), fetching leagues and game summaries concurrently.
+
+        Each league and each game goes through the same helpers as
+        espn_api.iter_live_scores_all_sports, so needs_details and tiered
+        follow its rules; only the fan-out is scheduled on the loop.
+        """
+        league_keys = list(espn_api.LEAGUES.keys() if leagues is None else leagues)
+        results = await asyncio.gather(
+            *(self._run_bounded(espn_api._fetch_live_league, league_key, tiered) for league_key in league_keys),
+            return_exceptions=True)
+
+        live_games = []
+        for league_key, result in zip(league_keys, results):
+            if isinstance(result, Exception):
+                print(f"Error fetching live scores for {league_key}: {result}", file=sys.stderr)
+                continue
+            games, scoreboard_events = result
+            # A failed league (None) was already reported by _fetch_live_league
+            for game in games or []:
+                live_games.append((game, scoreboard_events))
+
+        await asyncio.gather(*(self._run_bounded(espn_api._add_live_game_details, game, scoreboard_events,
+                                                 needs_details, tiered)
+                               for game, scoreboard_events in live_games))
+        return [game for game, _ in live_games]
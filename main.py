@@ -25,6 +25,8 @@ Examples:
   scores --nfl             Launch directly to NFL games  
   scores --mlb-teams       Launch directly to MLB teams view
   scores --nfl-standings   Launch directly to NFL standings view
+  scores --monitor         Headless: write live score/lead/period changes as JSON lines
+  scores --warm-yesterday  Headless: store yesterday's finished game summaries on disk
         """)
     
     # Create mutually exclusive group for sports
@@ -83,6 +85,27 @@ def determine_startup_params(args):
 
 # Import and run the main application
 if __name__ == "__main__":
+    # Headless monitor: handled before anything imports PyQt6
+    if '--monitor' in sys.argv:
+        from services.live_monitor import main as monitor_main
+        sys.exit(monitor_main(sys.argv[1:]))
+
+    # Headless: download yesterday's finished games into the final summary store
+    if '--warm-yesterday' in sys.argv:
+        from exceptions import ApiError
+        from services.api_service import ApiService
+        try:
+            warmed = ApiService.warm_final_summaries()
+        except ApiError as e:
+            print(f"Warming final summaries failed: {e}")
+            sys.exit(1)
+        for league, count in warmed.items():
+            print(f"{league}: {count} final summaries stored")
+        stats = ApiService.get_final_store_stats()
+        if stats:
+            print(f"Store: {stats['blobs']} summaries, {stats['bytes'] / (1024 * 1024):.1f} MB")
+        sys.exit(0)
+
     from PyQt6.QtWidgets import QApplication
     from scores import SportsScoresApp
 
@@ -100,6 +123,8 @@ Examples:
   scores --nfl             Launch directly to NFL games  
   scores --mlb-teams       Launch directly to MLB teams view
   scores --nfl-standings   Launch directly to NFL standings view
+  scores --monitor         Headless: write live score/lead/period changes as JSON lines
+  scores --warm-yesterday  Headless: store yesterday's finished game summaries on disk
         """
     )
     sports_group = parser.add_mutually_exclusive_group()
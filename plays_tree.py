@@ -0,0 +1,199 @@
+"""
+Lazy play-by-play tree for the game details plays dialog.
+
+GameDetailsView's tree builders produce PlayNodes (innings/quarters, then
+half innings/drives, at-bats and pitches/plays). A node's children come from
+a loader that only runs when the node is first expanded, and PlaysTreeModel
+hands rows to a QTreeView through canFetchMore/fetchMore, so a long game no
+longer builds a widget item for every pitch before the dialog opens.
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QTreeView
+
+# Background for scoring plays and at-bats (light yellow)
+SCORING_HIGHLIGHT = (255, 255, 150)
+
+
+class PlayNode:
+    """One row of the plays tree; children come from loader on first use.
+
+    text(), data(), parent(), childCount() and child() mirror the
+    QTreeWidgetItem calls the pitch audio hooks make.
+    """
+
+    __slots__ = ("label", "payload", "highlight", "expanded", "fetched", "_parent", "_row", "_children", "_loader")
+
+    def __init__(self, label: str, payload=None, highlight: Optional[Tuple[int, int, int]] = None,
+                 loader: Optional[Callable[[], List["PlayNode"]]] = None, expanded: bool = False):
+        self.label = label
+        self.payload = payload
+        self.highlight = highlight
+        self.expanded = expanded  # Expanded when the view first shows it
+        self.fetched = 0  # Children already handed to the model
+        self._parent = None
+        self._row = 0
+        self._children = None if loader else []
+        self._loader = loader
+
+    def add_child(self, node: "PlayNode") -> "PlayNode":
+        self.children().append(self._adopt(node, len(self.children())))
+        return node
+
+    def _adopt(self, node: "PlayNode", row: int) -> "PlayNode":
+        node._parent = self
+        node._row = row
+        return node
+
+    @property
+    def loaded(self) -> bool:
+        return self._children is not None
+
+    def has_children(self) -> bool:
+        # Loader nodes are only created when there is something to load
+        return self._children is None or bool(self._children)
+
+    def children(self) -> List["PlayNode"]:
+        if self._children is None:
+            loader, self._loader = self._loader, None
+            self._children = [self._adopt(node, row) for row, node in enumerate(loader() or [])]
+        return self._children
+
+    def count(self) -> int:
+        """Nodes in this subtree, loading every level"""
+        return 1 + sum(child.count() for child in self.children())
+
+    # QTreeWidgetItem-style accessors
+    def text(self, column: int = 0) -> str:
+        return self.label
+
+    def data(self, column: int = 0, role=None):
+        return self.payload
+
+    def parent(self) -> Optional["PlayNode"]:
+        # Like QTreeWidgetItem, top-level rows have no parent
+        if self._parent is None or self._parent._parent is None:
+            return None
+        return self._parent
+
+    def childCount(self) -> int:
+        return len(self.children())
+
+    def child(self, index: int) -> Optional["PlayNode"]:
+        children = self.children()
+        return children[index] if 0 <= index < len(children) else None
+
+    def __repr__(self):
+        return f"PlayNode({self.label!r})"
+
+
+class PlaysTreeModel(QAbstractItemModel):
+    """Single-column model over a PlayNode tree that fetches each level on expand"""
+
+    def __init__(self, root: PlayNode, header: str = "Play Description", parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.header = header
+
+    def node(self, index: QModelIndex) -> PlayNode:
+        return index.internalPointer() if index.isValid() else self.root
+
+    def index_of(self, node: Optional[PlayNode]) -> QModelIndex:
+        if node is None or node is self.root or node._parent is None:
+            return QModelIndex()
+        return self.createIndex(node._row, 0, node)
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node(parent)
+        if column != 0 or row < 0 or row >= node.fetched:
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children()[row])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        return self.index_of(index.internalPointer()._parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return self.node(parent).fetched
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        return self.node(parent).has_children()
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        return not node.loaded or node.fetched < len(node.children())
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        total = len(node.children())
+        if node.fetched >= total:
+            return
+        self.beginInsertRows(parent, node.fetched, total - 1)
+        node.fetched = total
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.AccessibleTextRole):
+            return node.label
+        if role == Qt.ItemDataRole.BackgroundRole and node.highlight:
+            return QColor(*node.highlight)
+        if role == Qt.ItemDataRole.UserRole:
+            return node.payload
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.header
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
+class PlaysTreeView(QTreeView):
+    """QTreeView for a PlayNode tree with the QTreeWidget lookups the plays dialog uses"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformRowHeights(True)
+
+    def set_root(self, root: PlayNode, header: str = "Play Description"):
+        model = PlaysTreeModel(root, header, self)
+        self.setModel(model)
+        self._expand_defaults(model, QModelIndex())
+
+    def _expand_defaults(self, model: PlaysTreeModel, parent: QModelIndex):
+        # Only nodes built expanded are fetched up front
+        if model.canFetchMore(parent):
+            model.fetchMore(parent)
+        for row in range(model.rowCount(parent)):
+            index = model.index(row, 0, parent)
+            if model.node(index).expanded:
+                self._expand_defaults(model, index)
+                self.expand(index)
+
+    def node(self, index: QModelIndex) -> Optional[PlayNode]:
+        return index.internalPointer() if index.isValid() else None
+
+    def currentItem(self) -> Optional[PlayNode]:
+        return self.node(self.currentIndex())
+
+    def itemAt(self, position) -> Optional[PlayNode]:
+        return self.node(self.indexAt(position))
+
+    def visualItemRect(self, node: PlayNode):
+        return self.visualRect(self.model().index_of(node))
@@ -9,10 +9,11 @@ __author__ = "Kelly Ford"
 __description__ = "Sports Analysis Application with ESPN API integration"
 
 import sys
+import threading
 import webbrowser
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Optional, Union
 # Add project root to sys.path if running as script
 import os
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -44,10 +45,19 @@ except ImportError:
 # New separated modules
 from exceptions import ApiError, DataModelError
 from services.api_service import ApiService
+from services.cache import get_cache
+from services.event_bus import SCORE_CHANGE, LiveGameTracker, get_event_bus
+from services.game_sections import GameSections
+from services.live_delta import score_tuple
+from services.play_classifier import PITCH, batter_hand, group_at_bats, pitch_outcome, play_kind
+from services.play_log import get_play_log
+from services.score_timeline import ScoreTimeline
+from services.poll_scheduler import PollScheduler
 from models.game import GameData
 from models.news import NewsData
 from models.standings import StandingsData
 from accessible_table import AccessibleTable, StandingsTable, LeadersTable, BoxscoreTable, InjuryTable
+from plays_tree import SCORING_HIGHLIGHT, PlayNode, PlaysTreeView
 from windows_notifications import WindowsNotificationHelper
 
 # Audio system for pitch mapping
@@ -69,6 +79,9 @@ LEADERS_HEADERS = ["Category/Player", "Team", "Statistic", "Value"]
 FOCUS_DELAY_MS = 50
 WINDOW_WIDTH = 800  # Increased from 600 for better default size
 WINDOW_HEIGHT = 600  # Increased from 400 for better default size
+ADAPTIVE_REFRESH = -1  # Live scores refresh interval value meaning "per-game adaptive polling"
+ADAPTIVE_TICK_MS = 5000  # How often adaptive mode checks which leagues are due
+FOCUS_SETTLE_MS = 500  # Delay before a newly focused live game gets its full summary
 DIALOG_WIDTH = 800
 DIALOG_HEIGHT = 600
 NEWS_DIALOG_WIDTH = 700
@@ -317,6 +330,10 @@ class BaseView(QWidget):
     def on_show(self):
         pass
     
+    def on_hide(self):
+        """Called when the view is replaced; stop timers and background work here"""
+        pass
+    
     def refresh(self):
         """Override in subclasses to implement refresh functionality"""
         pass
@@ -438,19 +455,48 @@ class LiveScoresView(BaseView):
         
         # Refresh frequency options (in milliseconds)
         self.refresh_intervals = {
+            "Adaptive (per game)": ADAPTIVE_REFRESH,
             "30 seconds": 30000,
             "1 minute": 60000,
             "2 minutes": 120000,
             "Manual (F5 only)": 0
         }
-        self.current_refresh_interval = 60000  # Default to 1 minute
+        self.current_refresh_interval = ADAPTIVE_REFRESH  # Default to adaptive polling
+        # Per-game poll rates for adaptive mode (1 minute base)
+        self.poll_scheduler = PollScheduler(base_interval=60.0)
+        
+        # Progressive loading state: one header + rows per league, in league order
+        try:
+            self.leagues = sorted(ApiService.get_leagues())
+        except ApiError:
+            self.leagues = []
+        self.league_sections = {}
+        self.game_items = {}  # game id -> list item, patched in place on refresh
+        self.loaded_leagues = set()
+        self.no_games_item = None
+        self.live_loader = None
+        self.live_generation = 0  # Bumped per load so late results from older loads are dropped
+        self.league_generations = {}
+        self.paused = False
+        # Rows come from scoreboard situations; summaries only for monitored games and this one
+        self.focused_game_id = None
+        # Changes are detected once per refresh and published to the shared game event bus
+        self.game_tracker = LiveGameTracker()
+        self.event_subscription = None
+        self._subscribe_game_events()
         
         self.setup_ui()
         
         # Setup auto-refresh timer for live updates
         self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_live_scores)
+        self.refresh_timer.timeout.connect(self._on_refresh_timer)
         self._update_refresh_timer()
+        
+        # Fetch the focused game's summary once the selection settles, not on every arrow key
+        self.focus_timer = QTimer()
+        self.focus_timer.setSingleShot(True)
+        self.focus_timer.setInterval(FOCUS_SETTLE_MS)
+        self.focus_timer.timeout.connect(self._on_focus_settled)
     
     def setup_ui(self):
         # Header with current time
@@ -465,7 +511,7 @@ class LiveScoresView(BaseView):
         
         self.refresh_combo = QComboBox()
         self.refresh_combo.addItems(list(self.refresh_intervals.keys()))
-        self.refresh_combo.setCurrentText("1 minute")  # Default selection
+        self.refresh_combo.setCurrentText("Adaptive (per game)")  # Default selection
         self.refresh_combo.currentTextChanged.connect(self._on_refresh_frequency_changed)
         self.refresh_combo.setAccessibleName("Refresh Frequency")
         self.refresh_combo.setAccessibleDescription("Select how often live scores should update automatically")
@@ -483,6 +529,7 @@ class LiveScoresView(BaseView):
         self.live_scores_list.setAccessibleName("Live Scores List")
         self.live_scores_list.setAccessibleDescription("List of currently live games from all sports. Press Alt+M to monitor a game for notifications.")
         self.live_scores_list.itemActivated.connect(self._on_game_selected)
+        self.live_scores_list.currentItemChanged.connect(self._on_current_game_changed)
         self.layout.addWidget(self.live_scores_list)
         
         self._add_nav_buttons()
@@ -519,7 +566,7 @@ class LiveScoresView(BaseView):
             # Update display to remove monitoring indicator
             text = current_item.text()
             if text.endswith(" - monitoring"):
-                current_item.setText(text[:-12])  # Remove " - monitoring"
+                current_item.setText(text[:-len(" - monitoring")])  # Remove " - monitoring"
             self._announce_monitoring(False, game_data)
         else:
             self.monitored_games.add(game_id)
@@ -528,6 +575,9 @@ class LiveScoresView(BaseView):
             if not text.endswith(" - monitoring"):
                 current_item.setText(text + " - monitoring")
             self._announce_monitoring(True, game_data)
+            # Monitored games poll faster; pick this one up on the next tick
+            self.poll_scheduler.mark_due(game_id, game_data.get("league"))
+        self.poll_scheduler.set_monitored(self.monitored_games)
     
     def _announce_monitoring(self, monitoring: bool, game_data: dict):
         """Announce monitoring status change for accessibility"""
@@ -557,6 +607,8 @@ class LiveScoresView(BaseView):
         # Announce the change for accessibility
         if frequency_text == "Manual (F5 only)":
             message = "Automatic refresh disabled. Press F5 to refresh manually."
+        elif self.current_refresh_interval == ADAPTIVE_REFRESH:
+            message = "Adaptive refresh: close and monitored games update faster, breaks and delays slower"
         else:
             message = f"Refresh frequency set to {frequency_text}"
         
@@ -567,7 +619,10 @@ class LiveScoresView(BaseView):
         """Update the refresh timer based on current interval"""
         self.refresh_timer.stop()
         
-        if self.current_refresh_interval > 0:
+        if self.current_refresh_interval == ADAPTIVE_REFRESH:
+            # Tick often; the poll scheduler decides which leagues are actually due
+            self.refresh_timer.start(ADAPTIVE_TICK_MS)
+        elif self.current_refresh_interval > 0:
             self.refresh_timer.start(self.current_refresh_interval)
         # If interval is 0 (manual mode), timer stays stopped
     
@@ -582,116 +637,275 @@ class LiveScoresView(BaseView):
                 self.parent_app.current_league = league
                 self.parent_app.open_game_details(game_id, from_live_scores=True)
     
-    def load_live_scores(self):
-        """Load live scores from all sports"""
-        self.live_scores_list.clear()
-        self.game_data.clear()
+    def _on_refresh_timer(self):
+        if self.current_refresh_interval == ADAPTIVE_REFRESH:
+            due = self.poll_scheduler.due_leagues(self.leagues)
+            if due:
+                self.load_live_scores(leagues=due, adaptive=True)
+        else:
+            self.refresh_live_scores()
+
+    def load_live_scores(self, leagues=None, adaptive=False, restart=False):
+        """Start loading live scores in the background; each league is drawn as soon as it arrives.
+
+        leagues limits the load to a subset; adaptive lets the poll scheduler
+        skip summaries of games that aren't due. restart cancels a load that
+        is still streaming instead of leaving it to finish.
+        """
+        if self.live_loader is not None and self.live_loader.isRunning():
+            if not restart:
+                return  # A refresh is already streaming in
+            self._cancel_live_loader()
+        self.live_generation += 1
+        self._update_time_label()
+        self._show_loading_placeholders(leagues or self.leagues)
+
+        force = not adaptive  # A full refresh fetches every wanted summary now
+
+        def needs_details(game):
+            # Called from fetch workers: only monitored and focused games get a summary
+            game_id = game.get("id", "")
+            if game_id not in self.monitored_games and game_id != self.focused_game_id:
+                return False
+            return self.poll_scheduler.needs_details(game, force=force)
+        self.live_loader = LiveScoresLoader(self.live_generation, leagues, needs_details)
+        self.live_loader.league_loaded.connect(self._on_league_loaded)
+        self.live_loader.error_occurred.connect(self._on_live_scores_error)
+        self.live_loader.load_finished.connect(self._on_live_scores_finished)
+        self.live_loader.start()
+
+    def _on_current_game_changed(self, current, previous):
+        game = current.data(Qt.ItemDataRole.UserRole) if current is not None else None
+        self.focused_game_id = game.get("id") if isinstance(game, dict) else None
+        if self.focused_game_id:
+            self.focus_timer.start()
+        else:
+            self.focus_timer.stop()
+
+    def _on_focus_settled(self):
+        """Pick up the focused game's full summary on the next poll"""
+        game = self.game_data.get(self.focused_game_id or "")
+        if game and self.focused_game_id not in self.monitored_games:
+            self.poll_scheduler.mark_due(self.focused_game_id, game.get("league"))
+
+    def _cancel_live_loader(self):
+        """Stop the streaming load; anything it still emits is dropped as stale"""
+        if self.live_loader is not None:
+            self.live_loader.cancel()
+            self.live_loader = None
+
+    def _subscribe_game_events(self):
+        if self.event_subscription is None:
+            # Monitored games get score announcements; the set is read at publish time
+            self.event_subscription = get_event_bus().subscribe(
+                self._on_game_event, kinds=(SCORE_CHANGE,), game_ids=self.monitored_games)
+
+    def on_hide(self):
+        """Stop polling and cancel in-flight work when the view is hidden or replaced"""
+        self.refresh_timer.stop()
+        self._cancel_live_loader()
+        if self.event_subscription is not None:
+            get_event_bus().unsubscribe(self.event_subscription)
+            self.event_subscription = None
+        self.paused = True
+
+    def hideEvent(self, event):
+        self.on_hide()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.paused:
+            self.paused = False
+            self._subscribe_game_events()
+            self._update_refresh_timer()
+            # Catch up on what changed while hidden
+            self.load_live_scores()
+
+    def _show_loading_placeholders(self, leagues):
+        """Give leagues that have never loaded a header and a loading row"""
+        if self.no_games_item is not None:
+            self.live_scores_list.takeItem(self.live_scores_list.row(self.no_games_item))
+            self.no_games_item = None
+        for league in leagues:
+            if league not in self.league_sections and league not in self.loaded_leagues:
+                placeholder = QListWidgetItem(f"Loading {league} scores...")
+                placeholder.setForeground(QColor(102, 102, 102))
+                self._insert_section(league, [placeholder])
+
+    def _insert_section(self, league: str, items: List[QListWidgetItem]):
+        """Insert a league header plus items, keeping sections in league order"""
+        # Always show league headers for consistency
+        header = QListWidgetItem(f"--- {league} ---")
+        header.setBackground(QColor(240, 240, 240))
+        row = self.live_scores_list.count()
+        for other, other_items in self.league_sections.items():
+            if other > league:
+                row = min(row, self.live_scores_list.row(other_items[0]))
+        for offset, item in enumerate([header] + items):
+            self.live_scores_list.insertItem(row + offset, item)
+        self.league_sections[league] = [header] + items
+
+    def _remove_section(self, league: str):
+        for item in self.league_sections.pop(league, []):
+            data = item.data(Qt.ItemDataRole.UserRole)
+            if isinstance(data, dict):
+                self.game_data.pop(data.get("id", ""), None)
+                self.game_items.pop(data.get("id", ""), None)
+            self.live_scores_list.takeItem(self.live_scores_list.row(item))
+
+    def _on_league_loaded(self, generation: int, league: str, games: Optional[list]):
+        """Patch one league's section with freshly loaded games, touching only rows that changed"""
+        # Drop results older than what this league already shows
+        if generation < self.league_generations.get(league, 0):
+            return
+        self.league_generations[league] = generation
+        if games is None:
+            # Fetch failed: keep the section, tracker snapshot and poll interval as they were
+            section = self.league_sections.get(league)
+            if section and not any(isinstance(item.data(Qt.ItemDataRole.UserRole), dict) for item in section):
+                self._remove_section(league)  # Only a loading row to drop
+            return
+        self.loaded_leagues.add(league)
+        self.poll_scheduler.record_league(league, games)
+        for game in games:
+            if game.pop("details_skipped", False):
+                # Summary wasn't due: keep the last detailed play while the score stands still
+                previous = self.game_data.get(game.get("id", ""))
+                if previous and score_tuple(previous) == score_tuple(game):
+                    game["recent_play"] = previous.get("recent_play", game["recent_play"])
+                elif previous:
+                    self.poll_scheduler.mark_due(game.get("id", ""), league)
+
+        # Publishes score changes etc. to the event bus
+        delta = self.game_tracker.update(league, games)
+
+        if not games:
+            self._remove_section(league)
+            return
+
+        section = self.league_sections.get(league)
+        if section is None or not any(isinstance(item.data(Qt.ItemDataRole.UserRole), dict) for item in section):
+            # First data for this league: replace the loading row wholesale
+            self._remove_section(league)
+            self._insert_section(league, [self._make_game_item(game) for game in games])
+            return
+
+        if not delta:
+            return
+
+        for game in delta.removed:
+            item = self.game_items.pop(game.get("id", ""), None)
+            if item is not None:
+                section.remove(item)
+                self.live_scores_list.takeItem(self.live_scores_list.row(item))
+            self.game_data.pop(game.get("id", ""), None)
+
+        for change in delta.changed:
+            item = self.game_items.get(change.game_id)
+            if item is None:
+                continue
+            # Only rewrite text that actually changed so screen readers aren't re-announced
+            text = self._game_item_text(change.new)
+            if item.text() != text:
+                item.setText(text)
+            item.setData(Qt.ItemDataRole.UserRole, change.new)
+            self.game_data[change.game_id] = change.new
+
+        if delta.added:
+            added_ids = {game.get("id", "") for game in delta.added}
+            previous_item = section[0]
+            for game in games:
+                game_id = game.get("id", "")
+                if game_id in added_ids:
+                    item = self._make_game_item(game)
+                    self.live_scores_list.insertItem(self.live_scores_list.row(previous_item) + 1, item)
+                    section.insert(section.index(previous_item) + 1, item)
+                    previous_item = item
+                elif game_id in self.game_items:
+                    previous_item = self.game_items[game_id]
+
+    def _on_game_event(self, event):
+        """Announce score changes in monitored games"""
+        self._notify_score_change(event.game, score_tuple(event.previous), score_tuple(event.game))
+
+    def _make_game_item(self, game: Dict) -> QListWidgetItem:
+        item = QListWidgetItem(self._game_item_text(game))
+        item.setData(Qt.ItemDataRole.UserRole, game)  # Store full game data
+        game_id = game.get("id", "")
+        if game_id:
+            # Store game data for monitoring
+            self.game_data[game_id] = game
+            self.game_items[game_id] = item
+        return item
+
+    def _game_item_text(self, game: Dict) -> str:
+        text = self._game_display_text(game)
+        if game.get("id", "") in self.monitored_games:
+            text += " - monitoring"
+        return text
+
+    def _on_live_scores_finished(self, generation: int):
+        if generation != self.live_generation:
+            return
         self._update_time_label()
+        if not self.league_sections and self.no_games_item is None:
+            self.no_games_item = QListWidgetItem("No live games currently in progress.")
+            self.live_scores_list.addItem(self.no_games_item)
+
+    def _on_live_scores_error(self, generation: int, message: str):
+        if generation != self.live_generation:
+            return
+        # Drop loading rows for leagues that never arrived
+        for league, items in list(self.league_sections.items()):
+            if not isinstance(items[-1].data(Qt.ItemDataRole.UserRole), dict):
+                self._remove_section(league)
+        self._show_api_error(message)
+
+    def _game_display_text(self, game: Dict) -> str:
+        """Build the list row text for one live game"""
+        game_id = game.get("id", "")
+        game_name = game.get("name", "Unknown Game")
+        status = game.get("status", "")
+        teams = game.get("teams", [])
+        recent_play = game.get("recent_play", "")
+        game_league = game.get("league", "")
+        
+        # Build display text
+        display_text = f"{game_name}"
+        if teams and len(teams) >= 2:
+            team1, team2 = teams[0], teams[1]
+            score1 = team1.get("score", "")
+            score2 = team2.get("score", "")
+            if score1 and score2:
+                display_text += f" - {score1}-{score2}"
+        
+        if status and game_league not in ["NFL", "NCAAF"]:
+            display_text += f" ({status})"
+        
+        # Enhanced display for different sports
+        if recent_play:
+            if game_league in ["NFL", "NCAAF"]:
+                # Enhanced football display with two-line format
+                display_text = self._format_enhanced_football(game_name, teams, status, recent_play, game_id)
+            elif game_league == "MLB":
+                # Enhanced baseball display with base runners, count, and batter info
+                display_text = self._format_enhanced_baseball(game_name, teams, status, recent_play, game_id)
+            else:
+                display_text += f" | {recent_play[:50]}"  # Truncate long plays for other sports
+        else:
+            # Standard format for games without enhanced play info
+            if status:
+                display_text += f" ({status})"
         
-        try:
-            live_games = ApiService.get_live_scores_all_sports()
-            
-            if not live_games:
-                self.live_scores_list.addItem("No live games currently in progress.")
-                return
-            
-            # Group games by league for better organization
-            games_by_league = {}
-            for game in live_games:
-                league = game.get("league", "Unknown")
-                if league not in games_by_league:
-                    games_by_league[league] = []
-                games_by_league[league].append(game)
-            
-            # Add games to list, organized by league
-            for league in sorted(games_by_league.keys()):
-                # Always show league headers for consistency
-                league_item = QListWidgetItem(f"--- {league} ---")
-                league_item.setBackground(QColor(240, 240, 240))
-                self.live_scores_list.addItem(league_item)
-                
-                for game in games_by_league[league]:
-                    game_id = game.get("id", "")
-                    game_name = game.get("name", "Unknown Game")
-                    status = game.get("status", "")
-                    teams = game.get("teams", [])
-                    recent_play = game.get("recent_play", "")
-                    game_league = game.get("league", "")
-                    
-                    # Build display text
-                    display_text = f"{game_name}"
-                    if teams and len(teams) >= 2:
-                        team1, team2 = teams[0], teams[1]
-                        score1 = team1.get("score", "")
-                        score2 = team2.get("score", "")
-                        if score1 and score2:
-                            display_text += f" - {score1}-{score2}"
-                    
-                    if status and game_league not in ["NFL", "NCAAF"]:
-                        display_text += f" ({status})"
-                    
-                    # Enhanced display for different sports
-                    if recent_play:
-                        if game_league in ["NFL", "NCAAF"]:
-                            # Enhanced football display with two-line format
-                            display_text = self._format_enhanced_football(game_name, teams, status, recent_play, game_id)
-                        elif game_league == "MLB":
-                            # Enhanced baseball display with base runners, count, and batter info
-                            display_text = self._format_enhanced_baseball(game_name, teams, status, recent_play, game_id)
-                        else:
-                            display_text += f" | {recent_play[:50]}"  # Truncate long plays for other sports
-                    else:
-                        # Standard format for games without enhanced play info
-                        if status:
-                            display_text += f" ({status})"
-                    
-                    # Note: Monitoring functionality available via Alt+M but not displayed
-                    # if game_id in self.monitored_games:
-                    #     display_text += " - monitoring"
-                    
-                    item = QListWidgetItem(display_text)
-                    item.setData(Qt.ItemDataRole.UserRole, game)  # Store full game data
-                    self.live_scores_list.addItem(item)
-                    
-                    # Store game data for monitoring
-                    if game_id:
-                        self.game_data[game_id] = game
-                        
-        except Exception as e:
-            self._show_api_error(f"Failed to load live scores: {str(e)}")
+        # Note: Monitoring functionality available via Alt+M but not displayed
+        # if game_id in self.monitored_games:
+        #     display_text += " - monitoring"
+        return display_text
     
     def refresh_live_scores(self):
-        """Refresh live scores and check for changes in monitored games"""
-        old_scores = {}
-        
-        # Capture current scores for monitored games
-        for game_id in self.monitored_games:
-            if game_id in self.game_data:
-                game = self.game_data[game_id]
-                teams = game.get("teams", [])
-                if len(teams) >= 2:
-                    old_scores[game_id] = (
-                        teams[0].get("score", ""),
-                        teams[1].get("score", "")
-                    )
-        
-        # Reload the scores
-        self.load_live_scores()
-        
-        # Check for score changes in monitored games
-        for game_id in self.monitored_games:
-            if game_id in self.game_data and game_id in old_scores:
-                game = self.game_data[game_id]
-                teams = game.get("teams", [])
-                if len(teams) >= 2:
-                    new_scores = (
-                        teams[0].get("score", ""),
-                        teams[1].get("score", "")
-                    )
-                    old_score = old_scores[game_id]
-                    
-                    if new_scores != old_score:
-                        self._notify_score_change(game, old_score, new_scores)
+        """Refresh live scores; score changes in monitored games are announced as each league arrives"""
+        self.load_live_scores(restart=True)
     
     def _notify_score_change(self, game, old_scores, new_scores):
         """Notify about score changes in monitored games"""
@@ -702,6 +916,9 @@ class LiveScoresView(BaseView):
             team1_name = teams[0].get("name", "Team 1") 
             team2_name = teams[1].get("name", "Team 2")
             score_text = f"{team1_name} {new_scores[0]} - {team2_name} {new_scores[1]}"
+            scoring_play = self._scoring_play_text(game, new_scores)
+            if scoring_play:
+                score_text += f". {scoring_play}"
             
             # Use Windows UIA notifications for accessibility
             self.notification_helper.notify_score_change(game_name, score_text)
@@ -710,6 +927,21 @@ class LiveScoresView(BaseView):
             self.time_label.setText(f"SCORE UPDATE: {game_name} - {score_text}")
             QTimer.singleShot(5000, self._update_time_label)  # Reset after 5 seconds
     
+    def _scoring_play_text(self, game, new_scores):
+        """Description of the play that produced new_scores, from the game's score timeline if its plays were fetched"""
+        log = get_play_log(game.get("id", ""), create=False)
+        change = log.timeline.last_change() if log is not None else None
+        if change is None:
+            return ""
+        try:
+            scores = sorted(int(float(score)) for score in new_scores)
+        except (TypeError, ValueError):
+            return ""
+        # Team order differs between the scoreboard and the plays, so compare the pair
+        if scores != sorted((change.away, change.home)):
+            return ""
+        return change.text
+    
     def _add_nav_buttons(self):
         """Add navigation buttons"""
         btn_layout = QHBoxLayout()
@@ -894,6 +1126,11 @@ class LeagueView(BaseView):
                 self.scores_list.addItem("--- Teams ---")
                 teams_item = self.scores_list.item(self.scores_list.count()-1)
                 teams_item.setData(Qt.ItemDataRole.UserRole, "__teams__")  # type: ignore
+            # Warm the adjacent days so previous/next day is instant. Today's scoreboard
+            # is live and expires within seconds, so warming it would only add requests
+            today = datetime.now().date()
+            adjacent = [self.current_date - timedelta(days=1), self.current_date + timedelta(days=1)]
+            ApiService.prefetch_scores(self.league, [day for day in adjacent if day != today])
         except Exception as e:
             self._show_api_error(f"Failed to load scores: {str(e)}")
 
@@ -909,8 +1146,7 @@ class LeagueView(BaseView):
         """Show standings dialog with caching and fast background loading"""
         try:
             # Check cache first
-            cache = DataCache()
-            cached_data = cache.get_standings(self.league)
+            cached_data = get_cache().get("standings_data", self.league)
             
             if cached_data:
                 # Use cached data immediately
@@ -933,8 +1169,7 @@ class LeagueView(BaseView):
         """Handle standings data loaded from background thread"""
         try:
             # Cache the data
-            cache = DataCache()
-            cache.set_standings(self.league, standings_data)
+            get_cache().set("standings_data", self.league, standings_data)
             
             # Show the dialog immediately (no loading dialog to close)
             dialog = StandingsDialog(standings_data, self.league, self)
@@ -1019,12 +1254,14 @@ class LeagueView(BaseView):
     
     def previous_day(self):
         """Navigate to previous day"""
+        ApiService.note_navigation()
         self.current_date -= timedelta(days=1)
         self.load_scores()
         self.set_focus_and_select_first(self.scores_list)
     
     def next_day(self):
         """Navigate to next day"""
+        ApiService.note_navigation()
         self.current_date += timedelta(days=1)
         self.load_scores()
         self.set_focus_and_select_first(self.scores_list)
@@ -1102,6 +1339,7 @@ class GameDetailsView(BaseView):
         self.game_id = game_id
         self.config = parent.config if parent else {}
         self.raw_game_data = None  # Store raw data for drill-down access
+        self.sections = None  # Summary sections, parsed when first opened
         
         # Initialize audio pitch mapper
         self.audio_mapper = None
@@ -1147,6 +1385,9 @@ class GameDetailsView(BaseView):
         
         field_name = data.get("field")
         field_data = data.get("data")
+        if field_data is None and field_name and self.sections is not None:
+            # Sections are only prepared once the user opens them
+            field_data = self.sections.get(field_name)
         
         if not field_name or not field_data:
             return
@@ -1205,6 +1446,8 @@ class GameDetailsView(BaseView):
                     tab_widget_ref = child.widget()
                     break
         elif field_name == "plays" and isinstance(field_data, list):
+            # Seed the game's play log so F5 can tell whether anything new arrived
+            get_play_log(self.game_id).ingest(field_data)
             self._add_plays_list_to_layout(layout, field_data)
         elif field_name == "drives" and isinstance(field_data, dict):
             self._add_drives_list_to_layout(layout, field_data)
@@ -1240,10 +1483,15 @@ class GameDetailsView(BaseView):
             if event.key() == Qt.Key.Key_F5:
                 # Refresh the dialog by reloading the data
                 try:
-                    dlg.accept()  # Close current dialog
-                    # Reload and reshow
-                    raw_details = ApiService.get_game_details(self.league, self.game_id)
+                    raw_details = ApiService.get_game_details(self.league, self.game_id, sections=(field_name,))
                     updated_field_data = raw_details.get(field_name)
+                    if field_name == "plays" and isinstance(updated_field_data, list):
+                        if not get_play_log(self.game_id).ingest(updated_field_data):
+                            # No new plays: keep the tree and the reader's place in it
+                            dlg.setWindowTitle(f"{field_name.title()} Details - no new plays")
+                            return
+                    dlg.accept()  # Close current dialog
+                    # Reshow with the new data
                     if updated_field_data:
                         self._show_detail_dialog(field_name, updated_field_data)
                 except Exception as e:
@@ -1340,13 +1588,13 @@ class GameDetailsView(BaseView):
         
         try:
             raw_details = ApiService.get_game_details(self.league, self.game_id)
-            details = ApiService.extract_meaningful_game_info(raw_details)
+            self.sections = GameSections(self.game_id, raw_details, ApiService.extract_game_header_info)
             
             # Store raw details for export functionality
             self.current_raw_details = raw_details
             
-            # Display basic game information
-            self._add_basic_game_info(details)
+            # Display basic game information from the header alone
+            self._add_basic_game_info(self.sections.header())
             
             # Show configurable details
             self._add_configurable_details(raw_details)
@@ -1455,11 +1703,8 @@ class GameDetailsView(BaseView):
                 self.details_list.addItem(item_text)
                 list_item_widget = self.details_list.item(self.details_list.count() - 1)
                 if list_item_widget:
-                    # For news field, pass full raw details to enable game-specific article detection
-                    if field == "news" and hasattr(self, 'current_raw_details'):
-                        list_item_widget.setData(Qt.ItemDataRole.UserRole, {"field": field, "data": self.current_raw_details})
-                    else:
-                        list_item_widget.setData(Qt.ItemDataRole.UserRole, {"field": field, "data": value})
+                    # Data is resolved through self.sections when the item is opened
+                    list_item_widget.setData(Qt.ItemDataRole.UserRole, {"field": field})
             else:
                 try:
                     formatted_value = ApiService.format_complex_data(field, value)
@@ -1981,7 +2226,7 @@ class GameDetailsView(BaseView):
         self.current_plays_data = data
         
         # Detect sport type from data structure or current league
-        sport_type = self._detect_sport_type(data)
+        sport_type = self._memoized("sport_type", data, self._detect_sport_type)
         
         # Add header info with export button
         header_layout = QHBoxLayout()
@@ -2010,25 +2255,24 @@ class GameDetailsView(BaseView):
         
         layout.addLayout(header_layout)
         
-        # Create tree widget for hierarchical view
-        plays_tree = QTreeWidget()
+        # Create tree view for hierarchical view (rows are built as branches are expanded)
+        plays_tree = PlaysTreeView()
         plays_tree.setAccessibleName("Play-by-Play Tree")
         plays_tree.setAccessibleDescription("Hierarchical view of game plays organized by period and drive/inning. Use up/down arrows to navigate, left/right to expand/collapse.")
-        plays_tree.setHeaderLabels(["Play Description"])
         
         # Add custom event handling for better accessibility
-        def on_item_expanded(item):
+        def on_item_expanded(index):
             # Provide accessibility feedback for expansions
-            item_text = item.text(0)
+            item_text = index.data()
             plays_tree.setAccessibleDescription(f"Expanded {item_text}. Use arrow keys to navigate children.")
         
-        def on_item_collapsed(item):
+        def on_item_collapsed(index):
             # Provide accessibility feedback for collapses
-            item_text = item.text(0)
+            item_text = index.data()
             plays_tree.setAccessibleDescription(f"Collapsed {item_text}. Use right arrow to expand.")
         
-        plays_tree.itemExpanded.connect(on_item_expanded)
-        plays_tree.itemCollapsed.connect(on_item_collapsed)
+        plays_tree.expanded.connect(on_item_expanded)
+        plays_tree.collapsed.connect(on_item_collapsed)
         
         # Add context menu for pitch audio options
         def show_context_menu(position):
@@ -2073,12 +2317,13 @@ class GameDetailsView(BaseView):
         self.current_tree_widget = plays_tree
         
         if sport_type == "MLB":
-            self._build_baseball_tree(plays_tree, data)
+            root = self._build_baseball_tree(data)
         elif sport_type == "NFL":
-            self._build_football_tree(plays_tree, data)
+            root = self._build_football_tree(data)
         else:
             # Default to generic organization
-            self._build_generic_tree(plays_tree, data)
+            root = self._build_generic_tree(data)
+        plays_tree.set_root(root, "Play Description")
         
         layout.addWidget(plays_tree)
         
@@ -2395,6 +2640,12 @@ class GameDetailsView(BaseView):
         
         layout.addWidget(drives_tree)
     
+    def _memoized(self, name, data, func):
+        """func(data), reused across reopenings of a section while its data is unchanged"""
+        if self.sections is None:
+            return func(data)
+        return self.sections.derived(name, data, func)
+
     def _detect_sport_type(self, data):
         """Detect sport type from play data or current league"""
         if hasattr(self, 'league') and self.league:
@@ -2413,7 +2664,7 @@ class GameDetailsView(BaseView):
         
         return "Generic"
     
-    def _build_baseball_tree(self, plays_tree, data):
+    def _build_baseball_tree(self, data):
         """Build baseball-specific hierarchical tree with enhanced information"""
         # Group plays by inning/period
         inning_groups = {}
@@ -2435,14 +2686,13 @@ class GameDetailsView(BaseView):
                 # Fallback for other sports or unknown types
                 inning_groups[period_display]["top"].append(play)
         
-        # Calculate running scores and pitcher info
-        score_tracker = self._calculate_running_scores(data)
+        # Running scores come from the game's precomputed score timeline
+        timeline = self._score_timeline(data)
         
-        # Build tree structure
+        # Build tree structure; at-bats and pitches are built when a half inning is expanded
+        root = PlayNode("Play-by-Play")
         for period_display in sorted(inning_groups.keys(), key=lambda x: int(x.split()[0][:-2]) if x.split()[0][:-2].isdigit() else 0):
-            inning_item = QTreeWidgetItem([period_display])
-            inning_item.setExpanded(True)  # Expand by default
-            plays_tree.addTopLevelItem(inning_item)
+            inning_item = root.add_child(PlayNode(period_display, expanded=True))  # Expand by default
             
             period_data = inning_groups[period_display]
             inning_num = period_display.split()[0]  # "1st", "2nd", etc.
@@ -2450,81 +2700,31 @@ class GameDetailsView(BaseView):
             # Add top half (if any plays)
             if period_data["top"]:
                 # Get score after top half and pitcher info
-                half_key = f"{period_display}_top"
-                score_info = score_tracker.get(half_key, {})
+                segment = timeline.segment(f"{period_display}_top")
                 pitcher_info = self._extract_pitcher_info(period_data["top"])
                 
                 # Create enhanced label with score and pitcher
-                label = self._create_enhanced_half_inning_label(f"Top of the {inning_num}", score_info, pitcher_info)
-                top_item = QTreeWidgetItem([label])
-                top_item.setExpanded(True)
-                inning_item.addChild(top_item)
-                self._add_baseball_plays_to_tree_group(top_item, period_data["top"])
+                label = self._create_enhanced_half_inning_label(f"Top of the {inning_num}", segment, pitcher_info)
+                inning_item.add_child(PlayNode(label, loader=lambda plays=period_data["top"]: self._baseball_at_bat_nodes(plays)))
             
             # Add bottom half (if any plays)
             if period_data["bottom"]:
                 # Get score after bottom half and pitcher info
-                half_key = f"{period_display}_bottom"
-                score_info = score_tracker.get(half_key, {})
+                segment = timeline.segment(f"{period_display}_bottom")
                 pitcher_info = self._extract_pitcher_info(period_data["bottom"])
                 
                 # Create enhanced label with score and pitcher
-                label = self._create_enhanced_half_inning_label(f"Bottom of the {inning_num}", score_info, pitcher_info)
-                bottom_item = QTreeWidgetItem([label])
-                bottom_item.setExpanded(True)
-                inning_item.addChild(bottom_item)
-                self._add_baseball_plays_to_tree_group(bottom_item, period_data["bottom"])
-    
-    def _calculate_running_scores(self, plays_data):
-        """Calculate running scores after each half-inning"""
-        score_tracker = {}
-        home_score = 0
-        away_score = 0
-        
-        # Group plays by inning and half for scoring calculations
-        for play in plays_data:
-            period_info = play.get("period", {})
-            period_display = period_info.get("displayValue", "Unknown")
-            period_type = period_info.get("type", "Unknown").lower()
-            
-            # Track scoring plays
-            if play.get("scoringPlay", False):
-                # Extract runs scored from play text
-                runs_scored = self._extract_runs_from_play(play.get("text", ""))
-                team_id = play.get("team", {}).get("id")
-                
-                # Determine if home or away team scored
-                if self._is_home_team_batting(period_type):
-                    home_score += runs_scored
-                else:
-                    away_score += runs_scored
-            
-            # Store score after this half-inning
-            half_key = f"{period_display}_{period_type}"
-            score_tracker[half_key] = {
-                "home": home_score,
-                "away": away_score,
-                "total_runs": home_score + away_score
-            }
+                label = self._create_enhanced_half_inning_label(f"Bottom of the {inning_num}", segment, pitcher_info)
+                inning_item.add_child(PlayNode(label, loader=lambda plays=period_data["bottom"]: self._baseball_at_bat_nodes(plays)))
         
-        return score_tracker
+        return root
     
-    def _extract_runs_from_play(self, play_text):
-        """Extract number of runs scored from a play description"""
-        import re
-        # Look for patterns like "scores", "2 runs score", etc.
-        if "scores" in play_text.lower():
-            # Try to find number before "run" or "runs"
-            match = re.search(r'(\d+)\s+runs?\s+score', play_text.lower())
-            if match:
-                return int(match.group(1))
-            # Single run if just "scores"
-            return 1
-        return 0
-    
-    def _is_home_team_batting(self, period_type):
-        """Determine if home team is batting based on period type"""
-        return period_type == "bottom"
+    def _score_timeline(self, data):
+        """Running scores for the plays shown, from the game's play log when it holds the same plays"""
+        log = get_play_log(self.game_id, create=False) if self.game_id else None
+        if log is not None and len(log) == len(data):
+            return log.timeline
+        return self._memoized("score_timeline", data, ScoreTimeline.from_plays)
     
     def _extract_pitcher_info(self, half_inning_plays):
         """Extract pitcher information from half-inning plays"""
@@ -2550,18 +2750,16 @@ class GameDetailsView(BaseView):
             "changes": pitcher_changes
         }
     
-    def _create_enhanced_half_inning_label(self, base_label, score_info, pitcher_info):
-        """Create enhanced label with score and pitcher information"""
+    def _create_enhanced_half_inning_label(self, base_label, segment, pitcher_info):
+        """Create enhanced label with the score after the half inning (a timeline Segment) and pitcher information"""
         label_parts = [base_label]
         
         # Add score information if available
-        if score_info and score_info.get("total_runs", 0) > 0:
-            away_score = score_info.get("away", 0)
-            home_score = score_info.get("home", 0)
-            label_parts.append(f"({away_score}-{home_score})")
+        if segment and segment.total_runs > 0:
+            label_parts.append(f"({segment.away}-{segment.home})")
         
         # Add pitcher information if available
-        pitcher = pitcher_info.get("pitcher")
+        pitcher = (pitcher_info or {}).get("pitcher")
         if pitcher and pitcher != "Unknown":
             # Keep it concise - just last name if possible
             pitcher_parts = pitcher.split()
@@ -2570,7 +2768,7 @@ class GameDetailsView(BaseView):
         
         return " ".join(label_parts)
     
-    def _build_football_tree(self, plays_tree, data):
+    def _build_football_tree(self, data):
         """Build NFL-specific hierarchical tree"""
         # Group plays by quarter and drive
         quarter_groups = {}
@@ -2592,11 +2790,10 @@ class GameDetailsView(BaseView):
             
             quarter_groups[period_display][drive_key].append(play)
         
-        # Build tree structure
+        # Build tree structure; a drive's plays are built when it is expanded
+        root = PlayNode("Play-by-Play")
         for period_display in sorted(quarter_groups.keys()):
-            quarter_item = QTreeWidgetItem([period_display])
-            quarter_item.setExpanded(True)
-            plays_tree.addTopLevelItem(quarter_item)
+            quarter_item = root.add_child(PlayNode(period_display, expanded=True))
             
             drives = quarter_groups[period_display]
             for drive_key in sorted(drives.keys()):
@@ -2606,13 +2803,12 @@ class GameDetailsView(BaseView):
                     drive_result = self._determine_drive_result(drive_plays)
                     drive_display = f"{drive_key}: {drive_result}" if drive_result else drive_key
                     
-                    drive_item = QTreeWidgetItem([drive_display])
-                    drive_item.setExpanded(False)  # Collapsed by default
-                    quarter_item.addChild(drive_item)
-                    
-                    self._add_football_plays_to_drive(drive_item, drive_plays)
+                    # Collapsed by default
+                    quarter_item.add_child(PlayNode(drive_display, loader=lambda plays=drive_plays: self._football_play_nodes(plays)))
+        
+        return root
     
-    def _build_generic_tree(self, plays_tree, data):
+    def _build_generic_tree(self, data):
         """Build generic hierarchical tree for unknown sports"""
         # Group by period only
         period_groups = {}
@@ -2625,202 +2821,108 @@ class GameDetailsView(BaseView):
             period_groups[period_display].append(play)
         
         # Build simple tree
+        root = PlayNode("Play-by-Play")
         for period_display in sorted(period_groups.keys()):
-            period_item = QTreeWidgetItem([period_display])
-            period_item.setExpanded(True)
-            plays_tree.addTopLevelItem(period_item)
-            
-            for play in period_groups[period_display]:
-                play_text = play.get("text", "Unknown play")
-                play_item = QTreeWidgetItem([play_text])
-                period_item.addChild(play_item)
-    
-    def _add_baseball_plays_to_tree_group(self, parent_item, plays):
-        """Add plays to a tree group, organizing by at-bat with result as main node"""
-        # Filter out transition plays (inning markers, etc.)
-        meaningful_plays = []
-        for play in plays:
-            play_text = play.get("text", "")
-            
-            # Skip inning transition markers and empty plays
-            if (play_text.startswith("Top of the") or 
-                play_text.startswith("Bottom of the") or 
-                play_text.startswith("End of the") or
-                play_text.startswith("Middle of the") or
-                not play_text.strip()):
-                continue
-                
-            meaningful_plays.append(play)
-        
-        # Group plays by at-bat
-        at_bats = []
-        current_at_bat = None
-        
-        for play in meaningful_plays:
-            play_text = play.get("text", "")
-            
-            # Check if this is a batter announcement (start of new at-bat)
-            if " pitches to " in play_text:
-                # End previous at-bat if exists
-                if current_at_bat:
-                    at_bats.append(current_at_bat)
-                
-                # Start new at-bat
-                parts = play_text.split(" pitches to ")
-                if len(parts) >= 2:
-                    batter_name = parts[1].strip()
-                    current_at_bat = {
-                        "batter": batter_name,
-                        "plays": [],
-                        "result": None,
-                        "scoring": False
-                    }
-                continue
-            
-            # Add play to current at-bat
-            if current_at_bat:
-                current_at_bat["plays"].append(play)
-                
-                # Check if this is the result play (final outcome)
-                # Look for player name in the play text to identify result plays
-                batter_name = current_at_bat["batter"]
-                name_words = batter_name.split()
-                
-                # Check if any part of the player's name appears in the play text
-                name_found_in_play = any(name_part.lower() in play_text.lower() 
-                                       for name_part in name_words if len(name_part) > 2)
-                
-                if name_found_in_play or any(outcome in play_text.lower() for outcome in 
-                       ["struck out", "grounded out", "flied out", "popped out", "lined out", 
-                        "fouled out", "reached on error", "singled", "doubled", "tripled", "homered",
-                        "walked", "hit by pitch", "reached on fielder's choice", "reached on",
-                        "grounded into", "flied into", "popped into", "lined into", "single to", "double to"]):
-                    current_at_bat["result"] = play_text
-                    if play.get("scoringPlay", False):
-                        current_at_bat["scoring"] = True
-                        current_at_bat["score"] = f"({play.get('awayScore', 0)}-{play.get('homeScore', 0)})"
-                    
-                    # End this at-bat
-                    at_bats.append(current_at_bat)
-                    current_at_bat = None
-        
-        # Add any remaining at-bat
-        if current_at_bat:
-            # If no clear result, use last play as result
-            if current_at_bat["plays"] and not current_at_bat["result"]:
-                last_play = current_at_bat["plays"][-1]
-                current_at_bat["result"] = last_play.get("text", "At-bat in progress")
-            at_bats.append(current_at_bat)
-        
-        # Create tree nodes for each at-bat
-        for at_bat in at_bats:
-            if not at_bat["batter"] or not at_bat["result"]:
+            root.add_child(PlayNode(period_display, expanded=True,
+                                    loader=lambda plays=period_groups[period_display]: [
+                                        PlayNode(play.get("text", "Unknown play")) for play in plays]))
+        
+        return root
+    
+    def _baseball_at_bat_nodes(self, plays):
+        """Tree nodes for a half inning, organized by at-bat with result as main node"""
+        nodes = []
+        for at_bat in group_at_bats(plays):
+            result_text = at_bat.result_text
+            if not at_bat.batter or not result_text:
                 continue
                 
             # Create main node with batter name and result
-            result_text = at_bat["result"]
-            if at_bat["scoring"]:
-                main_text = f"⚾ {at_bat['batter']}: {result_text} {at_bat.get('score', '')}"
+            if at_bat.scoring:
+                main_text = f"⚾ {at_bat.batter}: {result_text} {at_bat.score}"
             else:
-                main_text = f"{at_bat['batter']}: {result_text}"
-            
-            at_bat_item = QTreeWidgetItem([main_text])
-            at_bat_item.setExpanded(False)  # Collapsed by default
+                main_text = f"{at_bat.batter}: {result_text}"
             
-            # Highlight scoring at-bats
-            if at_bat["scoring"]:
-                at_bat_item.setBackground(0, QColor(255, 255, 150))  # Light yellow
+            # Pitch-by-pitch details (excluding the result play) are built when the at-bat is expanded
+            detail_plays = at_bat.details()
+            loader = (lambda at_bat=at_bat, plays=detail_plays: self._baseball_pitch_nodes(at_bat, plays)) if detail_plays else None
             
-            parent_item.addChild(at_bat_item)
+            # Highlight scoring at-bats; collapsed by default
+            nodes.append(PlayNode(main_text, highlight=SCORING_HIGHLIGHT if at_bat.scoring else None, loader=loader))
+        
+        return nodes
+    
+    def _baseball_pitch_nodes(self, at_bat, plays):
+        """Tree nodes for the pitches and other plays of one at-bat"""
+        nodes = []
+        for play in plays:
+            play_text = play.get("text", "")
             
-            # Add pitch-by-pitch details as children (excluding the result play)
-            pitch_count = 0
-            for play in at_bat["plays"]:
-                play_text = play.get("text", "")
+            # Add pitch details
+            if play_kind(play) == PITCH:
+                # Extract additional pitch details if available
+                enhanced_text = play_text
+                velocity = play.get("pitchVelocity")
+                pitch_type = play.get("pitchType", {})
+                pitch_type_text = pitch_type.get("text", "") if isinstance(pitch_type, dict) else ""
+                pitch_coordinate = play.get("pitchCoordinate", {})
+                # Reset per pitch so a pitch without coordinates doesn't reuse the previous one's
+                espn_x = espn_y = batter_side = None
                 
-                # Skip the result play since it's already in the main node
-                if play_text == at_bat["result"]:
-                    continue
+                # Get pitch location with absolute coordinates
+                location = ""
+                if pitch_coordinate and isinstance(pitch_coordinate, dict):
+                    espn_x = pitch_coordinate.get("x")  # Horizontal (absolute)
+                    espn_y = pitch_coordinate.get("y")  # Vertical (absolute)
+                    if espn_x is not None and espn_y is not None:
+                        # Batter handedness from the pitch's bats field
+                        batter_side = batter_hand(play) or at_bat.batter_hand
+                        
+                        # Fall back to simple heuristics for known players
+                        if not batter_side and 'Lindor' in at_bat.batter:
+                            batter_side = 'L'  # Based on our hit-by-pitch analysis
+                        
+                        # Get location with batter context  
+                        location = get_pitch_location(espn_x, espn_y, batter_side)
                 
-                # Add pitch details
-                if "Pitch" in play_text or any(pitch_type in play_text.lower() for pitch_type in 
-                                             ["ball", "strike", "foul", "looking", "swinging"]):
-                    pitch_count += 1
-                    
-                    # Extract additional pitch details if available
-                    enhanced_text = play_text
-                    velocity = play.get("pitchVelocity")
-                    pitch_type = play.get("pitchType", {})
-                    pitch_type_text = pitch_type.get("text", "") if isinstance(pitch_type, dict) else ""
-                    pitch_coordinate = play.get("pitchCoordinate", {})
-                    
-                    # Get pitch location with absolute coordinates
-                    location = ""
-                    if pitch_coordinate and isinstance(pitch_coordinate, dict):
-                        espn_x = pitch_coordinate.get("x")  # Horizontal (absolute)
-                        espn_y = pitch_coordinate.get("y")  # Vertical (absolute)
-                        if espn_x is not None and espn_y is not None:
-                            # Try to determine batter handedness
-                            batter_side = None
-                            
-                            # Check if we can extract batter info from the play data
-                            if isinstance(play, dict) and 'participants' in play:
-                                for participant in play.get('participants', []):
-                                    if isinstance(participant, dict) and participant.get('type') == 'batter':
-                                        batter_side = participant.get('batSide')
-                                        break
-                            
-                            # For now, use simple heuristics for known players
-                            # TODO: Improve batter data extraction from ESPN API
-                            if not batter_side:
-                                batter_name = at_bat.get('batter', '') if isinstance(at_bat, dict) else ''
-                                if 'Lindor' in batter_name:
-                                    batter_side = 'L'  # Based on our hit-by-pitch analysis
-                                # Add more known players as needed
-                            
-                            # Get location with batter context  
-                            location = get_pitch_location(espn_x, espn_y, batter_side)
-                    
-                    # Build enhanced text with velocity, type, and coordinates
-                    # Note: location now contains coordinates, so no need for separate coordinates_text
-                    details = []
-                    if velocity:
-                        details.append(f"{velocity} mph")
-                    if pitch_type_text:
-                        details.append(pitch_type_text)
-                    
-                        # Show only raw coordinates if available
-                        coord_text = ""
-                        if espn_x is not None and espn_y is not None:
-                            coord_text = f"({espn_x}, {espn_y})"
-                        if details:
-                            detail_text = " ".join(details)
-                            if coord_text:
-                                enhanced_text = f"{play_text} ({detail_text}) - {coord_text}"
-                            else:
-                                enhanced_text = f"{play_text} ({detail_text})"
-                        elif coord_text:
-                            enhanced_text = f"{play_text} - {coord_text}"
+                # Build enhanced text with velocity, type, and coordinates
+                # Note: location now contains coordinates, so no need for separate coordinates_text
+                details = []
+                if velocity:
+                    details.append(f"{velocity} mph")
+                if pitch_type_text:
+                    details.append(pitch_type_text)
+                
+                    # Show only raw coordinates if available
+                    coord_text = ""
+                    if espn_x is not None and espn_y is not None:
+                        coord_text = f"({espn_x}, {espn_y})"
+                    if details:
+                        detail_text = " ".join(details)
+                        if coord_text:
+                            enhanced_text = f"{play_text} ({detail_text}) - {coord_text}"
                         else:
-                            enhanced_text = play_text
-                    
-                    pitch_item = QTreeWidgetItem([f"  {enhanced_text}"])
-                    
-                    # Store pitch data for audio playback
-                    pitch_data = {
-                        'x': espn_x,
-                        'y': espn_y,
-                        'velocity': velocity,
-                        'pitch_type': pitch_type_text,
-                        'batter_hand': batter_side,
-                        'is_pitch': True
-                    }
-                    pitch_item.setData(0, Qt.ItemDataRole.UserRole, pitch_data)
-                    at_bat_item.addChild(pitch_item)
-                else:
-                    # Other play details (substitutions, etc.)
-                    detail_item = QTreeWidgetItem([f"  {play_text}"])
-                    at_bat_item.addChild(detail_item)
+                            enhanced_text = f"{play_text} ({detail_text})"
+                    elif coord_text:
+                        enhanced_text = f"{play_text} - {coord_text}"
+                    else:
+                        enhanced_text = play_text
+                
+                # Store pitch data for audio playback
+                pitch_data = {
+                    'x': espn_x,
+                    'y': espn_y,
+                    'velocity': velocity,
+                    'pitch_type': pitch_type_text,
+                    'batter_hand': batter_side,
+                    'is_pitch': True
+                }
+                nodes.append(PlayNode(f"  {enhanced_text}", payload=pitch_data))
+            else:
+                # Other play details (substitutions, etc.)
+                nodes.append(PlayNode(f"  {play_text}"))
+        
+        return nodes
 
     def _determine_drive_result(self, drive_plays):
         """Determine the result of an NFL drive"""
@@ -2846,8 +2948,9 @@ class GameDetailsView(BaseView):
         else:
             return f"{len(drive_plays)} plays"
     
-    def _add_football_plays_to_drive(self, parent_item, plays):
-        """Add NFL plays to a drive, organizing by meaningful sequences"""
+    def _football_play_nodes(self, plays):
+        """Tree nodes for the plays of an NFL drive"""
+        nodes = []
         for play in plays:
             play_text = play.get("text", "Unknown play")
             
@@ -2864,22 +2967,25 @@ class GameDetailsView(BaseView):
             if yard_line:
                 enhanced_text = f"{enhanced_text} (at {yard_line})"
             
-            # Create play item
-            play_item = QTreeWidgetItem([enhanced_text])
-            
             # Highlight scoring plays
             if play.get("scoringPlay", False):
-                play_item.setBackground(0, QColor(255, 255, 150))  # Light yellow
                 away_score = play.get("awayScore", 0)
                 home_score = play.get("homeScore", 0)
-                play_item.setText(0, f"🏈 {enhanced_text} ({away_score}-{home_score})")
-            
-            parent_item.addChild(play_item)
+                nodes.append(PlayNode(f"🏈 {enhanced_text} ({away_score}-{home_score})", highlight=SCORING_HIGHLIGHT))
+            else:
+                nodes.append(PlayNode(enhanced_text))
+        
+        return nodes
 
     def _is_pitch_item(self, tree_item):
         """Check if the tree item represents a pitch (for audio playback)"""
         if not tree_item:
             return False
+        
+        # Pitch rows carry their pitch data
+        pitch_data = tree_item.data(0, Qt.ItemDataRole.UserRole)
+        if isinstance(pitch_data, dict) and pitch_data.get('is_pitch'):
+            return True
             
         # Check if item text contains pitch-related keywords
         item_text = tree_item.text(0).lower()
@@ -3141,6 +3247,9 @@ class GameDetailsView(BaseView):
             # If we have current plays data, extract pitches from it
             if hasattr(self, 'current_plays_data') and self.current_plays_data:
                 for play in self.current_plays_data:
+                    if play_kind(play) != PITCH:
+                        continue
+                    
                     # Look for pitch coordinate data
                     pitch_coordinate = play.get("pitchCoordinate", {})
                     if pitch_coordinate and isinstance(pitch_coordinate, dict):
@@ -3148,39 +3257,16 @@ class GameDetailsView(BaseView):
                         y = pitch_coordinate.get("y")
                         
                         if x is not None and y is not None:
-                            # Extract additional pitch info from play text
-                            play_text = play.get("text", "")
-                            pitch_type = "Unknown"
-                            velocity = None
-                            result = "Unknown"
-                            
-                            # Try to parse pitch details from text
-                            if "Fastball" in play_text:
-                                pitch_type = "Fastball"
-                            elif "Slider" in play_text:
-                                pitch_type = "Slider"
-                            elif "Changeup" in play_text:
-                                pitch_type = "Changeup"
-                            elif "Curveball" in play_text:
-                                pitch_type = "Curveball"
-                            
-                            # Extract result
-                            if "Strike" in play_text:
-                                result = "Strike"
-                            elif "Ball" in play_text:
-                                result = "Ball"
-                            elif "Foul" in play_text:
-                                result = "Foul"
-                            elif "Hit" in play_text or "In Play" in play_text:
-                                result = "In Play"
+                            pitch_type = play.get("pitchType", {})
+                            pitch_type_text = pitch_type.get("text") if isinstance(pitch_type, dict) else None
                             
                             pitch_data.append({
                                 'x': x,
                                 'y': y,
-                                'type': pitch_type,
-                                'velocity': velocity,
-                                'result': result,
-                                'text': play_text
+                                'type': pitch_type_text or "Unknown",
+                                'velocity': play.get("pitchVelocity"),
+                                'result': pitch_outcome(play),
+                                'text': play.get("text", "")
                             })
             
         except Exception as e:
@@ -3573,6 +3659,7 @@ class GameDetailsView(BaseView):
             else:
                 inning_groups[period_display]["top"].append(play)
         
+        timeline = self._score_timeline(self.current_plays_data)
         html = ""
         for period_display in sorted(inning_groups.keys(), key=lambda x: int(x.split()[0][:-2]) if x.split()[0][:-2].isdigit() else 0):
             period_data = inning_groups[period_display]
@@ -3584,7 +3671,8 @@ class GameDetailsView(BaseView):
             if period_data["top"]:
                 inning_num = period_display.split()[0]
                 html += f'<div class="half-section">'
-                html += f'<h2 class="inning-half-title">Top of the {inning_num}</h2>'
+                title = self._create_enhanced_half_inning_label(f"Top of the {inning_num}", timeline.segment(f"{period_display}_top"), None)
+                html += f'<h2 class="inning-half-title">{title}</h2>'
                 html += self._generate_baseball_at_bats_html_with_lists(period_data["top"])
                 html += '</div>'
             
@@ -3592,7 +3680,8 @@ class GameDetailsView(BaseView):
             if period_data["bottom"]:
                 inning_num = period_display.split()[0]
                 html += f'<div class="half-section">'
-                html += f'<h2 class="inning-half-title">Bottom of the {inning_num}</h2>'
+                title = self._create_enhanced_half_inning_label(f"Bottom of the {inning_num}", timeline.segment(f"{period_display}_bottom"), None)
+                html += f'<h2 class="inning-half-title">{title}</h2>'
                 html += self._generate_baseball_at_bats_html_with_lists(period_data["bottom"])
                 html += '</div>'
             
@@ -3602,171 +3691,68 @@ class GameDetailsView(BaseView):
     
     def _generate_baseball_at_bats_html_with_lists(self, plays):
         """Generate HTML for baseball at-bats using proper list structure"""
-        # Group plays into at-bats with better logic
-        at_bats = []
-        current_at_bat = None
-        
-        for play in plays:
-            play_type = play.get("type", {}).get("type", "")
-            play_text = play.get("text", "")
-            at_bat_id = play.get("atBatId")
-            
-            # Skip only true inning management plays
-            if play_type in ["start-inning", "end-inning"] and "inning" in play_text.lower():
-                continue
-            
-            # Start new at-bat or continue existing one
-            if current_at_bat is None or (at_bat_id and current_at_bat["id"] != at_bat_id):
-                if current_at_bat:
-                    at_bats.append(current_at_bat)
-                
-                # Extract batter name from participants
-                batter_name = "Unknown"
-                participants = play.get("participants", [])
-                for participant in participants:
-                    if participant.get("type") == "batter":
-                        athlete = participant.get("athlete", {})
-                        batter_name = athlete.get("shortName") or athlete.get("displayName") or "Unknown"
-                        break
-                
-                # If we still don't have a name, try the play text
-                if batter_name == "Unknown" and play_text:
-                    # Try to extract name from play text patterns
-                    if " to " in play_text:
-                        parts = play_text.split(" to ")
-                        if len(parts) > 0:
-                            potential_name = parts[0].strip()
-                            if len(potential_name.split()) <= 3:
-                                batter_name = potential_name
-                    elif " struck out" in play_text:
-                        name_part = play_text.split(" struck out")[0].strip()
-                        if len(name_part.split()) <= 3:
-                            batter_name = name_part
-                
-                current_at_bat = {
-                    "id": at_bat_id,
-                    "batter": batter_name,
-                    "result": "",
-                    "plays": [],
-                    "scoring": False,
-                    "score": ""
-                }
-            
-            current_at_bat["plays"].append(play)
-            
-            # Check for scoring play
-            if play.get("scoringPlay", False):
-                current_at_bat["scoring"] = True
-                away_score = play.get("awayScore", 0)
-                home_score = play.get("homeScore", 0)
-                current_at_bat["score"] = f"({away_score}-{home_score})"
-            
-            # Look for at-bat result plays (less restrictive)
-            if not current_at_bat["result"] and play_text:
-                # If it's not just a pitch description, it might be a result
-                if not any(pitch_word in play_text.lower() for pitch_word in 
-                          ["pitch", "ball ", "strike ", "foul tip"]):
-                    current_at_bat["result"] = play_text
-        
-        if current_at_bat:
-            at_bats.append(current_at_bat)
-        
+        at_bats = group_at_bats(plays)
         if not at_bats:
             return '<p>No at-bats in this half inning.</p>'
         
         html = '<ul class="at-bat-list">'
         
         for at_bat in at_bats:
-            # Be less restrictive about showing at-bats
-            if not at_bat["batter"] or at_bat["batter"] == "Unknown":
-                # If no batter name, use the play text as a fallback
-                if at_bat["plays"] and at_bat["plays"][0].get("text"):
-                    at_bat["batter"] = "Play"
-                else:
-                    continue
-            
-            # Use the result or fall back to the most meaningful play
-            result_text = at_bat["result"]
-            if not result_text and at_bat["plays"]:
-                # Find the most meaningful play (not just pitch descriptions)
-                for play in reversed(at_bat["plays"]):  # Start from the end
-                    text = play.get("text", "")
-                    if text and not any(pitch_word in text.lower() for pitch_word in 
-                                      ["pitch ", "ball ", "strike ", "foul tip"]):
-                        result_text = text
-                        break
-                
-                # If still no result, use the last play
-                if not result_text:
-                    result_text = at_bat["plays"][-1].get("text", "")
-            
+            # Without a batter announcement (partial data) label the at-bat generically
+            batter = at_bat.batter or "Play"
+            result_text = at_bat.result_text
             if not result_text:
                 continue
                 
-            scoring_class = "scoring" if at_bat["scoring"] else ""
-            score_text = f" {at_bat['score']}" if at_bat["scoring"] else ""
+            scoring_class = "scoring" if at_bat.scoring else ""
+            score_text = f" {at_bat.score}" if at_bat.scoring else ""
             
             html += f'<li class="at-bat-item {scoring_class}">'
-            html += f'<h3 class="at-bat-heading {scoring_class}">{at_bat["batter"]}: {result_text}{score_text}</h3>'
+            html += f'<h3 class="at-bat-heading {scoring_class}">{batter}: {result_text}{score_text}</h3>'
             
             # Add pitch details as a nested list
             pitch_plays = []
-            for play in at_bat["plays"]:
+            for play in at_bat.pitches:
+                # Extract additional pitch details if available (same logic as tree view)
                 play_text = play.get("text", "")
+                enhanced_text = play_text
+                velocity = play.get("pitchVelocity")
+                pitch_type = play.get("pitchType", {})
+                pitch_type_text = pitch_type.get("text", "") if isinstance(pitch_type, dict) else ""
+                pitch_coordinate = play.get("pitchCoordinate", {})
                 
-                # Skip the result play and include pitch-related plays
-                if play_text != result_text and any(pitch_keyword in play_text.lower() for pitch_keyword in 
-                       ["ball", "strike", "foul", "looking", "swinging", "pitch"]):
-                    
-                    # Extract additional pitch details if available (same logic as tree view)
-                    enhanced_text = play_text
-                    velocity = play.get("pitchVelocity")
-                    pitch_type = play.get("pitchType", {})
-                    pitch_type_text = pitch_type.get("text", "") if isinstance(pitch_type, dict) else ""
-                    pitch_coordinate = play.get("pitchCoordinate", {})
-                    
-                    # Get pitch location with absolute coordinates (same logic as tree view)
-                    location = ""
-                    if pitch_coordinate and isinstance(pitch_coordinate, dict):
-                        espn_x = pitch_coordinate.get("x")  # Horizontal (absolute)
-                        espn_y = pitch_coordinate.get("y")  # Vertical (absolute)
-                        if espn_x is not None and espn_y is not None:
-                            # Try to determine batter handedness (simplified)
-                            batter_side = None
-                            
-                            # Check if we can extract batter info from the play data (safely)
-                            if isinstance(play, dict) and 'participants' in play:
-                                for participant in play.get('participants', []):
-                                    if isinstance(participant, dict) and participant.get('type') == 'batter':
-                                        batter_side = participant.get('batSide')
-                                        break
-                            
-                            # Use simple heuristics for known players
-                            # TODO: Improve batter data extraction from ESPN API
-                            
-                            # Get location with batter context
-                            location = get_pitch_location(espn_x, espn_y, batter_side)
-                    
-                    # Build enhanced text with velocity, type, and coordinates
-                    # Note: location now contains coordinates, so no need for separate coordinates_text
-                    details = []
-                    if velocity:
-                        details.append(f"{velocity} mph")
-                    if pitch_type_text:
-                        details.append(pitch_type_text)
-                    
-                    if details:
-                        detail_text = " ".join(details)
-                        if location:
-                            enhanced_text = f"{play_text} ({detail_text}) - {location}"
-                        else:
-                            enhanced_text = f"{play_text} ({detail_text})"
-                    elif location:
-                        enhanced_text = f"{play_text} - {location}"
+                # Get pitch location with absolute coordinates (same logic as tree view)
+                location = ""
+                if pitch_coordinate and isinstance(pitch_coordinate, dict):
+                    espn_x = pitch_coordinate.get("x")  # Horizontal (absolute)
+                    espn_y = pitch_coordinate.get("y")  # Vertical (absolute)
+                    if espn_x is not None and espn_y is not None:
+                        # Batter handedness from the pitch's bats field
+                        batter_side = batter_hand(play) or at_bat.batter_hand
+                        
+                        # Get location with batter context
+                        location = get_pitch_location(espn_x, espn_y, batter_side)
+                
+                # Build enhanced text with velocity, type, and coordinates
+                # Note: location now contains coordinates, so no need for separate coordinates_text
+                details = []
+                if velocity:
+                    details.append(f"{velocity} mph")
+                if pitch_type_text:
+                    details.append(pitch_type_text)
+                
+                if details:
+                    detail_text = " ".join(details)
+                    if location:
+                        enhanced_text = f"{play_text} ({detail_text}) - {location}"
                     else:
-                        enhanced_text = play_text
-                    
-                    pitch_plays.append(enhanced_text)
+                        enhanced_text = f"{play_text} ({detail_text})"
+                elif location:
+                    enhanced_text = f"{play_text} - {location}"
+                else:
+                    enhanced_text = play_text
+                
+                pitch_plays.append(enhanced_text)
             
             if pitch_plays:
                 html += '<ul class="pitch-list">'
@@ -3782,126 +3768,6 @@ class GameDetailsView(BaseView):
         html += '</ul>'
         return html
     
-    def _generate_baseball_at_bats_html(self, plays):
-        """Generate HTML for baseball at-bats"""
-        # Group plays into at-bats with better logic
-        at_bats = []
-        current_at_bat = None
-        
-        for play in plays:
-            play_type = play.get("type", {}).get("type", "")
-            play_text = play.get("text", "")
-            at_bat_id = play.get("atBatId")
-            
-            # Skip only true inning management plays
-            if play_type in ["start-inning", "end-inning"] and "inning" in play_text.lower():
-                continue
-            
-            # Start new at-bat or continue existing one
-            if current_at_bat is None or (at_bat_id and current_at_bat["id"] != at_bat_id):
-                if current_at_bat:
-                    at_bats.append(current_at_bat)
-                
-                # Extract batter name from participants
-                batter_name = "Unknown"
-                participants = play.get("participants", [])
-                for participant in participants:
-                    if participant.get("type") == "batter":
-                        athlete = participant.get("athlete", {})
-                        batter_name = athlete.get("shortName") or athlete.get("displayName") or "Unknown"
-                        break
-                
-                # If we still don't have a name, try the play text
-                if batter_name == "Unknown" and play_text:
-                    # Try to extract name from play text patterns
-                    if " to " in play_text:
-                        # Pattern: "John Smith to first base"
-                        parts = play_text.split(" to ")
-                        if len(parts) > 0:
-                            potential_name = parts[0].strip()
-                            if len(potential_name.split()) <= 3:  # Reasonable name length
-                                batter_name = potential_name
-                    elif " struck out" in play_text:
-                        # Pattern: "Smith struck out swinging"
-                        name_part = play_text.split(" struck out")[0].strip()
-                        if len(name_part.split()) <= 3:
-                            batter_name = name_part
-                
-                current_at_bat = {
-                    "id": at_bat_id,
-                    "batter": batter_name,
-                    "result": "",
-                    "plays": [],
-                    "scoring": False,
-                    "score": ""
-                }
-            
-            current_at_bat["plays"].append(play)
-            
-            # Check for scoring play
-            if play.get("scoringPlay", False):
-                current_at_bat["scoring"] = True
-                away_score = play.get("awayScore", 0)
-                home_score = play.get("homeScore", 0)
-                current_at_bat["score"] = f"({away_score}-{home_score})"
-            
-            # Look for at-bat result plays (less restrictive)
-            if not current_at_bat["result"] and play_text:
-                # If it's not just a pitch description, it might be a result
-                if not any(pitch_word in play_text.lower() for pitch_word in 
-                          ["pitch", "ball ", "strike ", "foul tip"]):
-                    current_at_bat["result"] = play_text
-        
-        if current_at_bat:
-            at_bats.append(current_at_bat)
-        
-        html = ""
-        for at_bat in at_bats:
-            # Be less restrictive about showing at-bats
-            if not at_bat["batter"] or at_bat["batter"] == "Unknown":
-                # If no batter name, use the play text as a fallback
-                if at_bat["plays"] and at_bat["plays"][0].get("text"):
-                    at_bat["batter"] = "Play"
-                else:
-                    continue
-            
-            # Use the result or fall back to the most meaningful play
-            result_text = at_bat["result"]
-            if not result_text and at_bat["plays"]:
-                # Find the most meaningful play (not just pitch descriptions)
-                for play in reversed(at_bat["plays"]):  # Start from the end
-                    text = play.get("text", "")
-                    if text and not any(pitch_word in text.lower() for pitch_word in 
-                                      ["pitch ", "ball ", "strike ", "foul tip"]):
-                        result_text = text
-                        break
-                
-                # If still no result, use the last play
-                if not result_text:
-                    result_text = at_bat["plays"][-1].get("text", "")
-            
-            if not result_text:
-                continue
-                
-            scoring_class = "scoring" if at_bat["scoring"] else ""
-            score_text = f" {at_bat['score']}" if at_bat["scoring"] else ""
-            
-            html += f'<div class="at-bat {scoring_class}">'
-            html += f'<strong>{at_bat["batter"]}: {result_text}{score_text}</strong>'
-            
-            # Add pitch details (but filter out the result play to avoid duplication)
-            for play in at_bat["plays"]:
-                play_text = play.get("text", "")
-                
-                # Skip the result play and include pitch-related plays
-                if play_text != result_text and any(pitch_keyword in play_text.lower() for pitch_keyword in 
-                       ["ball", "strike", "foul", "looking", "swinging", "pitch"]):
-                    html += f'<div class="pitch">{play_text}</div>'
-            
-            html += '</div>'
-        
-        return html
-    
     def _generate_football_html(self):
         """Generate HTML for football game log"""
         # Group by quarter and drive
@@ -4918,6 +4784,42 @@ class StandingsLoader(QThread):
             self.error_occurred.emit(f"Failed to load standings: {str(e)}")
 
 
+class LiveScoresLoader(QThread):
+    """Background thread streaming live games one league at a time"""
+    league_loaded = pyqtSignal(int, str, object)  # games list, or None when the league's fetch failed
+    load_finished = pyqtSignal(int)
+    error_occurred = pyqtSignal(int, str)
+    
+    # Loaders stay referenced until their thread exits, even after the view that
+    # started them is gone, so a cancelled QThread is never destroyed while running
+    _active = set()
+    
+    def __init__(self, generation: int, leagues=None, needs_details=None):
+        super().__init__()
+        self.generation = generation
+        self.leagues = leagues
+        self.needs_details = needs_details
+        self.cancelled = threading.Event()
+        LiveScoresLoader._active.add(self)
+        self.finished.connect(lambda: LiveScoresLoader._active.discard(self))
+    
+    def cancel(self):
+        self.cancelled.set()
+    
+    def run(self):
+        try:
+            for league, games in ApiService.iter_live_scores_all_sports(self.leagues, self.needs_details, self.cancelled,
+                                                                        tiered=True):
+                if self.cancelled.is_set():
+                    return
+                self.league_loaded.emit(self.generation, league, games)
+            if not self.cancelled.is_set():
+                self.load_finished.emit(self.generation)
+        except Exception as e:
+            if not self.cancelled.is_set():
+                self.error_occurred.emit(self.generation, f"Failed to load live scores: {str(e)}")
+
+
 class GameDetailsDialog(QDialog):
     """Dialog wrapper for GameDetailsView to show game details"""
     
@@ -5199,48 +5101,6 @@ class TeamScheduleLoader(QThread):
             self.error_occurred.emit(f"Failed to load schedule: {str(e)}")
 
 
-# Caching system for improved performance
-class DataCache:
-    """Simple cache for standings and team data"""
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.standings_cache = {}
-            cls._instance.schedule_cache = {}
-            cls._instance.cache_timeout = 300  # 5 minutes
-        return cls._instance
-    
-    def get_standings(self, league: str):
-        """Get cached standings data"""
-        key = f"standings_{league}"
-        if key in self.standings_cache:
-            data, timestamp = self.standings_cache[key]
-            if time.time() - timestamp < self.cache_timeout:
-                return data
-        return None
-    
-    def set_standings(self, league: str, data):
-        """Cache standings data"""
-        key = f"standings_{league}"
-        self.standings_cache[key] = (data, time.time())
-    
-    def get_schedule(self, team_id: str):
-        """Get cached schedule data"""
-        key = f"schedule_{team_id}"
-        if key in self.schedule_cache:
-            data, timestamp = self.schedule_cache[key]
-            if time.time() - timestamp < self.cache_timeout:
-                return data
-        return None
-    
-    def set_schedule(self, team_id: str, data):
-        """Cache schedule data"""
-        key = f"schedule_{team_id}"
-        self.schedule_cache[key] = (data, time.time())
-
-
 class StandingsDialog(QDialog):
     """Dialog for displaying team standings (invoked from league view)"""
     
@@ -6906,9 +6766,12 @@ class SportsScoresApp(QWidget):
         self._switch_to_view(league_view, "league", data)
 
     def _switch_to_view(self, view: BaseView, view_type: str, data: Any):
+        ApiService.note_navigation()
         # Clear existing widgets
         while self.stacked_widget.count():
             w = self.stacked_widget.widget(0)
+            if hasattr(w, 'on_hide'):
+                w.on_hide()
             self.stacked_widget.removeWidget(w)
             w.deleteLater()
         self.stacked_widget.addWidget(view)
@@ -1,16 +1,31 @@
-from typing import Any, Dict, List
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import espn_api
+from services import http_client, single_flight
+from services.deadline import deadline
+from services.request_scheduler import Priority, note_navigation, request_priority
 from exceptions import ApiError
 
 __all__ = ["ApiService"]
 
+# Seconds an ApiService call may spend on the network before its requests fail
+DEFAULT_DEADLINE = 15.0
+DEADLINES = {
+    # Fan-outs of dozens of requests, partly at background priority
+    "get_statistics": 60.0,
+    "get_player_statistics": 60.0,
+    "get_team_statistics": 60.0,
+    "get_live_scores_all_sports": 20.0,
+}
+
 class ApiService:
     """Service class to wrap espn_api functions with uniform error handling."""
 
     @staticmethod
     def _call(func, *args, **kwargs):
         try:
-            return func(*args, **kwargs)
+            with deadline(DEADLINES.get(func.__name__, DEFAULT_DEADLINE)):
+                return func(*args, **kwargs)
         except Exception as e:
             raise ApiError(str(e)) from e
 
@@ -39,13 +54,17 @@ class ApiService:
         return ApiService._call(espn_api.get_available_seasons, league)
 
     @staticmethod
-    def get_game_details(league: str, game_id: str) -> Dict:
-        return ApiService._call(espn_api.get_game_details, league, game_id)
+    def get_game_details(league: str, game_id: str, sections=None) -> Dict:
+        return ApiService._call(espn_api.get_game_details, league, game_id, sections=sections)
 
     @staticmethod
     def extract_meaningful_game_info(details: Dict) -> Dict:
         return ApiService._call(espn_api.extract_meaningful_game_info, details)
 
+    @staticmethod
+    def extract_game_header_info(details: Dict) -> Dict:
+        return ApiService._call(espn_api.extract_game_header_info, details)
+
     @staticmethod
     def format_complex_data(key: str, value: Any) -> str:
         return ApiService._call(espn_api.format_complex_data, key, value)
@@ -54,6 +73,23 @@ class ApiService:
     def get_live_scores_all_sports() -> List[Dict]:
         return ApiService._call(espn_api.get_live_scores_all_sports)
 
+    @staticmethod
+    def iter_live_scores_all_sports(leagues=None, needs_details=None, cancelled=None,
+                                    tiered=False) -> Iterator[Tuple[str, Optional[List[Dict]]]]:
+        """Yield (league, live games) as each league finishes loading; stops once cancelled is set.
+
+        With tiered, rows come from scoreboard situations and only games
+        accepted by needs_details get a summary. A league whose fetch failed
+        yields None rather than an empty list.
+        """
+        try:
+            # Consumed by a single loader thread, so the deadline spans the whole iteration
+            with deadline(DEADLINES["get_live_scores_all_sports"]):
+                yield from espn_api.iter_live_scores_all_sports(leagues=leagues, needs_details=needs_details,
+                                                                cancelled=cancelled, tiered=tiered)
+        except Exception as e:
+            raise ApiError(str(e)) from e
+
     @staticmethod
     def get_statistics(league: str) -> Dict:
         return ApiService._call(espn_api.get_statistics, league)
@@ -67,3 +103,63 @@ class ApiService:
     def get_team_statistics(league: str) -> Dict:
         """Get only team statistics for a league (faster)"""
         return ApiService._call(espn_api.get_team_statistics, league)
+
+    @staticmethod
+    def get_transport_stats() -> Dict[str, Dict[str, int]]:
+        """Connection pool hit/miss counters per host"""
+        return http_client.pool_stats()
+
+    @staticmethod
+    def get_http_cache_stats() -> Dict[str, int]:
+        """Conditional-request cache hits and bytes saved"""
+        return http_client.cache_stats()
+
+    @staticmethod
+    def get_dedup_stats() -> Dict[str, Dict[str, int]]:
+        """Requests and espn_api calls that joined an identical in-flight call"""
+        return {"requests": http_client.dedup_stats(), "calls": single_flight.stats()}
+
+    @staticmethod
+    def get_memory_cache_stats() -> Dict:
+        """Entries, bytes and hit ratio per endpoint class of the shared TTL cache"""
+        return http_client.memory_cache_stats()
+
+    @staticmethod
+    def get_scheduler_stats() -> Dict:
+        """Requests admitted, queued and rate limited by the shared request scheduler"""
+        return http_client.scheduler_stats()
+
+    @staticmethod
+    def note_navigation():
+        """Pause background network work briefly while the user changes views"""
+        note_navigation()
+
+    @staticmethod
+    def prefetch_scores(league: str, dates) -> None:
+        """Warm the cache for dates in a daemon thread at PREFETCH priority"""
+        def run():
+            with request_priority(Priority.PREFETCH):
+                for date in dates:
+                    try:
+                        espn_api.get_scores(league, date)
+                    except Exception as e:
+                        print(f"Prefetch of {league} scores for {date} failed: {e}")
+        threading.Thread(target=run, name=f"prefetch-{league}", daemon=True).start()
+
+    @staticmethod
+    def warm_final_summaries(date=None, leagues=None) -> Dict[str, int]:
+        """Store completed games' summaries for a date (default yesterday) on disk"""
+        try:
+            return espn_api.warm_final_summaries(date, leagues)
+        except Exception as e:
+            raise ApiError(str(e)) from e
+
+    @staticmethod
+    def get_final_store_stats() -> Dict[str, int]:
+        """Hits, evictions and compressed size of the finished-game summary store"""
+        return http_client.final_store_stats()
+
+    @staticmethod
+    def get_latency_stats() -> Dict[str, Dict]:
+        """Per-endpoint latency histograms and hedged request counters"""
+        return {"endpoints": http_client.latency_stats(), "hedging": http_client.hedge_stats()}
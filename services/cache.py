@@ -0,0 +1,255 @@
+"""
+In-memory TTL cache with per-endpoint policies and a byte-bounded LRU.
+
+Every entry belongs to an endpoint class (live scoreboard, standings, game
+summary, ...). POLICIES declares how long each class stays valid; the whole
+cache shares one approximate byte budget and evicts least recently used
+entries when it is exceeded. All access is lock protected so QThread loaders
+and thread pool workers can share it.
+"""
+
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+
+from services.final_store import is_final_summary
+
+__all__ = ["CachePolicy", "TTLCache", "POLICIES", "FOREVER", "classify_url", "get_cache", "approximate_size"]
+
+# TTL value meaning "never expires" (entry stays until evicted by the LRU)
+FOREVER = None
+
+# Default budget for the shared cache
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+TTL = Union[int, float, None]
+
+
+class CachePolicy:
+    """How long entries of one endpoint class stay valid.
+
+    ttl is a number of seconds, FOREVER, or a callable (key, value) -> ttl for
+    classes whose lifetime depends on the request or payload.
+    """
+
+    def __init__(self, ttl: Union[TTL, Callable[[Hashable, Any], TTL]]):
+        self.ttl = ttl
+
+    def ttl_for(self, key: Hashable, value: Any) -> TTL:
+        if callable(self.ttl):
+            return self.ttl(key, value)
+        return self.ttl
+
+
+_DATES_RE = re.compile(r"[?&]dates=(\d{8})(?:-(\d{8}))?")
+_SEASON_RE = re.compile(r"[?&]season=(\d{4})")
+
+
+# Scoreboards for days that haven't started: no live scores, only the odd schedule change
+FUTURE_SCOREBOARD_TTL = 300
+
+
+def _scoreboard_ttl(url, value) -> TTL:
+    # Scoreboards for days that are already over never change
+    match = _DATES_RE.search(str(url))
+    if match:
+        today = datetime.now().strftime("%Y%m%d")
+        last_day = match.group(2) or match.group(1)
+        if last_day < today:
+            return FOREVER
+        if match.group(1) > today:
+            return FUTURE_SCOREBOARD_TTL
+    return 10
+
+
+def _season_ttl(default: TTL) -> Callable[[Hashable, Any], TTL]:
+    # Schedules and leaders for past seasons are historical and never change
+    def ttl(url, value) -> TTL:
+        match = _SEASON_RE.search(str(url))
+        if match and int(match.group(1)) < datetime.now().year:
+            return FOREVER
+        return default
+    return ttl
+
+
+def _summary_ttl(url, value) -> TTL:
+    # Finished games are immutable; anything else is live or upcoming
+    return FOREVER if is_final_summary(value) else 10
+
+
+POLICIES: Dict[str, CachePolicy] = {
+    # Raw API responses, classified by classify_url()
+    "scoreboard": CachePolicy(_scoreboard_ttl),
+    "events": CachePolicy(10),
+    "summary": CachePolicy(_summary_ttl),
+    "standings": CachePolicy(300),
+    "news": CachePolicy(300),
+    "teams": CachePolicy(3600),
+    "schedule": CachePolicy(_season_ttl(300)),
+    "statistics": CachePolicy(_season_ttl(900)),
+    "default": CachePolicy(60),
+    # Parsed data cached by the UI
+    "standings_data": CachePolicy(300),
+}
+
+# First matching rule wins
+ENDPOINT_RULES = [
+    (re.compile(r"/scoreboard"), "scoreboard"),
+    (re.compile(r"/events(\?|$)"), "events"),
+    (re.compile(r"/summary"), "summary"),
+    (re.compile(r"/standings"), "standings"),
+    (re.compile(r"/news"), "news"),
+    (re.compile(r"/teams/[^/?]+/schedule"), "schedule"),
+    (re.compile(r"/statistics|/leaders|/stats/|/athletes"), "statistics"),
+    (re.compile(r"/teams"), "teams"),
+]
+
+
+def classify_url(url: str) -> str:
+    """Map an API URL to its endpoint class in POLICIES"""
+    for pattern, endpoint in ENDPOINT_RULES:
+        if pattern.search(url):
+            return endpoint
+    return "default"
+
+
+def approximate_size(value: Any, _depth: int = 0) -> int:
+    """Rough resident size of a value in bytes (containers are walked recursively)"""
+    content = getattr(value, "content", None)
+    if isinstance(content, bytes):
+        # requests.Response: the body dominates
+        return len(content) + 512
+    size = sys.getsizeof(value)
+    if _depth > 6:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += approximate_size(k, _depth + 1) + approximate_size(v, _depth + 1)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            size += approximate_size(item, _depth + 1)
+    return size
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value, size, expires_at):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class TTLCache:
+    """Thread-safe LRU bounded by approximate bytes, with TTLs from a policy table"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, policies: Optional[Dict[str, CachePolicy]] = None):
+        self.max_bytes = max_bytes
+        self.policies = policies if policies is not None else POLICIES
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._endpoint_stats: Dict[str, Dict[str, int]] = {}
+
+    def _counter(self, endpoint: str) -> Dict[str, int]:
+        counter = self._endpoint_stats.get(endpoint)
+        if counter is None:
+            counter = {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "bytes": 0}
+            self._endpoint_stats[endpoint] = counter
+        return counter
+
+    def _remove(self, cache_key: tuple, evicted: bool = False):
+        entry = self._entries.pop(cache_key)
+        self._bytes -= entry.size
+        counter = self._counter(cache_key[0])
+        counter["entries"] -= 1
+        counter["bytes"] -= entry.size
+        if evicted:
+            counter["evictions"] += 1
+
+    def get(self, endpoint: str, key: Hashable) -> Any:
+        """Return the cached value or None if missing or expired"""
+        cache_key = (endpoint, key)
+        with self._lock:
+            counter = self._counter(endpoint)
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                counter["misses"] += 1
+                return None
+            if entry.expires_at is not None and time.time() >= entry.expires_at:
+                self._remove(cache_key)
+                counter["misses"] += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            counter["hits"] += 1
+            return entry.value
+
+    def set(self, endpoint: str, key: Hashable, value: Any, size: Optional[int] = None):
+        policy = self.policies.get(endpoint) or self.policies["default"]
+        ttl = policy.ttl_for(key, value)
+        if ttl is not None and ttl <= 0:
+            return
+        size = approximate_size(value) if size is None else size
+        if size > self.max_bytes:
+            return
+        expires_at = None if ttl is FOREVER else time.time() + ttl
+
+        cache_key = (endpoint, key)
+        with self._lock:
+            if cache_key in self._entries:
+                self._remove(cache_key)
+            self._entries[cache_key] = _Entry(value, size, expires_at)
+            self._bytes += size
+            counter = self._counter(endpoint)
+            counter["entries"] += 1
+            counter["bytes"] += size
+
+            # Evict least recently used entries until back under budget
+            while self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key, evicted=True)
+
+    def invalidate(self, endpoint: str, key: Hashable):
+        with self._lock:
+            if (endpoint, key) in self._entries:
+                self._remove((endpoint, key))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for counter in self._endpoint_stats.values():
+                counter["entries"] = 0
+                counter["bytes"] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Overall size plus hit ratio, entries and bytes per endpoint class"""
+        with self._lock:
+            endpoints = {}
+            for endpoint, counter in self._endpoint_stats.items():
+                lookups = counter["hits"] + counter["misses"]
+                endpoints[endpoint] = dict(counter, hit_ratio=counter["hits"] / lookups if lookups else 0.0)
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "endpoints": endpoints,
+            }
+
+
+_cache: Optional[TTLCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> TTLCache:
+    """Process-wide cache shared by the transport and the UI"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TTLCache()
+    return _cache
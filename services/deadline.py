@@ -0,0 +1,88 @@
+"""
+Per-thread request deadlines.
+
+ApiService opens a deadline around every call; each HTTP request made
+underneath (including ones joined through single-flight) caps its timeout to
+the time left, and a request started after the deadline fails straight away
+with DeadlineExceeded. Deadlines only nest inwards: an inner deadline can
+shorten the outer one but never extend it.
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+import requests
+
+__all__ = ["DeadlineExceeded", "deadline", "remaining", "cap_timeout", "propagate"]
+
+
+class DeadlineExceeded(requests.Timeout):
+    """The caller's deadline passed before the request could complete"""
+
+
+_local = threading.local()
+
+
+def _current() -> Optional[float]:
+    return getattr(_local, "expires_at", None)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the calling thread's deadline, or None if it has none"""
+    expires_at = _current()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """Run the block with a deadline seconds from now (None leaves the current one)"""
+    previous = _current()
+    expires_at = previous
+    if seconds is not None:
+        expires_at = time.monotonic() + seconds
+        if previous is not None:
+            expires_at = min(expires_at, previous)
+    _local.expires_at = expires_at
+    try:
+        yield
+    finally:
+        _local.expires_at = previous
+
+
+def cap_timeout(timeout):
+    """Shrink a requests timeout (number or (connect, read) tuple) to the time left.
+
+    Raises DeadlineExceeded when the deadline has already passed. The read
+    timeout applies per socket read, so the cap bounds a stalled response
+    rather than the exact total duration.
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    if timeout is None:
+        return left
+    if isinstance(timeout, tuple):
+        return tuple(left if t is None else min(t, left) for t in timeout)
+    return min(timeout, left)
+
+
+def propagate(func: Callable) -> Callable:
+    """Wrap func so it runs under the calling thread's current deadline (for thread pools)"""
+    expires_at = _current()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = _current()
+        _local.expires_at = expires_at
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.expires_at = previous
+    return wrapper
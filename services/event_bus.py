@@ -0,0 +1,204 @@
+"""
+In-process publish/subscribe bus for live game events.
+
+The polling layer feeds each league refresh to a LiveGameTracker, which
+diffs it once against the previous snapshot and publishes normalized
+GameEvents (score, lead, period and play changes). The live view,
+notifications, exporters and the headless monitor subscribe instead of
+each comparing scores themselves, so detection runs once per refresh and
+a new consumer costs no extra requests.
+"""
+
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+from services.live_delta import GameChange, LiveDelta, diff_games, score_tuple
+
+__all__ = [
+    "GameEvent", "GameEventBus", "LiveGameTracker", "detect_events", "get_event_bus",
+    "SCORE_CHANGE", "LEAD_CHANGE", "PERIOD_CHANGE", "PLAY", "EVENT_KINDS",
+]
+
+SCORE_CHANGE = "score_change"
+LEAD_CHANGE = "lead_change"
+PERIOD_CHANGE = "period_change"
+PLAY = "play"
+EVENT_KINDS = (SCORE_CHANGE, LEAD_CHANGE, PERIOD_CHANGE, PLAY)
+
+
+class GameEvent:
+    """One change to a live game between two refreshes"""
+
+    __slots__ = ("kind", "game", "previous", "time", "extra")
+
+    def __init__(self, kind: str, game: Dict, previous: Dict, extra: Optional[Dict] = None):
+        self.kind = kind
+        self.game = game
+        self.previous = previous
+        self.time = datetime.now(timezone.utc)
+        self.extra = extra or {}
+
+    @property
+    def game_id(self) -> str:
+        return self.game.get("id", "")
+
+    @property
+    def league(self) -> str:
+        return self.game.get("league", "")
+
+    def to_dict(self) -> Dict:
+        """JSON-ready form used by exporters"""
+        event = {
+            "type": self.kind,
+            "time": self.time.isoformat(timespec="seconds"),
+            "league": self.league,
+            "game_id": self.game_id,
+            "name": self.game.get("name", ""),
+            "status": self.game.get("status", ""),
+            "period": self.game.get("period"),
+            "scores": [{"team": team.get("name", ""), "score": team.get("score", "")}
+                       for team in self.game.get("teams", [])],
+        }
+        event.update(self.extra)
+        return event
+
+    def __repr__(self):
+        return f"GameEvent({self.kind}, {self.game_id})"
+
+
+def _leader(game: Dict) -> Optional[str]:
+    """Name of the team ahead, "tie" when level, None without two numeric scores"""
+    teams = game.get("teams", [])
+    try:
+        scores = [int(float(score)) for score in score_tuple(game) or ()]
+    except ValueError:
+        return None
+    if len(scores) < 2 or len(teams) < 2:
+        return None
+    if scores[0] == scores[1]:
+        return "tie"
+    return teams[0 if scores[0] > scores[1] else 1].get("name", "")
+
+
+def detect_events(change: GameChange) -> List[GameEvent]:
+    """Events for one changed game, in the order they should be announced"""
+    old, new = change.old, change.new
+    events = []
+    if change.score_changed:
+        events.append(GameEvent(SCORE_CHANGE, new, old, {"previous_scores": list(score_tuple(old) or ())}))
+        old_leader, new_leader = _leader(old), _leader(new)
+        if old_leader is not None and new_leader is not None and old_leader != new_leader:
+            events.append(GameEvent(LEAD_CHANGE, new, old, {"leader": new_leader, "previous_leader": old_leader}))
+    if "period" in change.fields and old.get("period") is not None and new.get("period") is not None:
+        events.append(GameEvent(PERIOD_CHANGE, new, old, {"previous_period": old["period"]}))
+    if "recent_play" in change.fields and new.get("recent_play") and new.get("recent_play") != new.get("status"):
+        events.append(GameEvent(PLAY, new, old, {"play": new["recent_play"]}))
+    return events
+
+
+class _Subscription:
+    __slots__ = ("callback", "kinds", "game_ids")
+
+    def __init__(self, callback, kinds, game_ids):
+        self.callback = callback
+        self.kinds = kinds
+        self.game_ids = game_ids
+
+    def wants(self, event: GameEvent) -> bool:
+        if self.kinds is not None and event.kind not in self.kinds:
+            return False
+        return self.game_ids is None or event.game_id in self.game_ids
+
+
+class GameEventBus:
+    """Synchronous fan-out of GameEvents to subscribers, on the publishing thread"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[int, _Subscription] = {}
+        self._next_token = 1
+        self._stats = {"published": 0, "delivered": 0, "errors": 0}
+
+    def subscribe(self, callback: Callable[[GameEvent], None], kinds: Optional[Iterable[str]] = None,
+                  game_ids=None) -> int:
+        """Register a callback; returns a token for unsubscribe.
+
+        kinds limits the event types delivered. game_ids is checked at publish
+        time, so passing a set the caller keeps updating follows its changes.
+        """
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscriptions[token] = _Subscription(callback, frozenset(kinds) if kinds else None, game_ids)
+            return token
+
+    def unsubscribe(self, token: int):
+        with self._lock:
+            self._subscriptions.pop(token, None)
+
+    def publish(self, event: GameEvent):
+        with self._lock:
+            subscriptions = list(self._subscriptions.values())
+            self._stats["published"] += 1
+        for subscription in subscriptions:
+            if not subscription.wants(event):
+                continue
+            try:
+                subscription.callback(event)
+                delivered = True
+            except Exception as e:
+                # One failing consumer mustn't starve the others
+                print(f"Game event subscriber failed on {event}: {e}")
+                delivered = False
+            with self._lock:
+                self._stats["delivered" if delivered else "errors"] += 1
+
+    def publish_all(self, events: Iterable[GameEvent]):
+        for event in events:
+            self.publish(event)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["subscribers"] = len(self._subscriptions)
+        return stats
+
+
+class LiveGameTracker:
+    """Keeps the last snapshot per league and publishes what changed in each refresh"""
+
+    def __init__(self, bus: Optional[GameEventBus] = None):
+        self.bus = bus if bus is not None else get_event_bus()
+        self._snapshots: Dict[str, Dict[str, Dict]] = {}
+
+    def snapshot(self, league: str) -> Dict[str, Dict]:
+        return self._snapshots.get(league, {})
+
+    def update(self, league: str, games: Optional[List[Dict]]) -> LiveDelta:
+        """Diff a league refresh against the last one, publish its events and return the delta.
+
+        Games seen for the first time only become the baseline. A failed fetch
+        (games is None) changes nothing, so the next good refresh is diffed
+        against the last games actually seen.
+        """
+        if games is None:
+            return LiveDelta()
+        delta = diff_games(self.snapshot(league), games)
+        self._snapshots[league] = {game.get("id", ""): game for game in games}
+        for change in delta.changed:
+            self.bus.publish_all(detect_events(change))
+        return delta
+
+
+_default_bus = None
+_default_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> GameEventBus:
+    """Process-wide bus shared by the live view, notifications and exporters"""
+    global _default_bus
+    with _default_bus_lock:
+        if _default_bus is None:
+            _default_bus = GameEventBus()
+        return _default_bus
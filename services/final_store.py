@@ -0,0 +1,211 @@
+"""
+Immutable on-disk store for finished-game summaries.
+
+A game's /summary payload never changes once the game is final, so
+HttpClient serves those URLs from here without touching the network, across
+restarts. Bodies are compressed with gzip (or lzma) and stored under the
+SHA-256 of their content; a small ref file per URL points at the blob. The
+store has a byte cap over the compressed blobs and evicts the oldest ones
+first. Set SCORES_FINAL_STORE=0 to disable it.
+"""
+
+import gzip
+import hashlib
+import lzma
+import os
+import tempfile
+import threading
+import time
+import zlib
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from services.json_codec import peek_object
+
+__all__ = ["FinalSummaryStore", "is_final_summary", "CODECS", "DEFAULT_MAX_BYTES"]
+
+# name -> (file suffix, compress, decompress)
+CODECS = {
+    "gzip": (".json.gz", lambda data: gzip.compress(data, compresslevel=6), gzip.decompress),
+    "lzma": (".json.xz", lzma.compress, lzma.decompress),
+}
+DEFAULT_CODEC = "gzip"
+
+# Cap on compressed bytes (a compressed MLB summary is ~60-120 KB)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _header_final(header) -> bool:
+    try:
+        status = header["competitions"][0]["status"]["type"]
+        return bool(status.get("completed") or status.get("state") == "post")
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return False
+
+
+def is_final_summary(data) -> bool:
+    """Whether a decoded summary (or summary response) is for a completed game.
+
+    For a response only the header is decoded, and the answer is kept on the
+    response so the final store and the cache TTL policy share one peek.
+    """
+    if not hasattr(data, "content"):
+        return _header_final(data.get("header") if isinstance(data, dict) else None)
+    final = getattr(data, "final_summary", None)
+    if final is None:
+        try:
+            body = data.content
+            # A cut-off body can still hold a whole header; it must not be kept forever
+            final = body.rstrip().endswith(b"}") and _header_final(peek_object(body, "header", "competitions"))
+        except (TypeError, AttributeError):
+            final = False
+        data.final_summary = final
+    return final
+
+
+class FinalSummaryStore:
+    """Content-addressed compressed blobs plus URL refs, oldest-first eviction"""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES, codec: str = DEFAULT_CODEC):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec {codec!r}, expected one of {sorted(CODECS)}")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.codec = codec
+        self._objects = os.path.join(directory, "objects")
+        self._refs = os.path.join(directory, "refs")
+        os.makedirs(self._objects, exist_ok=True)
+        os.makedirs(self._refs, exist_ok=True)
+        self._lock = threading.Lock()
+        self._blobs: Optional[Dict[str, Tuple[int, float]]] = None  # blob file name -> (bytes, stored at)
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "bytes_saved": 0}
+
+    def _ref_path(self, url: str) -> str:
+        return os.path.join(self._refs, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+    def _load_index(self):
+        # Scanned on first use rather than at startup
+        if self._blobs is not None:
+            return
+        self._blobs = {}
+        for name in os.listdir(self._objects):
+            try:
+                st = os.stat(os.path.join(self._objects, name))
+            except OSError:
+                continue
+            self._blobs[name] = (st.st_size, st.st_mtime)
+        self._bytes = sum(size for size, _ in self._blobs.values())
+
+    def lookup(self, url: str) -> Optional[bytes]:
+        """Decompressed body stored for url, or None"""
+        try:
+            with open(self._ref_path(url), "r", encoding="utf-8") as f:
+                stored_url, blob = f.read().split("\n", 1)
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+        suffix = next((codec for codec in CODECS.values() if blob.endswith(codec[0])), None)
+        try:
+            with open(os.path.join(self._objects, blob), "rb") as f:
+                body = suffix[2](f.read()) if stored_url == url and suffix else None
+        except (OSError, EOFError, lzma.LZMAError, zlib.error):
+            # Evicted or damaged blob: the ref is dead
+            body = None
+        if body is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        self._count("bytes_saved", len(body))
+        return body
+
+    def store(self, url: str, body: bytes) -> bool:
+        """Persist a final summary body; identical bodies share one blob"""
+        suffix, compress, _ = CODECS[self.codec]
+        blob = hashlib.sha256(body).hexdigest() + suffix
+        with self._lock:
+            self._load_index()
+            if blob not in self._blobs:
+                data = compress(body)
+                if len(data) > self.max_bytes:
+                    return False
+                if not self._write(os.path.join(self._objects, blob), data):
+                    return False
+                self._blobs[blob] = (len(data), time.time())
+                self._bytes += len(data)
+                self._evict()
+            if not self._write(self._ref_path(url), f"{url}\n{blob}".encode("utf-8")):
+                return False
+            self._stats["stores"] += 1
+        return True
+
+    def store_if_final(self, url: str, resp: requests.Response) -> bool:
+        if resp.status_code != 200 or not is_final_summary(resp):
+            return False
+        return self.store(url, resp.content)
+
+    def _evict(self):
+        # Oldest blobs go first; refs to them turn into misses on lookup
+        if self._bytes <= self.max_bytes:
+            return
+        for blob, (size, _) in sorted(self._blobs.items(), key=lambda item: item[1][1]):
+            if self._bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self._objects, blob))
+            except OSError:
+                pass
+            del self._blobs[blob]
+            self._bytes -= size
+            self._stats["evictions"] += 1
+
+    def _write(self, path: str, data: bytes) -> bool:
+        # Write to a temp file and rename so readers on other threads never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            print(f"Final summary store write failed for {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    @staticmethod
+    def response(url: str, body: bytes) -> requests.Response:
+        """A requests.Response carrying a stored body"""
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.reason = "OK"
+        resp.url = url
+        resp.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        resp._content = body
+        resp.from_cache = True
+        resp.final_summary = True  # Only final summaries are stored
+        return resp
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._load_index()
+            return dict(self._stats, blobs=len(self._blobs), bytes=self._bytes, max_bytes=self.max_bytes)
+
+    def clear(self):
+        with self._lock:
+            for folder in (self._objects, self._refs):
+                for name in os.listdir(folder):
+                    try:
+                        os.remove(os.path.join(folder, name))
+                    except OSError:
+                        pass
+            self._blobs = {}
+            self._bytes = 0
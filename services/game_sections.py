@@ -0,0 +1,55 @@
+"""
+Lazily parsed sections of one game summary.
+
+GameDetailsView renders the header first and only prepares a section
+(boxscore, plays, drives, leaders, ...) when the user opens it. Prepared
+sections and values derived from them are memoized for the game, so
+reopening a section costs nothing.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+__all__ = ["GameSections", "SECTION_PARSERS"]
+
+# field -> func(raw summary) for sections whose dialog needs more than raw[field]
+SECTION_PARSERS: Dict[str, Callable[[Dict], Any]] = {
+    # Article matching needs the header and team ids, not just the news list
+    "news": lambda raw: raw,
+}
+
+
+class GameSections:
+    """One game's summary with per-section parsing on demand"""
+
+    def __init__(self, game_id: str, raw: Optional[Dict], parse_header: Callable[[Dict], Dict]):
+        self.game_id = game_id
+        self.raw = raw or {}
+        self.parse_header = parse_header
+        self._header = None
+        self._sections: Dict[str, Any] = {}
+        self._derived: Dict[str, tuple] = {}
+
+    def header(self) -> Dict:
+        """Teams, scores, status, venue and broadcast info (cheap, shown first)"""
+        if self._header is None:
+            self._header = self.parse_header(self.raw)
+        return self._header
+
+    def has(self, field: str) -> bool:
+        return self.raw.get(field) is not None
+
+    def get(self, field: str) -> Any:
+        """A section prepared for display, parsed on first use"""
+        if field not in self._sections:
+            parser = SECTION_PARSERS.get(field)
+            self._sections[field] = parser(self.raw) if parser else self.raw.get(field)
+        return self._sections[field]
+
+    def derived(self, name: str, data: Any, func: Callable[[Any], Any]) -> Any:
+        """func(data), memoized while the same data object is passed (a refresh brings a new one)"""
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        value = func(data)
+        self._derived[name] = (data, value)
+        return value
@@ -0,0 +1,251 @@
+"""
+Persistent HTTP cache with conditional revalidation.
+
+Responses are stored on disk keyed by full URL. A stored response is served
+without touching the network while its Cache-Control max-age is fresh; once
+stale it is revalidated with If-None-Match / If-Modified-Since and the cached
+body is reused on 304 Not Modified. The store has a byte cap and drops the
+least recently used entries once it is exceeded.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+__all__ = ["CacheEntry", "HttpCache", "parse_cache_control", "DEFAULT_MAX_BYTES"]
+
+# Cap on stored entry files (a scoreboard is ~50-300 KB, an MLB summary ~1 MB)
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Split a Cache-Control header into a {directive: argument} dict"""
+    directives = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+class CacheEntry:
+    """A stored response plus the validators needed to revalidate it"""
+
+    def __init__(self, url: str, body: bytes, headers: Dict[str, str], stored_at: float, max_age: int):
+        self.url = url
+        self.body = body
+        self.headers = headers
+        self.stored_at = stored_at
+        self.max_age = max_age
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("Last-Modified")
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return now - self.stored_at < self.max_age
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a requests.Response so callers can use .status_code/.json() as usual"""
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.reason = "OK"
+        resp.url = self.url
+        resp.headers = CaseInsensitiveDict(self.headers)
+        resp._content = self.body
+        resp.from_cache = True
+        return resp
+
+
+class HttpCache:
+    """On-disk response store with byte accounting and least recently used eviction"""
+
+    # Only these headers are persisted; everything else is per-connection noise
+    STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Date")
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Tuple[int, float]]] = None  # file name -> (bytes, last used)
+        self._bytes = 0
+        self._stats = {"fresh_hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "bytes_saved": 0,
+                       "evictions": 0}
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key + ".json")
+
+    def _load_index(self):
+        # Scanned on first use rather than at startup; file mtimes stand in for last use
+        if self._entries is not None:
+            return
+        self._entries = {}
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            self._entries[name] = (st.st_size, st.st_mtime)
+        self._bytes = sum(size for size, _ in self._entries.values())
+
+    def _touch(self, path: str, size: Optional[int] = None):
+        # Mark an entry as just used (and record its new size after a write)
+        name = os.path.basename(path)
+        with self._lock:
+            self._load_index()
+            old_size = self._entries.get(name, (0, 0.0))[0]
+            if size is None:
+                if name not in self._entries:
+                    return
+                size = old_size
+            self._entries[name] = (size, time.time())
+            self._bytes += size - old_size
+            self._evict()
+
+    def _evict(self):
+        # Least recently used entries go first
+        if self._bytes <= self.max_bytes:
+            return
+        for name, (size, _) in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if self._bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            del self._entries[name]
+            self._bytes -= size
+            self._stats["evictions"] += 1
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if record.get("url") != url:
+            return None
+        self._touch(self._path(url))
+        return CacheEntry(url, record["body"].encode("utf-8"), record.get("headers", {}),
+                          record.get("stored_at", 0.0), record.get("max_age", 0))
+
+    def store(self, url: str, resp: requests.Response) -> bool:
+        """Persist a 200 response if its headers allow it; returns True when stored"""
+        directives = parse_cache_control(resp.headers.get("Cache-Control"))
+        if "no-store" in directives or "private" in directives:
+            return False
+
+        max_age = 0
+        if "no-cache" not in directives and directives.get("max-age"):
+            try:
+                max_age = max(int(directives["max-age"]) - int(resp.headers.get("Age", 0)), 0)
+            except ValueError:
+                max_age = 0
+
+        headers = {name: resp.headers[name] for name in self.STORED_HEADERS if name in resp.headers}
+        # Nothing to gain from an entry that is already stale and cannot be revalidated
+        if max_age == 0 and "ETag" not in headers and "Last-Modified" not in headers:
+            return False
+
+        try:
+            body = resp.content.decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+
+        entry = {"url": url, "stored_at": time.time(), "max_age": max_age, "headers": headers, "body": body}
+        if not self._write(url, entry):
+            return False
+        self._count("stores")
+        return True
+
+    def refresh(self, entry: CacheEntry, resp: requests.Response) -> CacheEntry:
+        """Apply the headers of a 304 response to a stored entry and restart its freshness window"""
+        for name in self.STORED_HEADERS:
+            if name in resp.headers:
+                entry.headers[name] = resp.headers[name]
+        directives = parse_cache_control(entry.headers.get("Cache-Control"))
+        try:
+            entry.max_age = 0 if "no-cache" in directives else int(directives.get("max-age") or 0)
+        except ValueError:
+            entry.max_age = 0
+        entry.stored_at = time.time()
+        self._write(entry.url, {"url": entry.url, "stored_at": entry.stored_at, "max_age": entry.max_age,
+                                "headers": entry.headers, "body": entry.body.decode("utf-8")})
+        return entry
+
+    def _write(self, url: str, record: Dict) -> bool:
+        data = json.dumps(record).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return False
+        # Write to a temp file and rename so readers on other threads never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(url))
+        except OSError as e:
+            print(f"HTTP cache write failed for {url}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        self._touch(self._path(url), len(data))
+        return True
+
+    def record_fresh_hit(self, entry: CacheEntry):
+        self._count("fresh_hits")
+        self._count("bytes_saved", len(entry.body))
+
+    def record_revalidated(self, entry: CacheEntry):
+        self._count("revalidated")
+        self._count("bytes_saved", len(entry.body))
+
+    def record_miss(self):
+        self._count("misses")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._load_index()
+            return dict(self._stats, entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+
+    def clear(self):
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+            self._entries = {}
+            self._bytes = 0
@@ -0,0 +1,338 @@
+"""
+Shared HTTP transport for the ESPN and MLB Stats API fetchers.
+
+Every fetcher in espn_api goes through get() so requests reuse pooled
+keep-alive connections instead of paying a fresh TCP+TLS handshake per call.
+Successful responses are kept in the shared in-memory TTL cache (per-endpoint
+policies in services.cache) and in a persistent conditional-request cache
+under the user cache dir (set SCORES_HTTP_CACHE=0 to disable the latter).
+Summaries of finished games are kept compressed in the FinalSummaryStore and
+never requested again.
+SCORES_HTTP_MODE=record|replay swaps the network for services.replay.
+Requests that do reach the network are admitted by the shared
+RequestScheduler (per-host rate limits and a global in-flight cap), always
+carry a timeout capped by the caller's deadline, and have their latency
+recorded per endpoint class. Scoreboard and summary requests still running
+after that endpoint's p95 latency are hedged with one duplicate request.
+"""
+
+import concurrent.futures
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from services.cache import TTLCache, classify_url, get_cache
+from services.deadline import DeadlineExceeded, cap_timeout, propagate, remaining
+from services.final_store import FinalSummaryStore
+from services.http_cache import HttpCache
+from services.latency import LatencyRecorder
+from services.paths import user_cache_dir
+from services.replay import transport_from_env
+from services.request_scheduler import (Priority, RequestScheduler, at_priority, current_priority,
+                                        get_scheduler, request_priority)
+from services.single_flight import SingleFlight, normalize_url
+
+__all__ = ["HttpClient", "get", "get_client", "pool_stats", "cache_stats", "dedup_stats", "memory_cache_stats",
+           "scheduler_stats", "latency_stats", "hedge_stats", "final_store_stats"]
+
+# Hosts the application talks to (site.api.espn.com, sports.core.api.espn.com,
+# statsapi.mlb.com). Keep a few spare slots so a pool is never evicted and its
+# counters lost when an unexpected host shows up.
+POOL_CONNECTIONS = 8
+
+# Largest fan-out in espn_api is the 15 worker pool in _get_mlb_statistics,
+# so each host keeps at least that many idle connections alive
+POOL_MAXSIZE = 16
+
+# (connect, read) timeout for requests that don't pass their own
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Endpoint classes worth a duplicate request when the first one is slow
+HEDGED_ENDPOINTS = ("scoreboard", "summary")
+HEDGE_PERCENTILE = 95
+# Don't hedge until the endpoint has enough samples for a meaningful p95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MIN_DELAY = 0.1
+
+
+class HttpClient:
+    """Keep-alive session with per-host connection pools"""
+
+    def __init__(self, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                 cache: Optional[HttpCache] = None, memory: Optional[TTLCache] = None,
+                 scheduler: Optional[RequestScheduler] = None, finals: Optional[FinalSummaryStore] = None):
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        self.cache = cache
+        self.memory = memory
+        self.finals = finals
+        self.flights = SingleFlight()
+        self.scheduler = scheduler
+        self.latency = LatencyRecorder()
+        self.hedged_endpoints = HEDGED_ENDPOINTS
+        self._hedge_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+        self._hedge_stats = {"hedged": 0, "hedge_wins": 0}
+        # Callable that performs the actual GET; replaced by record/replay transports
+        self.send = self.session.get
+
+    def get(self, url: str, params: Optional[Dict] = None, timeout=None,
+            priority: Optional[Priority] = None, **kwargs) -> requests.Response:
+        # Concurrent GETs for the same normalized URL share one in-flight request
+        full_url = normalize_url(url, params)
+        if priority is None:
+            return self.flights.do(full_url, self._get, full_url, timeout, **kwargs)
+        with request_priority(priority):
+            return self.flights.do(full_url, self._get, full_url, timeout, **kwargs)
+
+    def _get(self, full_url: str, timeout=None, **kwargs) -> requests.Response:
+        if self.memory is None:
+            return self._get_http(full_url, timeout, **kwargs)
+
+        endpoint = classify_url(full_url)
+        resp = self.memory.get(endpoint, full_url)
+        if resp is not None:
+            return resp
+        resp = self._get_http(full_url, timeout, **kwargs)
+        if resp.status_code == 200:
+            self.memory.set(endpoint, full_url, resp)
+        return resp
+
+    def _get_http(self, full_url: str, timeout=None, **kwargs) -> requests.Response:
+        finals = self.finals if self.finals is not None and classify_url(full_url) == "summary" else None
+        if finals is not None:
+            body = finals.lookup(full_url)
+            if body is not None:
+                return finals.response(full_url, body)
+
+        resp = self._get_conditional(full_url, timeout, **kwargs)
+        if finals is not None:
+            # Peeks at the header only; the memory cache's TTL policy reuses the answer
+            finals.store_if_final(full_url, resp)
+        return resp
+
+    def _get_conditional(self, full_url: str, timeout=None, **kwargs) -> requests.Response:
+        if self.cache is None:
+            return self._send(full_url, timeout=timeout, **kwargs)
+
+        entry = self.cache.lookup(full_url)
+        if entry is not None and entry.is_fresh():
+            self.cache.record_fresh_hit(entry)
+            return entry.to_response()
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+
+        resp = self._send(full_url, timeout=timeout, headers=headers, **kwargs)
+        if resp.status_code == 304 and entry is not None:
+            self.cache.refresh(entry, resp)
+            self.cache.record_revalidated(entry)
+            return entry.to_response()
+
+        self.cache.record_miss()
+        if resp.status_code == 200:
+            self.cache.store(full_url, resp)
+        return resp
+
+    def _send(self, full_url: str, timeout=None, **kwargs) -> requests.Response:
+        endpoint = classify_url(full_url)
+        delay = self._hedge_delay(endpoint)
+        if delay is None:
+            return self._attempt(full_url, endpoint, timeout, **kwargs)
+        return self._send_hedged(full_url, endpoint, delay, timeout, **kwargs)
+
+    def _attempt(self, full_url: str, endpoint: str, timeout=None,
+                 started: Optional[threading.Event] = None, **kwargs) -> requests.Response:
+        timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        # Only requests that actually go out are rate limited; cache hits never wait
+        if self.scheduler is None:
+            return self._timed_send(full_url, endpoint, cap_timeout(timeout), started, **kwargs)
+        cap_timeout(timeout)  # fail fast instead of queueing past the deadline
+        with self.scheduler.slot(full_url):
+            return self._timed_send(full_url, endpoint, cap_timeout(timeout), started, **kwargs)
+
+    def _timed_send(self, full_url: str, endpoint: str, timeout,
+                    started: Optional[threading.Event] = None, **kwargs) -> requests.Response:
+        if started is not None:
+            started.set()
+        start = time.perf_counter()
+        resp = self.send(full_url, timeout=timeout, **kwargs)
+        self.latency.record(endpoint, time.perf_counter() - start)
+        return resp
+
+    def _hedge_delay(self, endpoint: str) -> Optional[float]:
+        if endpoint not in self.hedged_endpoints:
+            return None
+        p95 = self.latency.percentile(endpoint, HEDGE_PERCENTILE, min_samples=HEDGE_MIN_SAMPLES)
+        return None if p95 is None else max(p95, HEDGE_MIN_DELAY)
+
+    def _get_hedge_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._hedge_lock:
+            if self._hedge_pool is None:
+                # Room for every in-flight request plus its hedge
+                self._hedge_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=2 * POOL_MAXSIZE, thread_name_prefix="http-hedge")
+            return self._hedge_pool
+
+    def _send_hedged(self, full_url: str, endpoint: str, delay: float, timeout=None, **kwargs) -> requests.Response:
+        """Send once; if no answer within delay, send a duplicate and take whichever finishes first"""
+        # Pool threads don't inherit the caller's priority or deadline
+        attempt = propagate(at_priority(current_priority(), self._attempt))
+        pool = self._get_hedge_pool()
+        started = threading.Event()
+        primary = pool.submit(attempt, full_url, endpoint, timeout, started, **kwargs)
+        primary.add_done_callback(lambda _: started.set())
+        # Time spent queued in the scheduler doesn't count towards the hedge delay
+        if not started.wait(remaining()):
+            # Still queued at the deadline; the primary gives up on its own
+            raise DeadlineExceeded("Request deadline exceeded while queued")
+        done, _ = concurrent.futures.wait([primary], timeout=delay)
+        left = remaining()
+        if done or (left is not None and left <= delay):
+            return primary.result()
+
+        hedge = pool.submit(attempt, full_url, endpoint, timeout, **kwargs)
+        with self._hedge_lock:
+            self._hedge_stats["hedged"] += 1
+
+        first_error = None
+        for future in concurrent.futures.as_completed([primary, hedge]):
+            try:
+                resp = future.result()
+            except Exception as e:
+                first_error = first_error or e
+                continue
+            if future is hedge:
+                with self._hedge_lock:
+                    self._hedge_stats["hedge_wins"] += 1
+            # The slower request finishes in the background and is discarded
+            return resp
+        raise first_error
+
+    def hedge_stats(self) -> Dict[str, int]:
+        with self._hedge_lock:
+            return dict(self._hedge_stats)
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return connection reuse counters per host.
+
+        A hit is a request served on an already open connection, a miss is a
+        request that had to open a new one.
+        """
+        stats = {}
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host_stats = stats.setdefault(pool.host, {"requests": 0, "hits": 0, "misses": 0})
+            host_stats["requests"] += pool.num_requests
+            host_stats["misses"] += pool.num_connections
+            host_stats["hits"] += max(pool.num_requests - pool.num_connections, 0)
+        return stats
+
+    def close(self):
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def _default_cache() -> Optional[HttpCache]:
+    if os.environ.get("SCORES_HTTP_CACHE", "1") == "0":
+        return None
+    try:
+        return HttpCache(user_cache_dir("http"))
+    except OSError as e:
+        print(f"HTTP cache disabled: {e}")
+        return None
+
+
+def _default_finals() -> Optional[FinalSummaryStore]:
+    if os.environ.get("SCORES_FINAL_STORE", "1") == "0":
+        return None
+    try:
+        return FinalSummaryStore(user_cache_dir("finals"))
+    except OSError as e:
+        print(f"Final summary store disabled: {e}")
+        return None
+
+
+def get_client() -> HttpClient:
+    """Return the process-wide HttpClient, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                client = HttpClient(cache=_default_cache(), memory=get_cache(), scheduler=get_scheduler(),
+                                    finals=_default_finals())
+                transport = transport_from_env(client.session.get)
+                if transport is not None:
+                    # Fixtures must hold full bodies, never 304s, so skip the persistent caches
+                    client.cache = None
+                    client.finals = None
+                    client.send = transport
+                _client = client
+    return _client
+
+
+def get(url: str, params: Optional[Dict] = None, timeout=None,
+        priority: Optional[Priority] = None, **kwargs) -> requests.Response:
+    """GET through the shared pooled session (drop-in for requests.get).
+
+    priority defaults to the calling thread's request_priority().
+    """
+    return get_client().get(url, params=params, timeout=timeout, priority=priority, **kwargs)
+
+
+def pool_stats() -> Dict[str, Dict[str, int]]:
+    return get_client().pool_stats()
+
+
+def cache_stats() -> Dict[str, int]:
+    """Fresh hits, 304 revalidations, misses and bytes saved by the HTTP cache"""
+    cache = get_client().cache
+    return cache.stats() if cache is not None else {}
+
+
+def dedup_stats() -> Dict[str, int]:
+    """How many GETs were served by joining an identical in-flight request"""
+    return get_client().flights.stats()
+
+
+def memory_cache_stats() -> Dict:
+    """Size and per-endpoint hit ratio of the in-memory response cache"""
+    memory = get_client().memory
+    return memory.stats() if memory is not None else {}
+
+
+def scheduler_stats() -> Dict:
+    """In-flight, queueing and rate-limit counters of the request scheduler"""
+    scheduler = get_client().scheduler
+    return scheduler.stats() if scheduler is not None else {}
+
+
+def latency_stats() -> Dict[str, Dict]:
+    """Latency histogram and p50/p95/p99 per endpoint class"""
+    return get_client().latency.stats()
+
+
+def final_store_stats() -> Dict[str, int]:
+    """Hits, stores, evictions and compressed size of the finished-game summary store"""
+    finals = get_client().finals
+    return finals.stats() if finals is not None else {}
+
+
+def hedge_stats() -> Dict[str, int]:
+    """Duplicate requests fired for slow scoreboard/summary calls and how many won"""
+    return get_client().hedge_stats()
@@ -0,0 +1,89 @@
+"""
+JSON decoding for API responses.
+
+Uses the fastest backend that is installed (orjson, then ujson, then the
+standard library) and can keep only the top-level sections of a payload a
+caller asked for, so the rest of a large game summary (boxscore, win
+probability, news, odds, ...) is freed as soon as it is decoded instead of
+staying resident with the result.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+__all__ = ["BACKEND", "loads", "response_json", "select_sections", "peek_object", "SUMMARY_SECTIONS",
+           "LIVE_SECTIONS"]
+
+# Top-level sections of an ESPN game summary
+SUMMARY_SECTIONS = ("header", "boxscore", "plays", "drives", "winprobability", "situation",
+                    "rosters", "leaders", "standings", "news", "injuries", "gameInfo")
+
+# What the live scores path reads from a summary (extract_recent_play and friends)
+LIVE_SECTIONS = ("header", "situation", "rosters", "plays", "drives")
+
+if ORJSON_AVAILABLE:
+    BACKEND = "orjson"
+    _loads = orjson.loads
+elif UJSON_AVAILABLE:
+    BACKEND = "ujson"
+    _loads = ujson.loads
+else:
+    BACKEND = "json"
+    _loads = json.loads
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON text with the selected backend"""
+    return _loads(data)
+
+
+def response_json(resp) -> Any:
+    """Drop-in for resp.json() using the fast backend (raises ValueError on bad JSON)"""
+    try:
+        return _loads(resp.content)
+    except ValueError:
+        raise
+    except Exception as e:
+        # ujson raises its own error types on some inputs; normalise for callers
+        raise ValueError(str(e)) from e
+
+
+def select_sections(data: Any, sections: Optional[Iterable[str]]) -> Any:
+    """Keep only the requested top-level keys of a decoded object (all of it if sections is None)"""
+    if sections is None or not isinstance(data, dict):
+        return data
+    return {key: data[key] for key in sections if key in data}
+
+
+_raw_decoder = json.JSONDecoder()
+
+
+def peek_object(body: Union[bytes, str], key: str, marker: str) -> Optional[Dict]:
+    """Decode only the first object stored under key that has a marker key (None if there is none).
+
+    Lets a caller read one small section (e.g. a summary's header) without
+    decoding the whole payload; other objects that happen to use the same key
+    are skipped by the marker check.
+    """
+    text = body.decode("utf-8", errors="replace") if isinstance(body, bytes) else body
+    for match in re.finditer(r'"%s"\s*:\s*(?=\{)' % re.escape(key), text):
+        try:
+            value, _ = _raw_decoder.raw_decode(text, match.end())
+        except ValueError:
+            continue
+        if isinstance(value, dict) and marker in value:
+            return value
+    return None
@@ -0,0 +1,84 @@
+"""
+Per-endpoint latency histograms.
+
+The transport records how long every network request took, grouped by the
+endpoint classes of services.cache. Bucket counts are for reporting; a
+window of recent samples gives the percentiles used as hedging thresholds.
+"""
+
+import bisect
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+__all__ = ["LatencyHistogram", "LatencyRecorder", "BUCKETS_MS"]
+
+# Upper bounds of the histogram buckets in milliseconds (last bucket is open ended)
+BUCKETS_MS = (25, 50, 100, 200, 400, 800, 1600, 3200, 6400, 12800)
+
+# Recent samples kept per endpoint for percentile estimates
+WINDOW = 200
+
+
+class LatencyHistogram:
+    """Bucketed counts plus a sliding window of recent samples"""
+
+    def __init__(self, window: int = WINDOW):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.recent = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.recent.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """pct-th percentile of the recent window in seconds, None without samples"""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> Dict:
+        labels = [f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        p50, p95, p99 = (self.percentile(p) for p in (50, 95, 99))
+        return {
+            "count": self.total,
+            "mean_ms": self.sum_ms / self.total if self.total else 0.0,
+            "p50_ms": p50 * 1000 if p50 is not None else None,
+            "p95_ms": p95 * 1000 if p95 is not None else None,
+            "p99_ms": p99 * 1000 if p99 is not None else None,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class LatencyRecorder:
+    """Thread-safe set of histograms keyed by endpoint class"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, endpoint: str, seconds: float):
+        with self._lock:
+            histogram = self._histograms.get(endpoint)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self._histograms[endpoint] = histogram
+            histogram.record(seconds)
+
+    def percentile(self, endpoint: str, pct: float, min_samples: int = 0) -> Optional[float]:
+        with self._lock:
+            histogram = self._histograms.get(endpoint)
+            if histogram is None or len(histogram.recent) < min_samples:
+                return None
+            return histogram.percentile(pct)
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {endpoint: h.to_dict() for endpoint, h in self._histograms.items()}
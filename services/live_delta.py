@@ -0,0 +1,88 @@
+"""
+Live game delta engine.
+
+Compares the previous and new snapshot of live games, keyed by game id, and
+reports which games were added, removed or changed (and which displayed
+fields changed), so views and notifiers only touch what actually moved.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+__all__ = ["GameChange", "LiveDelta", "diff_games", "score_tuple"]
+
+# Fields of a live game row (see espn_api._parse_live_events) that are displayed or monitored
+TRACKED_FIELDS = ("name", "status", "period", "recent_play")
+
+
+def score_tuple(game: Dict) -> Optional[Tuple[str, ...]]:
+    """Scores of a live game in team order, None if it has no teams"""
+    teams = game.get("teams", [])
+    if not teams:
+        return None
+    return tuple(str(team.get("score", "")) for team in teams)
+
+
+class GameChange:
+    """One game present in both snapshots whose displayed data differs"""
+
+    __slots__ = ("old", "new", "fields")
+
+    def __init__(self, old: Dict, new: Dict, fields: Tuple[str, ...]):
+        self.old = old
+        self.new = new
+        self.fields = fields
+
+    @property
+    def game_id(self) -> str:
+        return self.new.get("id", "")
+
+    @property
+    def score_changed(self) -> bool:
+        return "score" in self.fields
+
+    def __repr__(self):
+        return f"GameChange({self.game_id}, {self.fields})"
+
+
+class LiveDelta:
+    """Result of diffing two snapshots"""
+
+    def __init__(self):
+        self.added: List[Dict] = []
+        self.removed: List[Dict] = []
+        self.changed: List[GameChange] = []
+        self.unchanged = 0
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self):
+        return (f"LiveDelta(added={len(self.added)}, removed={len(self.removed)}, "
+                f"changed={len(self.changed)}, unchanged={self.unchanged})")
+
+
+def _changed_fields(old: Dict, new: Dict) -> Tuple[str, ...]:
+    fields = [field for field in TRACKED_FIELDS if old.get(field) != new.get(field)]
+    if score_tuple(old) != score_tuple(new):
+        fields.append("score")
+    return tuple(fields)
+
+
+def diff_games(previous: Dict[str, Dict], current: Iterable[Dict]) -> LiveDelta:
+    """Diff the previous snapshot {game id: game} against the current list of games"""
+    delta = LiveDelta()
+    seen = set()
+    for game in current:
+        game_id = game.get("id", "")
+        seen.add(game_id)
+        old = previous.get(game_id)
+        if old is None:
+            delta.added.append(game)
+            continue
+        fields = _changed_fields(old, game)
+        if fields:
+            delta.changed.append(GameChange(old, game, fields))
+        else:
+            delta.unchanged += 1
+    delta.removed = [game for game_id, game in previous.items() if game_id not in seen]
+    return delta
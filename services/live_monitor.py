@@ -0,0 +1,137 @@
+"""
+Headless live-game monitor.
+
+Runs the live-scores pipeline without any Qt import: leagues are polled on
+the adaptive PollScheduler, each refresh goes through a LiveGameTracker, and
+a JsonLinesExporter subscribed to its event bus writes score, lead and
+period changes as JSON lines.
+Only the cheap events lists are fetched (plus the MLB scoreboard), never
+game summaries, so every live game across LEAGUES can be followed on a
+small CPU budget.
+
+Events go to stdout unless --output is given. Anything else printed while
+the monitor runs (fetch errors, replay diagnostics) is sent to stderr so
+the event stream stays valid JSON lines.
+
+Usage:
+    python main.py --monitor [--leagues MLB NFL] [--games ID ...] [--output events.jsonl]
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+from typing import Callable, Iterable, List, Optional, TextIO
+
+from exceptions import ApiError
+from services.api_service import ApiService
+from services.event_bus import (LEAD_CHANGE, PERIOD_CHANGE, SCORE_CHANGE, GameEvent, GameEventBus,
+                                LiveGameTracker)
+from services.poll_scheduler import PollScheduler
+
+__all__ = ["LiveMonitor", "JsonLinesExporter", "main"]
+
+# Longest the loop sleeps between due checks
+MAX_SLEEP = 30.0
+MIN_SLEEP = 1.0
+
+# Event types the monitor exports
+MONITOR_EVENTS = (SCORE_CHANGE, LEAD_CHANGE, PERIOD_CHANGE)
+
+
+class JsonLinesExporter:
+    """Bus subscriber writing each event as one JSON line"""
+
+    def __init__(self, output: TextIO):
+        self.output = output
+        self.events_written = 0
+
+    def __call__(self, event: GameEvent):
+        self.output.write(json.dumps(event.to_dict(), separators=(",", ":")) + "\n")
+        self.output.flush()
+        self.events_written += 1
+
+
+class LiveMonitor:
+    """Polls live leagues and exports change events for all or selected games"""
+
+    def __init__(self, output: TextIO, leagues: Optional[Iterable[str]] = None,
+                 game_ids: Optional[Iterable[str]] = None, base_interval: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic, bus: Optional[GameEventBus] = None):
+        self.leagues = list(leagues) if leagues else sorted(ApiService.get_leagues())
+        self.game_ids = set(game_ids) if game_ids else None
+        self.scheduler = PollScheduler(base_interval=base_interval, clock=clock)
+        if self.game_ids:
+            # Selected games poll at the monitored rate
+            self.scheduler.set_monitored(self.game_ids)
+        self.tracker = LiveGameTracker(bus)
+        self.exporter = JsonLinesExporter(output)
+        self.tracker.bus.subscribe(self.exporter, kinds=MONITOR_EVENTS, game_ids=self.game_ids)
+
+    @property
+    def events_written(self) -> int:
+        return self.exporter.events_written
+
+    def poll(self, force: bool = False) -> int:
+        """Refresh every due league (all of them when force is set); returns events written"""
+        due = self.leagues if force else self.scheduler.due_leagues(self.leagues)
+        if not due:
+            return 0
+        written = self.events_written
+        # Scores and periods come from the events list; summaries are never needed
+        for league, games in ApiService.iter_live_scores_all_sports(due, needs_details=lambda game: False):
+            if games is None:
+                # Failed fetch: keep the poll interval and the tracker's baseline for the next try
+                continue
+            self.scheduler.record_league(league, games)
+            self.tracker.update(league, games)
+        return self.events_written - written
+
+    def run(self, once: bool = False):
+        """Poll until interrupted (or a single baseline pass when once is set)"""
+        self.poll(force=True)
+        while not once:
+            next_due = self.scheduler.next_due()
+            wait = MAX_SLEEP if next_due is None else next_due - self.scheduler.clock()
+            time.sleep(min(MAX_SLEEP, max(MIN_SLEEP, wait)))
+            try:
+                self.poll()
+            except ApiError as e:
+                # Keep monitoring through transient network failures
+                print(f"Live monitor poll failed: {e}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write live score, lead and period changes as JSON lines")
+    parser.add_argument("--monitor", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--leagues", nargs="+", metavar="LEAGUE", help="Leagues to follow (default: all)")
+    parser.add_argument("--games", nargs="+", metavar="GAME_ID", help="Only report these game ids (default: all live games)")
+    parser.add_argument("--output", "-o", help="Append events to this file instead of stdout")
+    parser.add_argument("--interval", type=float, default=60.0, help="Adaptive base poll interval in seconds")
+    parser.add_argument("--once", action="store_true", help="Poll once and exit (checks connectivity)")
+    args = parser.parse_args(argv)
+
+    output = open(args.output, "a", encoding="utf-8") if args.output else sys.stdout
+    monitor = None
+    try:
+        # The exporter keeps the real stdout; library prints go to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            monitor = LiveMonitor(output, leagues=args.leagues, game_ids=args.games, base_interval=args.interval)
+            monitor.run(once=args.once)
+    except KeyboardInterrupt:
+        pass
+    except ApiError as e:
+        print(f"Live monitor failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    if monitor is not None:
+        print(f"Live monitor stopped: {monitor.scheduler.stats()['league_polls']} league polls, "
+              f"{monitor.events_written} events", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
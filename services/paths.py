@@ -0,0 +1,33 @@
+"""
+Per-user storage locations for the Scores application.
+"""
+
+import os
+import sys
+
+__all__ = ["user_cache_dir"]
+
+APP_NAME = "Scores"
+
+
+def user_cache_dir(*parts: str) -> str:
+    """Return (and create) a directory under the user's cache folder.
+
+    SCORES_CACHE_DIR overrides the platform default, which is
+    %LOCALAPPDATA%\\Scores\\Cache on Windows, ~/Library/Caches/Scores on macOS
+    and $XDG_CACHE_HOME/scores (or ~/.cache/scores) elsewhere.
+    """
+    base = os.environ.get("SCORES_CACHE_DIR")
+    if not base:
+        if sys.platform == "win32":
+            local = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+            base = os.path.join(local, APP_NAME, "Cache")
+        elif sys.platform == "darwin":
+            base = os.path.expanduser(f"~/Library/Caches/{APP_NAME}")
+        else:
+            xdg = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+            base = os.path.join(xdg, APP_NAME.lower())
+
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,202 @@
+"""
+Single-pass classification of MLB play-by-play.
+
+ESPN tags every baseball play with structured fields: summaryType (I inning
+start, A at-bat start, P pitch, N/S result, C pitching change), type.type
+(start-inning, play-result, strike-looking, ...), atBatId and
+atBatPitchNumber. Classifying on those instead of scanning play text lets
+the plays tree, the HTML game log and the pitch explorer group a half
+inning into at-bats in one O(n) pass.
+
+Plays without these fields (older captures) fall back to the text markers
+the tree used before.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+__all__ = [
+    "AtBat", "play_kind", "group_at_bats", "pitch_outcome", "batter_hand",
+    "INNING_START", "INNING_END", "AT_BAT_START", "AT_BAT_END", "PITCH", "RESULT", "CHANGE", "EVENT",
+]
+
+INNING_START = "inning_start"
+INNING_END = "inning_end"
+AT_BAT_START = "at_bat_start"
+AT_BAT_END = "at_bat_end"
+PITCH = "pitch"
+RESULT = "result"
+CHANGE = "change"  # Pitching changes
+EVENT = "event"  # Stolen bases, wild pitches and other plays between pitches
+
+SUMMARY_KINDS = {"I": INNING_START, "A": AT_BAT_START, "P": PITCH, "N": RESULT, "S": RESULT, "C": CHANGE}
+TYPE_KINDS = {
+    "start-inning": INNING_START,
+    "end-inning": INNING_END,
+    "start-batterpitcher": AT_BAT_START,
+    "end-batterpitcher": AT_BAT_END,
+    "play-result": RESULT,
+}
+
+# Pitch type.type values that aren't put in play
+BALL_TYPES = {"ball", "automatic-ball---ibb", "automatic-ball-pitch-timer-violation", "intentional-ball", "pitchout"}
+FOUL_TYPES = {"foul-ball", "bunted-foul", "foul-tip"}
+STRIKE_TYPES = {"strike-looking", "strike-swinging", "automatic-strike", "automatic-strike-pitch-timer-violation"}
+
+
+def _type_name(play: Dict) -> str:
+    play_type = play.get("type")
+    return play_type.get("type", "") if isinstance(play_type, dict) else ""
+
+
+def _kind_from_text(text: str) -> str:
+    # Captures without summaryType/type ids
+    if not text.strip():
+        return AT_BAT_END
+    if " pitches to " in text:
+        return AT_BAT_START
+    if text.startswith(("Top of the", "Bottom of the")):
+        return INNING_START
+    if text.startswith(("End of the", "Middle of the")):
+        return INNING_END
+    if text.startswith(("Pitch", "Ball", "Strike", "Foul")):
+        return PITCH
+    if " relieved " in text:
+        return CHANGE
+    return RESULT
+
+
+def play_kind(play: Dict) -> str:
+    """One of the kind constants for a play"""
+    kind = SUMMARY_KINDS.get(play.get("summaryType"))
+    if kind:
+        return kind
+    type_name = _type_name(play)
+    if type_name:
+        return TYPE_KINDS.get(type_name, EVENT)
+    return _kind_from_text(play.get("text", "") or "")
+
+
+def pitch_outcome(play: Dict) -> str:
+    """Ball, Strike, Foul, Hit By Pitch or In Play for a pitch"""
+    type_name = _type_name(play)
+    if type_name in BALL_TYPES:
+        return "Ball"
+    if type_name in FOUL_TYPES:
+        return "Foul"
+    if type_name in STRIKE_TYPES:
+        return "Strike"
+    if type_name == "hit-by-pitch":
+        return "Hit By Pitch"
+    return "In Play"
+
+
+def batter_hand(play: Dict) -> Optional[str]:
+    """L or R from the play's bats field"""
+    bats = play.get("bats")
+    if isinstance(bats, dict):
+        return bats.get("abbreviation") or None
+    return None
+
+
+class AtBat:
+    """One plate appearance: its pitches, other plays and final result"""
+
+    __slots__ = ("at_bat_id", "batter", "pitcher", "batter_hand", "plays", "pitches", "result", "scoring")
+
+    def __init__(self, at_bat_id: Optional[str] = None):
+        self.at_bat_id = at_bat_id
+        self.batter = ""
+        self.pitcher = ""
+        self.batter_hand: Optional[str] = None
+        self.plays: List[Dict] = []  # Pitches, events, changes and interim results in order
+        self.pitches: List[Dict] = []
+        self.result: Optional[Dict] = None  # Last result play
+        self.scoring = False
+
+    @property
+    def result_text(self) -> str:
+        if self.result is not None:
+            return self.result.get("text", "")
+        # No result yet (live at-bat): the latest play stands in
+        return self.plays[-1].get("text", "At-bat in progress") if self.plays else ""
+
+    @property
+    def score(self) -> str:
+        """(away-home) after the at-bat"""
+        last = self.result if self.result is not None else (self.plays[-1] if self.plays else {})
+        return f"({last.get('awayScore', 0)}-{last.get('homeScore', 0)})"
+
+    def details(self) -> List[Dict]:
+        """Plays shown under the at-bat: everything but the final result"""
+        return [play for play in self.plays if play is not self.result]
+
+    def __repr__(self):
+        return f"AtBat({self.batter!r}, {len(self.pitches)} pitches)"
+
+
+def _start(at_bat: AtBat, play: Dict):
+    text = play.get("text", "") or ""
+    for participant in play.get("participants", []) or []:
+        athlete = participant.get("athlete", {}) if isinstance(participant, dict) else {}
+        name = athlete.get("displayName") or athlete.get("shortName")
+        if name and participant.get("type") == "batter":
+            at_bat.batter = name
+        elif name and participant.get("type") == "pitcher":
+            at_bat.pitcher = name
+    if " pitches to " in text:
+        pitcher, _, batter = text.partition(" pitches to ")
+        at_bat.pitcher = at_bat.pitcher or pitcher.strip()
+        at_bat.batter = at_bat.batter or batter.strip()
+
+
+def group_at_bats(plays: Iterable[Dict]) -> List[AtBat]:
+    """Group a run of plays (typically one half inning) into at-bats in a single pass.
+
+    A new at-bat begins at an at-bat start or when atBatId changes.
+    Substitutions and pitching changes announced before an at-bat starts
+    belong to that at-bat (ESPN gives them its atBatId). Inning markers are
+    dropped.
+    """
+    at_bats: List[AtBat] = []
+    current: Optional[AtBat] = None
+    pending: List[Dict] = []  # Changes and substitutions seen before their at-bat started
+    for play in plays:
+        kind = play_kind(play)
+        if kind in (INNING_START, INNING_END, AT_BAT_END):
+            continue
+        at_bat_id = play.get("atBatId")
+        next_at_bat = current is not None and at_bat_id and at_bat_id != current.at_bat_id
+
+        if kind not in (AT_BAT_START, PITCH) and (
+                current is None or next_at_bat or (kind == CHANGE and at_bat_id is None)):
+            pending.append(play)
+            continue
+        if kind == AT_BAT_START or current is None or next_at_bat:
+            current = AtBat(at_bat_id)
+            at_bats.append(current)
+            current.plays.extend(pending)
+            pending = []
+            if kind == AT_BAT_START:
+                _start(current, play)
+                continue
+
+        if kind == PITCH:
+            current.pitches.append(play)
+            if current.batter_hand is None:
+                current.batter_hand = batter_hand(play)
+        elif kind == RESULT:
+            # Interim results (a stolen base mid at-bat) repeat the event before them
+            if current.plays and current.plays[-1].get("text") == play.get("text"):
+                current.plays.pop()
+            current.result = play
+        if play.get("scoringPlay"):
+            current.scoring = True
+        current.plays.append(play)
+
+    if pending:
+        if current is None:
+            # Nothing but substitutions (or a half inning cut short before its first pitch)
+            current = AtBat(pending[0].get("atBatId"))
+            at_bats.append(current)
+        current.plays.extend(pending)
+    return at_bats
@@ -0,0 +1,115 @@
+"""
+Incremental play-by-play log per game.
+
+ESPN summaries always return the whole `plays` array, and only ever append
+to it. A PlayLog remembers how many plays it holds and the id of the last
+one; when a refresh still has that play at the same position, only the plays
+after it are new. (sequenceNumber can't be used: MLB restarts it with every
+at-bat.) The game's ScoreTimeline is extended with the same new plays. The
+roster id -> name mapping is built once per game and reused until the
+rosters change size. Per-refresh work is proportional to new plays, not to
+game length.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from services.score_timeline import ScoreTimeline
+
+__all__ = ["PlayLog", "get_play_log", "clear_play_logs"]
+
+# Play logs kept before the least recently used game is dropped
+MAX_GAMES = 64
+
+
+def _play_key(play: Dict):
+    return play.get("id") or play.get("sequenceNumber")
+
+
+class PlayLog:
+    """Plays of one game in feed order, grown from successive summaries"""
+
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self.plays: List[Dict] = []
+        self.timeline = ScoreTimeline()
+        self._player_names: Dict[str, str] = {}
+        self._roster_signature = None
+        self._lock = threading.Lock()
+        self.stats = {"ingests": 0, "new_plays": 0, "resets": 0, "roster_builds": 0}
+
+    def ingest(self, plays: Optional[List[Dict]]) -> List[Dict]:
+        """Store plays not seen before and return them (all plays after a reset)"""
+        plays = plays or []
+        with self._lock:
+            self.stats["ingests"] += 1
+            known = len(self.plays)
+            last_key = _play_key(self.plays[-1]) if known else None
+            if last_key is not None and len(plays) >= known and _play_key(plays[known - 1]) == last_key:
+                new = plays[known:]
+                self.plays.extend(new)
+                self.timeline.extend(new)
+            else:
+                # First ingest, or plays removed or renumbered upstream (or no ids): start over.
+                # Readers may hold the old timeline, so it is replaced rather than cleared
+                if known:
+                    self.stats["resets"] += 1
+                self.plays = list(plays)
+                new = self.plays
+                self.timeline = ScoreTimeline.from_plays(self.plays)
+
+            self.stats["new_plays"] += len(new)
+            return list(new)
+
+    def __len__(self) -> int:
+        return len(self.plays)
+
+    def recent(self, count: int = 10) -> List[Dict]:
+        with self._lock:
+            return self.plays[-count:]
+
+    def player_names(self, rosters: Optional[List[Dict]]) -> Dict[str, str]:
+        """Player id -> display name from the game's rosters, rebuilt only when they change"""
+        rosters = rosters or []
+        signature = tuple(len(team.get("roster", []) or []) for team in rosters)
+        with self._lock:
+            if signature != self._roster_signature:
+                names = {}
+                for team_roster in rosters:
+                    for player in team_roster.get("roster", []) or []:
+                        athlete = player.get("athlete", {})
+                        player_id = athlete.get("id")
+                        player_name = athlete.get("displayName", "")
+                        if player_id and player_name:
+                            # Convert to string for consistent lookup
+                            names[str(player_id)] = player_name
+                self._player_names = names
+                self._roster_signature = signature
+                self.stats["roster_builds"] += 1
+            return self._player_names
+
+
+_logs: "OrderedDict[str, PlayLog]" = OrderedDict()
+_logs_lock = threading.Lock()
+
+
+def get_play_log(game_id: str, create: bool = True) -> Optional[PlayLog]:
+    """The shared log for a game, created on first use (None if create is False and there is none)"""
+    game_id = str(game_id)
+    with _logs_lock:
+        log = _logs.get(game_id)
+        if log is None:
+            if not create:
+                return None
+            log = _logs[game_id] = PlayLog(game_id)
+            while len(_logs) > MAX_GAMES:
+                _logs.popitem(last=False)
+        else:
+            _logs.move_to_end(game_id)
+        return log
+
+
+def clear_play_logs():
+    with _logs_lock:
+        _logs.clear()
@@ -0,0 +1,189 @@
+"""
+Adaptive polling for live scores.
+
+Instead of refetching every league and every game summary on one fixed
+interval, PollScheduler keeps a next-due time per league and per game:
+
+- games poll faster when monitored, in late innings / final periods, and
+  fastest in two-minute drills or the last two minutes of a close period;
+- games poll slower during inning breaks, halftime, intermissions and
+  weather delays;
+- leagues with no live events back off exponentially until games start.
+
+A league's events list is fetched when its soonest game (or its backoff)
+is due; within it only games that are due get a summary. Counters compare
+the requests made against what fixed-interval polling would have made over
+the same time.
+"""
+
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+__all__ = ["PollScheduler", "classify_game_state", "STATE_FACTORS"]
+
+# Base interval multipliers per game state
+STATE_FACTORS = {
+    "critical": 0.25,   # two-minute drill, last two minutes of a final period, walk-off spots
+    "late": 0.5,        # late innings / final period
+    "normal": 1.0,
+    "break": 3.0,       # inning breaks, halftime, intermissions
+    "delay": 8.0,       # rain delays, suspensions
+}
+
+# Monitored games poll this much faster than their state alone would
+MONITORED_FACTOR = 0.25
+
+MIN_INTERVAL = 10.0
+MAX_INTERVAL = 600.0
+
+# Leagues without live events start polling at base * 2 and double up to this
+MAX_BACKOFF = 600.0
+
+# First period considered "late" per league (innings for MLB, halves for NCAAM)
+LATE_PERIOD = {"MLB": 8, "NFL": 4, "NCAAF": 4, "NBA": 4, "WNBA": 4, "NCAAM": 2, "NHL": 3}
+LATE_SOCCER_MINUTE = 75
+
+_PERIOD_RE = re.compile(r"(\d+)(?:st|nd|rd|th)\b")
+_CLOCK_RE = re.compile(r"(\d+):(\d\d)\s*-")
+_MINUTE_RE = re.compile(r"(\d+)'")
+_DELAY_WORDS = ("delay", "suspended", "postponed")
+_BREAK_PREFIXES = ("mid ", "middle", "end ")
+_BREAK_WORDS = ("halftime", "intermission")
+
+
+def classify_game_state(game: Dict) -> str:
+    """Classify a live game row (espn_api._parse_live_events) into a STATE_FACTORS key"""
+    status = (game.get("status") or "").strip()
+    lowered = status.lower()
+    league = game.get("league", "")
+
+    if any(word in lowered for word in _DELAY_WORDS):
+        return "delay"
+    if lowered.startswith(_BREAK_PREFIXES) or any(word in lowered for word in _BREAK_WORDS):
+        return "break"
+
+    if league == "Soccer":
+        minute = _MINUTE_RE.search(status)
+        return "late" if minute and int(minute.group(1)) >= LATE_SOCCER_MINUTE else "normal"
+
+    overtime = "ot" in lowered.split() or "overtime" in lowered or "extra" in lowered
+    period_match = _PERIOD_RE.search(status)
+    period = int(period_match.group(1)) if period_match else 0
+    late_period = LATE_PERIOD.get(league)
+    is_late = overtime or (late_period is not None and period >= late_period)
+
+    if league == "MLB":
+        # Bottom of the 9th or later: every pitch can end the game
+        if is_late and period >= 9 and lowered.startswith("bot"):
+            return "critical"
+        return "late" if is_late else "normal"
+
+    clock = _CLOCK_RE.search(status)
+    if clock:
+        seconds_left = int(clock.group(1)) * 60 + int(clock.group(2))
+        # Two-minute drill before the half, or the end of a close final period
+        if seconds_left <= 120 and (is_late or (league in ("NFL", "NCAAF") and period == 2)):
+            return "critical"
+    return "late" if is_late else "normal"
+
+
+class PollScheduler:
+    """Per-league and per-game next-due times derived from game state"""
+
+    def __init__(self, base_interval: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.base_interval = base_interval
+        self.clock = clock
+        self.monitored = set()
+        self._lock = threading.Lock()
+        self._league_due: Dict[str, float] = {}
+        self._league_backoff: Dict[str, float] = {}
+        self._league_polled_at: Dict[str, float] = {}
+        self._game_due: Dict[str, float] = {}
+        self._league_games: Dict[str, set] = {}
+        self._forced = set()
+        self._stats = {"league_polls": 0, "summary_polls": 0, "summaries_skipped": 0,
+                       "fixed_equivalent": 0.0}
+
+    def game_interval(self, game: Dict) -> float:
+        """Seconds between polls of a game in its current state"""
+        interval = self.base_interval * STATE_FACTORS[classify_game_state(game)]
+        if game.get("id") in self.monitored:
+            interval *= MONITORED_FACTOR
+        return min(MAX_INTERVAL, max(MIN_INTERVAL, interval))
+
+    def set_monitored(self, game_ids: Iterable[str]):
+        with self._lock:
+            self.monitored = set(game_ids)
+
+    def mark_due(self, game_id: str, league: Optional[str] = None):
+        """Poll this game (and its league) at the next opportunity"""
+        with self._lock:
+            self._forced.add(game_id)
+            self._game_due[game_id] = 0.0
+            if league is not None:
+                self._league_due[league] = 0.0
+
+    def due_leagues(self, leagues: Iterable[str], now: Optional[float] = None) -> List[str]:
+        """Leagues whose events list should be fetched now (never-polled leagues are due)"""
+        now = self.clock() if now is None else now
+        with self._lock:
+            return [league for league in leagues if self._league_due.get(league, 0.0) <= now]
+
+    def needs_details(self, game: Dict, force: bool = False, now: Optional[float] = None) -> bool:
+        """Whether a game's summary should be fetched now; claims the poll if so.
+
+        Safe to call from fetch worker threads.
+        """
+        now = self.clock() if now is None else now
+        game_id = game.get("id", "")
+        interval = self.game_interval(game)
+        with self._lock:
+            due = force or game_id in self._forced or self._game_due.get(game_id, 0.0) <= now
+            if due:
+                self._forced.discard(game_id)
+                self._game_due[game_id] = now + interval
+                self._stats["summary_polls"] += 1
+            else:
+                self._stats["summaries_skipped"] += 1
+            return due
+
+    def record_league(self, league: str, games: List[Dict], now: Optional[float] = None):
+        """Schedule the league's next events poll after a fetch returned games"""
+        now = self.clock() if now is None else now
+        with self._lock:
+            self._stats["league_polls"] += 1
+            # What fixed polling at base_interval would have spent since this league's last poll
+            last = self._league_polled_at.get(league)
+            if last is not None:
+                self._stats["fixed_equivalent"] += (now - last) / self.base_interval * (1 + len(games))
+            self._league_polled_at[league] = now
+
+            live_ids = {game.get("id", "") for game in games}
+            for game_id in self._league_games.get(league, set()) - live_ids:
+                # Finished or no longer live
+                self._game_due.pop(game_id, None)
+            self._league_games[league] = live_ids
+
+            if games:
+                self._league_backoff.pop(league, None)
+                # Scores come from the events list, so poll it as often as the fastest game needs
+                self._league_due[league] = now + min(self.game_interval(game) for game in games)
+            else:
+                backoff = min(MAX_BACKOFF, self._league_backoff.get(league, self.base_interval) * 2)
+                self._league_backoff[league] = backoff
+                self._league_due[league] = now + backoff
+
+    def next_due(self) -> Optional[float]:
+        """Earliest time any league is due, None before the first poll"""
+        with self._lock:
+            return min(self._league_due.values()) if self._league_due else None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        requests = stats["league_polls"] + stats["summary_polls"]
+        stats["requests"] = requests
+        stats["saved_vs_fixed"] = max(0.0, stats["fixed_equivalent"] - requests)
+        return stats
@@ -0,0 +1,137 @@
+"""
+Record/replay transport for offline runs and reproducible benchmarks.
+
+In record mode every ESPN / MLB Stats response that reaches the network is
+also written to a fixture directory keyed by URL. In replay mode the network
+is never touched: responses are served from that directory, optionally after
+an injected delay, and URLs without a fixture get a 404 so fetchers fall back
+exactly as they would on a failed request.
+
+Selected with environment variables when the shared client is created:
+    SCORES_HTTP_MODE=record|replay
+    SCORES_FIXTURE_DIR=<dir>           (default: <user cache dir>/fixtures)
+    SCORES_REPLAY_LATENCY_MS=<ms>      (replay only, default 0)
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+__all__ = ["FixtureStore", "RecordingTransport", "ReplayTransport", "transport_from_env"]
+
+
+class FixtureStore:
+    """Directory of captured responses, one JSON file per URL"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, url: str) -> str:
+        # Readable prefix from the last path segment, hash for uniqueness
+        segment = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1] or "root"
+        prefix = re.sub(r"[^A-Za-z0-9_-]", "_", segment)[:40]
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{prefix}_{digest}.json")
+
+    def save(self, url: str, status_code: int, headers: Dict[str, str], body: bytes):
+        record = {
+            "url": url,
+            "status_code": status_code,
+            "headers": {"Content-Type": headers.get("Content-Type", "application/json")},
+            "body": body.decode("utf-8", errors="replace"),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, self.path_for(url))
+
+    def save_json(self, url: str, data) -> str:
+        """Store an already decoded payload (e.g. an existing capture) as the fixture for url"""
+        self.save(url, 200, {}, json.dumps(data).encode("utf-8"))
+        return self.path_for(url)
+
+    def load(self, url: str) -> Optional[Dict]:
+        try:
+            with open(self.path_for(url), "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return record if record.get("url") == url else None
+
+
+def _build_response(url: str, status_code: int, headers: Dict[str, str], body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.reason = "OK" if status_code == 200 else "Not Found"
+    resp.url = url
+    resp.headers = CaseInsensitiveDict(headers)
+    resp._content = body
+    return resp
+
+
+class RecordingTransport:
+    """Pass requests to the network and save every response to the store"""
+
+    def __init__(self, store: FixtureStore, send: Callable[..., requests.Response]):
+        self.store = store
+        self.send = send
+
+    def __call__(self, url: str, timeout=None, **kwargs) -> requests.Response:
+        resp = self.send(url, timeout=timeout, **kwargs)
+        try:
+            self.store.save(url, resp.status_code, resp.headers, resp.content)
+        except OSError as e:
+            print(f"Failed to record fixture for {url}: {e}", file=sys.stderr)
+        return resp
+
+
+class ReplayTransport:
+    """Serve responses from the store without touching the network"""
+
+    def __init__(self, store: FixtureStore, latency: float = 0.0):
+        self.store = store
+        self.latency = latency
+        self._lock = threading.Lock()
+        self.missing = set()
+
+    def __call__(self, url: str, timeout=None, **kwargs) -> requests.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        record = self.store.load(url)
+        if record is None:
+            with self._lock:
+                if url not in self.missing:
+                    self.missing.add(url)
+                    print(f"No replay fixture for {url}", file=sys.stderr)
+            return _build_response(url, 404, {}, b"")
+        return _build_response(url, record.get("status_code", 200), record.get("headers", {}),
+                               record["body"].encode("utf-8"))
+
+
+def transport_from_env(send: Callable[..., requests.Response]) -> Optional[Callable[..., requests.Response]]:
+    """Build the record/replay transport selected by SCORES_HTTP_MODE, or None for live traffic"""
+    mode = os.environ.get("SCORES_HTTP_MODE", "").lower()
+    if mode not in ("record", "replay"):
+        return None
+
+    directory = os.environ.get("SCORES_FIXTURE_DIR")
+    if not directory:
+        from services.paths import user_cache_dir
+        directory = user_cache_dir("fixtures")
+    store = FixtureStore(directory)
+
+    if mode == "record":
+        return RecordingTransport(store, send)
+    latency_ms = float(os.environ.get("SCORES_REPLAY_LATENCY_MS", "0") or 0)
+    return ReplayTransport(store, latency_ms / 1000.0)
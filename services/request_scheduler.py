@@ -0,0 +1,258 @@
+"""
+Process-wide request scheduler.
+
+Every network request made by the shared transport passes through one
+RequestScheduler: a token bucket per host keeps bursts (e.g. the 39
+category MLB leaders fan-out) under the rate that triggers throttling, and a
+global in-flight cap bounds how many requests are on the wire at once no
+matter how many thread pools are submitting work.
+
+Waiting requests are admitted in priority order: INTERACTIVE (the view the
+user just opened) before PREFETCH (adjacent days, likely next game) before
+BACKGROUND (statistics warmups). BACKGROUND requests are also held back
+while interactive requests are in flight and for a short quiet period after
+the user navigates. The priority of a request comes from the calling
+thread, set with request_priority() or at_priority(). Neither wait outlasts
+the calling thread's deadline: a request that would has DeadlineExceeded
+raised instead.
+"""
+
+import functools
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from services.deadline import DeadlineExceeded, remaining
+
+__all__ = ["TokenBucket", "RequestScheduler", "Priority", "request_priority", "at_priority",
+           "current_priority", "get_scheduler", "note_navigation", "HOST_RATES"]
+
+# (requests per second, burst size) per host
+HOST_RATES: Dict[str, Tuple[float, int]] = {
+    "site.api.espn.com": (20.0, 40),
+    "sports.core.api.espn.com": (10.0, 20),
+    "statsapi.mlb.com": (10.0, 20),
+}
+DEFAULT_RATE = (10.0, 20)
+
+# Matches the per-host pool size in http_client so a slot always has a connection
+DEFAULT_MAX_IN_FLIGHT = 16
+
+# Seconds BACKGROUND work stays paused after the user navigates
+NAVIGATION_QUIET_PERIOD = 1.0
+
+
+class Priority(IntEnum):
+    """Request classes; lower values are admitted first"""
+    INTERACTIVE = 0
+    PREFETCH = 1
+    BACKGROUND = 2
+
+
+_local = threading.local()
+
+
+def current_priority() -> Priority:
+    """Priority of requests made from the calling thread (INTERACTIVE by default)"""
+    return getattr(_local, "priority", Priority.INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: Priority):
+    """Tag every request made by this thread inside the block with priority"""
+    previous = current_priority()
+    _local.priority = Priority(priority)
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+def at_priority(priority: Priority, func: Callable) -> Callable:
+    """Wrap func so it runs at priority; for work submitted to thread pools"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with request_priority(priority):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class TokenBucket:
+    """Thread-safe token bucket; reserve() returns how long the caller must wait"""
+
+    def __init__(self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Taking a token may drive the balance negative; the deficit is the wait
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self):
+        """Give back a reserved token the caller won't use"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+
+class RequestScheduler:
+    """Per-host rate limiting plus a shared, priority-ordered in-flight budget"""
+
+    def __init__(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 host_rates: Optional[Dict[str, Tuple[float, int]]] = None,
+                 quiet_period: float = NAVIGATION_QUIET_PERIOD, clock: Callable[[], float] = time.monotonic):
+        self.max_in_flight = max_in_flight
+        self.host_rates = dict(HOST_RATES if host_rates is None else host_rates)
+        self.quiet_period = quiet_period
+        self.clock = clock  # Drives the token buckets
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._interactive_in_flight = 0
+        self._waiting = []  # heap of (priority, sequence)
+        self._sequence = itertools.count()
+        self._quiet_until = 0.0
+        self._stats = {"requests": 0, "peak_in_flight": 0, "rate_limited": 0,
+                       "rate_wait_seconds": 0.0, "queued": 0, "queue_wait_seconds": 0.0,
+                       "background_paused": 0}
+        self._priority_stats = {p.name.lower(): {"requests": 0, "queued": 0, "queue_wait_seconds": 0.0}
+                                for p in Priority}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._cond:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, capacity = self.host_rates.get(host, DEFAULT_RATE)
+                bucket = TokenBucket(rate, capacity, self.clock)
+                self._buckets[host] = bucket
+            return bucket
+
+    def note_navigation(self):
+        """The user just changed views: hold BACKGROUND work for the quiet period"""
+        with self._cond:
+            self._quiet_until = time.monotonic() + self.quiet_period
+            self._cond.notify_all()
+
+    def _background_pause(self, now: float) -> Optional[float]:
+        # None when background work may run, otherwise how long to wait before rechecking
+        if self._interactive_in_flight:
+            return self.quiet_period
+        if now < self._quiet_until:
+            return self._quiet_until - now
+        return None
+
+    def _acquire(self, priority: Priority):
+        with self._cond:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+            start = time.monotonic()
+            queued = paused = False
+            while True:
+                timeout = None
+                if self._waiting[0] == ticket and self._in_flight < self.max_in_flight:
+                    if priority != Priority.BACKGROUND:
+                        break
+                    timeout = self._background_pause(time.monotonic())
+                    if timeout is None:
+                        break
+                    paused = True
+                left = remaining()
+                if left is not None:
+                    if left <= 0:
+                        # Leave the queue so the requests behind this one move up
+                        self._waiting.remove(ticket)
+                        heapq.heapify(self._waiting)
+                        self._cond.notify_all()
+                        raise DeadlineExceeded("Request deadline exceeded while queued")
+                    timeout = left if timeout is None else min(timeout, left)
+                queued = True
+                self._cond.wait(timeout)
+            heapq.heappop(self._waiting)
+
+            counters = self._priority_stats[priority.name.lower()]
+            if queued:
+                waited = time.monotonic() - start
+                self._stats["queued"] += 1
+                self._stats["queue_wait_seconds"] += waited
+                counters["queued"] += 1
+                counters["queue_wait_seconds"] += waited
+            if paused:
+                self._stats["background_paused"] += 1
+            counters["requests"] += 1
+            self._in_flight += 1
+            if priority == Priority.INTERACTIVE:
+                self._interactive_in_flight += 1
+            self._stats["requests"] += 1
+            self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self._in_flight)
+            # The next waiter in line may be admissible too
+            self._cond.notify_all()
+
+    def _release(self, priority: Priority):
+        with self._cond:
+            self._in_flight -= 1
+            if priority == Priority.INTERACTIVE:
+                self._interactive_in_flight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, url: str, priority: Optional[Priority] = None):
+        """Wait for the host's rate limit and a free in-flight slot, then hold the slot"""
+        priority = current_priority() if priority is None else Priority(priority)
+        bucket = self._bucket(urlsplit(url).hostname or "")
+        wait = bucket.reserve()
+        left = remaining()
+        if left is not None and wait >= left:
+            bucket.refund()
+            raise DeadlineExceeded("Request deadline exceeded waiting for the host rate limit")
+        if wait > 0:
+            with self._cond:
+                self._stats["rate_limited"] += 1
+                self._stats["rate_wait_seconds"] += wait
+            # Sleep before taking a slot so throttled requests don't block other hosts
+            time.sleep(wait)
+
+        self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return dict(self._stats, in_flight=self._in_flight, max_in_flight=self.max_in_flight,
+                        waiting=len(self._waiting),
+                        priorities={name: dict(c) for name, c in self._priority_stats.items()})
+
+
+_scheduler: Optional[RequestScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RequestScheduler:
+    """The scheduler shared by every fetcher in the process"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RequestScheduler()
+    return _scheduler
+
+
+def note_navigation():
+    """Tell the shared scheduler the user just navigated"""
+    get_scheduler().note_navigation()
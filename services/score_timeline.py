@@ -0,0 +1,152 @@
+"""
+Running score of a game, precomputed from its play-by-play.
+
+Every ESPN play carries awayScore/homeScore as they stand after it. A
+ScoreTimeline keeps them as two compact arrays in feed order, plus the span
+and closing score of every half inning (or period) and the plays that
+changed the score. The index is the play's position in the feed: MLB
+restarts sequenceNumber with every at-bat, so it can't be used as a key.
+MLB at-bat start plays already carry the score the at-bat ends with, so
+their scores are ignored and the timeline only moves on the scoring pitch.
+
+PlayLog extends the timeline as plays are ingested, so the plays tree, the
+HTML game log and live notifications read scores from it instead of
+re-deriving runs from play text.
+"""
+
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+__all__ = ["ScoreTimeline", "Segment", "ScoreChange", "segment_key"]
+
+# Play types whose scores look ahead to the end of the play they announce
+LOOKAHEAD_TYPES = {"start-batterpitcher"}
+
+
+def segment_key(play: Dict) -> str:
+    """Half inning / period a play belongs to, e.g. "3rd Inning_top" """
+    period = play.get("period", {}) or {}
+    return f"{period.get('displayValue', 'Unknown')}_{str(period.get('type', 'Unknown')).lower()}"
+
+
+def _type_name(play: Dict) -> str:
+    play_type = play.get("type")
+    return play_type.get("type", "") if isinstance(play_type, dict) else ""
+
+
+def _score(value, previous: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        # Plays without a score keep the one before them
+        return previous
+
+
+class Segment:
+    """Plays start..end (exclusive) of one half inning and the score after it"""
+
+    __slots__ = ("key", "start", "end", "away", "home", "away_runs", "home_runs")
+
+    def __init__(self, key: str, start: int, away: int, home: int):
+        self.key = key
+        self.start = start
+        self.end = start
+        self.away = away
+        self.home = home
+        self.away_runs = 0
+        self.home_runs = 0
+
+    @property
+    def total_runs(self) -> int:
+        return self.away + self.home
+
+    def __repr__(self):
+        return f"Segment({self.key!r}, {self.away}-{self.home})"
+
+
+class ScoreChange:
+    """A play that changed the score"""
+
+    __slots__ = ("index", "away", "home", "away_runs", "home_runs", "text")
+
+    def __init__(self, index: int, away: int, home: int, away_runs: int, home_runs: int, text: str):
+        self.index = index
+        self.away = away
+        self.home = home
+        self.away_runs = away_runs
+        self.home_runs = home_runs
+        self.text = text
+
+    @property
+    def runs(self) -> int:
+        return self.away_runs + self.home_runs
+
+    def __repr__(self):
+        return f"ScoreChange({self.index}, {self.away}-{self.home})"
+
+
+class ScoreTimeline:
+    """Away/home score after every play, per-segment boundaries and scoring plays"""
+
+    def __init__(self):
+        self.away = array("i")
+        self.home = array("i")
+        self.segments: "OrderedDict[str, Segment]" = OrderedDict()
+        self.changes: List[ScoreChange] = []
+
+    @classmethod
+    def from_plays(cls, plays: Iterable[Dict]) -> "ScoreTimeline":
+        timeline = cls()
+        timeline.extend(plays)
+        return timeline
+
+    def __len__(self) -> int:
+        return len(self.away)
+
+    def extend(self, plays: Iterable[Dict]):
+        """Append plays that follow the ones already recorded"""
+        away, home = self.final()
+        segment = next(reversed(self.segments.values())) if self.segments else None
+        for play in plays:
+            index = len(self.away)
+            if _type_name(play) in LOOKAHEAD_TYPES:
+                new_away, new_home = away, home
+            else:
+                new_away = _score(play.get("awayScore"), away)
+                new_home = _score(play.get("homeScore"), home)
+            self.away.append(new_away)
+            self.home.append(new_home)
+
+            key = segment_key(play)
+            if segment is None or segment.key != key:
+                segment = self.segments.get(key)
+                if segment is None:
+                    segment = self.segments[key] = Segment(key, index, away, home)
+            if (new_away, new_home) != (away, home):
+                self.changes.append(ScoreChange(index, new_away, new_home, new_away - away, new_home - home,
+                                                play.get("text", "")))
+                segment.away_runs += new_away - away
+                segment.home_runs += new_home - home
+            elif play.get("scoringPlay") and self.changes and self.changes[-1].index >= segment.start:
+                # The scoring pitch says "Ball In Play"; the result play that follows describes it
+                self.changes[-1].text = play.get("text", "") or self.changes[-1].text
+            segment.end = index + 1
+            segment.away, segment.home = new_away, new_home
+            away, home = new_away, new_home
+
+    def score_at(self, index: int) -> Tuple[int, int]:
+        """(away, home) after the play at index"""
+        return self.away[index], self.home[index]
+
+    def final(self) -> Tuple[int, int]:
+        """(away, home) after the latest play"""
+        if not self.away:
+            return 0, 0
+        return self.away[-1], self.home[-1]
+
+    def segment(self, key: str) -> Optional[Segment]:
+        return self.segments.get(key)
+
+    def last_change(self) -> Optional[ScoreChange]:
+        return self.changes[-1] if self.changes else None
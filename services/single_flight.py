@@ -0,0 +1,116 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one in-flight call and its
+result instead of each issuing their own request. Nothing is cached once the
+call finishes; the next caller starts a new flight.
+"""
+
+import copy
+import functools
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from services.deadline import DeadlineExceeded, remaining
+
+__all__ = ["SingleFlight", "coalesce", "normalize_url", "stats"]
+
+
+def normalize_url(url: str, params: Optional[Dict] = None) -> str:
+    """Merge params into the URL and sort the query so equivalent requests share a key"""
+    full_url = requests.Request("GET", url, params=params).prepare().url
+    parts = urlsplit(full_url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, query, ""))
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.joiners = 0
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key.
+
+    With copy_result set, a result that was shared is copied for every
+    caller, so one caller modifying it can't affect another.
+    """
+
+    def __init__(self, copy_result: Optional[Callable[[Any], Any]] = None):
+        self.copy_result = copy_result
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = {"calls": 0, "executed": 0, "deduplicated": 0}
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["executed"] += 1
+            else:
+                call.joiners += 1
+                self._stats["deduplicated"] += 1
+
+        if not leader:
+            # Joiners still honour their own deadline
+            if not call.done.wait(remaining()):
+                raise DeadlineExceeded("Deadline exceeded waiting for in-flight request")
+            if call.error is not None:
+                raise call.error
+            return call.result if self.copy_result is None else self.copy_result(call.result)
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                # No one can join once the key is gone
+                shared = call.joiners > 0
+            call.done.set()
+        # The leader gets a copy too, keeping call.result untouched while joiners copy it
+        if shared and self.copy_result is not None:
+            return self.copy_result(call.result)
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+# Shared by the espn_api fetchers; the transport keeps its own group for raw GETs.
+# Callers update the returned game dicts in place, so shared results are deep-copied.
+_function_flights = SingleFlight(copy_result=copy.deepcopy)
+
+
+def coalesce(func: Callable) -> Callable:
+    """Decorator: concurrent calls with the same arguments share one execution.
+
+    When a call was shared, each caller gets its own deep copy of the result.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+        return _function_flights.do(key, func, *args, **kwargs)
+    return wrapper
+
+
+def stats() -> Dict[str, int]:
+    """Counters for the decorated espn_api functions"""
+    return _function_flights.stats()